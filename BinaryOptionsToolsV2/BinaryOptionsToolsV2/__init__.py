@@ -1,10 +1,27 @@
 from .BinaryOptionsToolsV2 import *  # noqa: F403
 
-# optional: include the documentation from the Rust module
-from .BinaryOptionsToolsV2 import __doc__  # noqa: F401
+import importlib
 
-from .pocketoption import __all__ as __pocket_all__
-from . import tracing
-from . import validator
+# The python submodules are loaded lazily (PEP 562), importing the package
+# only loads the native extension and the name table of `pocketoption`
+# (its `__init__` imports none of the clients).
+from .pocketoption import __all__ as _POCKET_ATTRS
 
-__all__ = __pocket_all__ + ["tracing", "validator"]
+_LAZY_SUBMODULES = ("pocketoption", "tracing", "validator", "config")
+
+__all__ = (*_POCKET_ATTRS, "tracing", "validator")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _POCKET_ATTRS:
+        value = getattr(importlib.import_module(".pocketoption", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
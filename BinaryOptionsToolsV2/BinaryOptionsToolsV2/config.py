@@ -1,8 +1,32 @@
 # from BinaryOptionsToolsV2 import PyConfig
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
+from dataclasses import dataclass, field
 
-import json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> str:
+        # Compact like orjson, so the output doesn't depend on which one is installed
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
+
+_PYCONFIG_REPR = (
+    "PyConfig(max_allowed_loops=%s, "
+    "sleep_interval=%s, "
+    "reconnect_time=%s, "
+    "connection_initialization_timeout_secs=%s, "
+    "timeout_secs=%s, "
+    "urls=%s)"
+)
 
 
 class PyConfig:
@@ -19,25 +43,35 @@ class PyConfig:
         reconnect_time (int): Reconnection time in seconds
         connection_initialization_timeout_secs (int): Connection timeout in seconds
         timeout_secs (int): General timeout in seconds
-        urls (List[str]): List of WebSocket URLs
+        urls (Tuple[str, ...]): WebSocket URLs, stored as a tuple so it can be shared without copying
     """
 
+    __slots__ = (
+        "max_allowed_loops",
+        "sleep_interval",
+        "reconnect_time",
+        "connection_initialization_timeout_secs",
+        "timeout_secs",
+        "urls",
+    )
+    _FIELDS = frozenset(__slots__)
+
     def __init__(self):
         self.max_allowed_loops: int = 100
         self.sleep_interval: int = 100
         self.reconnect_time: int = 5
         self.connection_initialization_timeout_secs: int = 30
         self.timeout_secs: int = 30
-        self.urls: List[str] = []
+        self.urls: Tuple[str, ...] = ()
 
     def __repr__(self) -> str:
-        return (
-            f"PyConfig(max_allowed_loops={self.max_allowed_loops}, "
-            f"sleep_interval={self.sleep_interval}, "
-            f"reconnect_time={self.reconnect_time}, "
-            f"connection_initialization_timeout_secs={self.connection_initialization_timeout_secs}, "
-            f"timeout_secs={self.timeout_secs}, "
-            f"urls={self.urls})"
+        return _PYCONFIG_REPR % (
+            self.max_allowed_loops,
+            self.sleep_interval,
+            self.reconnect_time,
+            self.connection_initialization_timeout_secs,
+            self.timeout_secs,
+            self.urls,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -48,13 +82,33 @@ class PyConfig:
             "reconnect_time": self.reconnect_time,
             "connection_initialization_timeout_secs": self.connection_initialization_timeout_secs,
             "timeout_secs": self.timeout_secs,
-            "urls": self.urls.copy(),
+            "urls": self.urls,
         }
 
+    def load_from(self, config: "Config") -> None:
+        """Copy every field from a Config in a single frame"""
+        (
+            self.max_allowed_loops,
+            self.sleep_interval,
+            self.reconnect_time,
+            self.connection_initialization_timeout_secs,
+            self.timeout_secs,
+            self.urls,
+        ) = (
+            config.max_allowed_loops,
+            config.sleep_interval,
+            config.reconnect_time,
+            config.connection_initialization_timeout_secs,
+            config.timeout_secs,
+            tuple(config.urls),
+        )
+
     def update_from_dict(self, data: Dict[str, Any]) -> None:
         """Update PyConfig from dictionary"""
         for key, value in data.items():
-            if hasattr(self, key):
+            if key in self._FIELDS:
+                if key == "urls":
+                    value = tuple(value)
                 setattr(self, key, value)
 
 
@@ -72,25 +126,31 @@ class Config:
     reconnect_time: int = 5
     connection_initialization_timeout_secs: int = 30
     timeout_secs: int = 30
-    urls: List[str] = None
+    urls: List[str] = field(default_factory=list)
 
     # Extra duration, used by functions like `check_win`
     extra_duration: int = 5
 
+    # Class level default so `__setattr__` can read it while the dataclass
+    # `__init__` is still assigning fields (before `__post_init__` runs)
+    _locked = False
+
     def __post_init__(self):
         self.urls = self.urls or []
         self._pyconfig = None
         self._locked = False
+        self._cached_dict = None
+        self._cached_json = None
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Override setattr to check for locked state"""
-        # Allow setting private attributes and during initialization
-        if name.startswith("_") or not hasattr(self, "_locked") or not self._locked:
-            super().__setattr__(name, value)
-        else:
+        # The cached dict / json are only filled once locked and a locked
+        # config rejects public writes, so they never need invalidating here
+        if self._locked and not name.startswith("_"):
             raise RuntimeError(
                 "Configuration is locked and cannot be modified after being used"
             )
+        super().__setattr__(name, value)
 
     @property
     def pyconfig(self) -> PyConfig:
@@ -98,9 +158,9 @@ class Config:
         Returns the PyConfig instance for use in Rust code.
         Once this is accessed, the configuration becomes locked.
         """
-        if self._pyconfig is None:
-            self._pyconfig = PyConfig()
-            self._update_pyconfig()
+        if self._locked:
+            return self._pyconfig
+        self._update_pyconfig()
         self._locked = True
         return self._pyconfig
 
@@ -111,17 +171,11 @@ class Config:
                 "Configuration is locked and cannot be modified after being used"
             )
 
-        if self._pyconfig is None:
-            self._pyconfig = PyConfig()
+        pyconfig = self._pyconfig
+        if pyconfig is None:
+            pyconfig = self._pyconfig = PyConfig()
 
-        self._pyconfig.max_allowed_loops = self.max_allowed_loops
-        self._pyconfig.sleep_interval = self.sleep_interval
-        self._pyconfig.reconnect_time = self.reconnect_time
-        self._pyconfig.connection_initialization_timeout_secs = (
-            self.connection_initialization_timeout_secs
-        )
-        self._pyconfig.timeout_secs = self.timeout_secs
-        self._pyconfig.urls = self.urls.copy()
+        pyconfig.load_from(self)
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> "Config":
@@ -134,9 +188,7 @@ class Config:
         Returns:
             Config instance
         """
-        return cls(
-            **{k: v for k, v in config_dict.items() if k in Config.__dataclass_fields__}
-        )
+        return cls(**{k: config_dict[k] for k in config_dict.keys() & _CONFIG_FIELDS})
 
     @classmethod
     def from_json(cls, json_str: str) -> "Config":
@@ -149,7 +201,7 @@ class Config:
         Returns:
             Config instance
         """
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -157,8 +209,14 @@ class Config:
 
         Returns:
             Dictionary containing all configuration values
+
+        Note:
+            Once the configuration is locked the dictionary is built only once,
+            later calls return a shallow copy of the cached result.
         """
-        return {
+        if self._cached_dict is not None:
+            return self._cached_dict.copy()
+        data = {
             "max_allowed_loops": self.max_allowed_loops,
             "sleep_interval": self.sleep_interval,
             "reconnect_time": self.reconnect_time,
@@ -166,6 +224,10 @@ class Config:
             "timeout_secs": self.timeout_secs,
             "urls": self.urls,
         }
+        if self._locked:
+            self._cached_dict = data
+            return data.copy()
+        return data
 
     def to_json(self) -> str:
         """
@@ -173,8 +235,16 @@ class Config:
 
         Returns:
             JSON string containing all configuration values
+
+        Note:
+            Once the configuration is locked the JSON string is cached.
         """
-        return json.dumps(self.to_dict())
+        if self._cached_json is not None:
+            return self._cached_json
+        data = _dumps(self.to_dict())
+        if self._locked:
+            self._cached_json = data
+        return data
 
     def update(self, config_dict: Dict[str, Any]) -> None:
         """
@@ -188,6 +258,11 @@ class Config:
                 "Configuration is locked and cannot be modified after being used"
             )
 
+        self._cached_dict = None
+        self._cached_json = None
         for key, value in config_dict.items():
-            if hasattr(self, key):
+            if key in _CONFIG_FIELDS:
                 setattr(self, key, value)
+
+
+_CONFIG_FIELDS = frozenset(Config.__dataclass_fields__)
@@ -3,17 +3,47 @@ Module for Pocket Option related functionality.
 
 Contains asynchronous and synchronous clients,
 as well as specific classes for Pocket Option trading.
+
+Submodules are imported lazily on first attribute access, so users of the
+synchronous client don't pay for the async stack until they need it and
+vice versa.
 """
 
-__all__ = [
+import importlib
+
+__all__ = (
     "asyncronous",
     "syncronous",
     "PocketOptionAsync",
     "PocketOption",
     "RawHandler",
     "RawHandlerSync",
-]
+    "get_shared_api",
+    "close_shared_apis",
+)
+
+# Maps every lazily exported name to the submodule that defines it
+_LAZY_ATTRS = {
+    "PocketOptionAsync": "asyncronous",
+    "RawHandler": "asyncronous",
+    "get_shared_api": "asyncronous",
+    "close_shared_apis": "asyncronous",
+    "PocketOption": "syncronous",
+    "RawHandlerSync": "syncronous",
+}
+
+
+def __getattr__(name: str):
+    if name in ("asyncronous", "syncronous"):
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-from . import asyncronous, syncronous
-from .asyncronous import PocketOptionAsync, RawHandler
-from .syncronous import PocketOption, RawHandlerSync
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,20 +5,70 @@ from datetime import timedelta
 
 
 import asyncio
-import json
+import atexit
 import sys
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Layout of the candles returned by `PocketOptionAsync.get_candles_array`
+CANDLE_DTYPE = (
+    np.dtype(
+        [
+            ("time", "i8"),
+            ("open", "f8"),
+            ("high", "f8"),
+            ("low", "f8"),
+            ("close", "f8"),
+            ("count", "i4"),
+        ]
+    )
+    if np is not None
+    else None
+)
+
 
 class AsyncSubscription:
     def __init__(self, subscription):
         """Asyncronous Iterator over json objects"""
-        self.subscription = subscription
+        # The Rust iterator builds every item as a dict itself, so iterating doesn't
+        # go through JSON or an extra python coroutine per message
+        self.subscription = subscription.as_dicts()
 
     def __aiter__(self):
-        return self
+        return self.subscription.__aiter__()
 
-    async def __anext__(self):
-        return json.loads(await anext(self.subscription))
+    def __anext__(self):
+        return self.subscription.__anext__()
+
+    def recv_batch(self, max_n: int = 64, max_wait: timedelta | None = None):
+        """
+        Waits for the next candle, then keeps taking candles (up to `max_n` in total) while new
+        ones arrive within `max_wait`, candles already buffered are always taken.
+        High frequency streams cross from Rust into python once per batch instead of once per candle.
+
+        Returns:
+            Awaitable[list[dict]]: The candles, oldest first
+        """
+        max_wait_ms = 0 if max_wait is None else int(max_wait.total_seconds() * 1000)
+        return self.subscription.anext_batch(max_n, max_wait_ms)
 
 
 class RawHandler:
@@ -52,12 +102,30 @@ class RawHandler:
         """
         await self._handler.send_text(message)
 
-    async def send_binary(self, data: bytes) -> None:
+    async def send_text_batched(self, messages: list[str]) -> None:
+        """
+        Send several text messages through this handler at once.
+
+        The messages are queued back to back and flushed to the websocket together,
+        which is cheaper than awaiting `send_text` for each of them.
+
+        Args:
+            messages: Text messages to send, in order
+
+        Example:
+            ```python
+            await handler.send_text_batched(['42["ping"]', '42["ping"]'])
+            ```
+        """
+        await self._handler.send_text_batched(messages)
+
+    async def send_binary(self, data: bytes | bytearray | memoryview) -> None:
         """
         Send a binary message through this handler.
         
         Args:
-            data: Binary data to send
+            data: Binary data to send, `bytes` and `bytearray` are copied once straight
+                from their storage (other buffers such as `memoryview` are converted with `bytes()` first)
             
         Example:
             ```python
@@ -84,6 +152,38 @@ class RawHandler:
         """
         return await self._handler.send_and_wait(message)
 
+    async def send_and_wait_many(
+        self, requests: list[tuple[str, Validator]]
+    ) -> list[str]:
+        """
+        Send several messages at once and wait for a response to each of them.
+
+        The messages are flushed to the websocket together, so the round trips overlap
+        instead of running one after the other. Every incoming message that matches this
+        handler's validator goes to the first unanswered request whose validator accepts it,
+        the handler's own validator must therefore accept every expected response.
+
+        Args:
+            requests: `(message, validator)` pairs, the validator selects the message's response
+
+        Returns:
+            list[str]: Response of every message, in the order of `requests`
+
+        Example:
+            ```python
+            handler = await client.create_raw_handler(
+                Validator.any([Validator.contains('"balance"'), Validator.contains('"payout"')])
+            )
+            balance, assets = await handler.send_and_wait_many([
+                ('42["getBalance"]', Validator.contains('"balance"')),
+                ('42["getAssets"]', Validator.contains('"payout"')),
+            ])
+            ```
+        """
+        return await self._handler.send_and_wait_many(
+            [(message, validator.raw_validator) for message, validator in requests]
+        )
+
     async def wait_next(self) -> str:
         """
         Wait for the next message that matches this handler's validator.
@@ -99,6 +199,53 @@ class RawHandler:
         """
         return await self._handler.wait_next()
 
+    async def wait_for_key(self, key: str) -> bytes | None:
+        """
+        Wait for the next matching message that carries the field `key`.
+
+        The field is looked up in the payload of socket.io events (`42["event", {...}]`)
+        and in bare JSON objects. Messages without it are parsed and skipped on the
+        Rust side, so only the extracted value is handed back to Python.
+
+        Args:
+            key: Name of the field to extract
+
+        Returns:
+            bytes | None: The JSON encoded value of the field, or None if the
+            handler stream closed first
+
+        Example:
+            ```python
+            history = await handler.wait_for_key("history")
+            ticks = json.loads(history)
+            ```
+        """
+        return await self._handler.wait_for_key(key)
+
+    async def wait_for_assets(
+        self, key: str, assets: list[str], timeout: int
+    ) -> bytes:
+        """
+        Wait for one matching message carrying the field `key` for each asset.
+
+        Messages are matched to an asset through their `asset` field, the whole
+        collection runs on the Rust side until every asset answered or `timeout` expired.
+
+        Args:
+            key: Name of the field to extract
+            assets: Assets to wait for
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            bytes: JSON encoded object mapping every asset that answered in time to its field
+
+        Example:
+            ```python
+            histories = json.loads(await handler.wait_for_assets("history", ["EURUSD_otc"], 10))
+            ```
+        """
+        return await self._handler.wait_for_assets(key, assets, timeout)
+
     async def subscribe(self):
         """
         Subscribe to messages matching this handler's validator.
@@ -128,14 +275,17 @@ class RawHandler:
     async def close(self) -> None:
         """
         Close this handler and clean up resources.
-        Note: The handler is automatically cleaned up when it goes out of scope.
+        The handler stops receiving messages right away, otherwise it is only removed
+        once it goes out of scope.
         """
-        # The Rust Drop implementation handles cleanup automatically
-        pass
+        await self._handler.close()
 
 
 # This file contains all the async code for the PocketOption Module
 class PocketOptionAsync:
+    # Validator of the per-call history handlers, created on first use
+    _HISTORY_VALIDATOR: Validator | None = None
+
     def __init__(
         self, ssid: str, url: str | None = None, config: Config | dict | str = None, **_
     ):
@@ -179,31 +329,53 @@ class PocketOptionAsync:
             - The configuration becomes locked once initialized and cannot be modified afterwards
             - Custom URLs provided in the `url` parameter take precedence over URLs in the configuration
             - Invalid configuration values will raise appropriate exceptions
+            - The WebSocket connection is opened with `TCP_NODELAY` set (Nagle disabled)
         """
-        if config is not None:
-            if isinstance(config, dict):
-                self.config = Config.from_dict(config)
-            elif isinstance(config, str):
-                self.config = Config.from_json(config)
-            elif isinstance(config, Config):
-                self.config = config
-            else:
-                raise ValueError(
-                    "Config must be either a Config object, dictionary, or JSON string"
-                )
-
-            if url is not None:
-                self.client = RawPocketOption.new_with_url(ssid, url)
-            else:
-                self.client = RawPocketOption(ssid, config)
-        else:
+        if config is None:
             self.config = Config()
-            if url is not None:
-                self.client = RawPocketOption.new_with_url(ssid, url)
-            else:
-                self.client = RawPocketOption(ssid)
+        elif isinstance(config, dict):
+            self.config = Config.from_dict(config)
+        elif isinstance(config, str):
+            self.config = Config.from_json(config)
+        elif isinstance(config, Config):
+            self.config = config
+        else:
+            raise ValueError(
+                "Config must be either a Config object, dictionary, or JSON string"
+            )
+
+        # The Rust client only takes the ssid (and url), the config is kept on the
+        # python side and never serialized for it
+        if url is not None:
+            self.client = RawPocketOption.new_with_url(ssid, url)
+        else:
+            self.client = RawPocketOption(ssid)
         self.logger = Logger()
 
+    @staticmethod
+    def use_uvloop() -> bool:
+        """
+        Makes asyncio create uvloop event loops, if uvloop is installed.
+
+        Must be called before the event loop is created (before `asyncio.run`, or
+        before creating a `PocketOption` instance for the sync client).
+
+        Returns:
+            bool: True if uvloop is now the event loop implementation, False if it isn't installed
+
+        Example:
+            ```python
+            PocketOptionAsync.use_uvloop()
+            asyncio.run(main())
+            ```
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
     async def buy(
         self, asset: str, amount: float, time: int, check_win: bool = False
     ) -> tuple[str, dict]:
@@ -235,7 +407,7 @@ class PocketOptionAsync:
         if check_win:
             return trade_id, await self.check_win(trade_id)
         else:
-            trade = json.loads(trade)
+            trade = _loads(trade)
             return trade_id, trade
 
     async def sell(
@@ -269,7 +441,7 @@ class PocketOptionAsync:
         if check_win:
             return trade_id, await self.check_win(trade_id)
         else:
-            trade = json.loads(trade)
+            trade = _loads(trade)
             return trade_id, trade
 
     async def check_win(self, id: str) -> dict:
@@ -303,7 +475,7 @@ class PocketOptionAsync:
         # self.logger.debug(f"Timeout set to: {duration} (6 extra seconds)")
         async def check(id):
             trade = await self.client.check_win(id)
-            trade = json.loads(trade)
+            trade = _loads(trade)
             win = trade["profit"]
             if win > 0:
                 trade["result"] = "win"
@@ -315,6 +487,51 @@ class PocketOptionAsync:
 
         return await check(id)
 
+    async def check_win_result(self, id: str) -> str:
+        """
+        Checks only the outcome of a specific trade.
+
+        Faster than `check_win` when the trade details aren't needed, only the
+        profit is sent back from Rust and no JSON is parsed.
+
+        Args:
+            id (str): ID of the trade to check
+
+        Returns:
+            str: "win", "loss", or "draw"
+        """
+        profit = await self.client.check_win_profit(id)
+        if profit > 0:
+            return "win"
+        elif profit == 0:
+            return "draw"
+        return "loss"
+
+    async def wait_closed(self, id: str, timeout: float | None = None) -> None:
+        """
+        Waits until a trade is closed, returning as soon as the server reports its result.
+
+        Use it instead of sleeping for the trade's duration before reading `closed_deals`.
+
+        Args:
+            id (str): ID of the trade to wait for
+            timeout (float | None): Maximum number of seconds to wait, no limit by default
+
+        Raises:
+            TimeoutError: If the trade wasn't closed within `timeout` seconds
+
+        Example:
+            ```python
+            await asyncio.gather(api.wait_closed(buy_id), api.wait_closed(sell_id))
+            ```
+        """
+        # Only the profit crosses from Rust, the deal itself isn't serialized
+        waiter = self.client.check_win_profit(id)
+        if timeout is None:
+            await waiter
+        else:
+            await _timeout(waiter, timeout)
+
     async def get_candles(self, asset: str, period: int, offset: int = 0) -> list[dict]:
         """
         Retrieves historical candle data for an asset using raw 'changeSymbol' command.
@@ -333,87 +550,129 @@ class PocketOptionAsync:
                 - low: Lowest price
                 - close: Closing price
         """
-        # Create a raw handler to intercept the history response
-        # unique_str = f"raw_history_{int(asyncio.get_event_loop().time())}"
-        validator = Validator.contains("history")
-        handler = await self.create_raw_handler(validator)
-        
         try:
-            # Send changeSymbol command - this reliably triggers a history push from the server
-            command = f'42["changeSymbol",{{"asset":"{asset}","period":{period}}}]'
-            await handler.send_text(command)
-            
-            history_data = []
-            
-            # Wait for response with timeout
-            async def _wait_for_history():
-                stream = await handler.subscribe()
-                async for message in stream:
-                    # Clean message
-                    raw = message[2:] if message.startswith('42') else message
-                    try:
-                        data = json.loads(raw)
-                        # Check format 1: List [event, payload]
-                        if isinstance(data, list) and len(data) > 1:
-                            payload = data[1]
-                            if isinstance(payload, dict) and "history" in payload:
-                                return payload["history"]
-                        # Check format 2: Direct Dict {..., "history": ...}
-                        elif isinstance(data, dict) and "history" in data:
-                            return data["history"]
-                    except:
-                        pass
-                return None
-
-            try:
-                # Wait up to 10 seconds for history
-                history_data = await _timeout(_wait_for_history(), 10)
-            except asyncio.TimeoutError:
-                self.logger.warning("Timeout waiting for history data in get_candles")
-                return []
-            
+            history_data = await self._fetch_history(asset, period, "get_candles")
             if not history_data:
                 return []
-                
+
             # Process ticks into candles if necessary
             # The API 'changeSymbol' usually returns ticks [[ts, price], ...]
             # We need to aggregate them into candles of 'period' seconds
-            
-            # 1. Sort by timestamp
-            history_data.sort(key=lambda x: x[0])
-            
-            candles = {}
-            
-            for tick in history_data:
-                ts, price = tick[0], tick[1]
-                # Bucket timestamp by period
-                candle_ts = int(ts // period) * period
-                
-                if candle_ts not in candles:
-                    candles[candle_ts] = {
-                        "time": candle_ts,
-                        "open": price,
-                        "high": price,
-                        "low": price,
-                        "close": price,
-                        "count": 1
-                    }
-                else:
-                    c = candles[candle_ts]
-                    c["high"] = max(c["high"], price)
-                    c["low"] = min(c["low"], price)
-                    c["close"] = price
-                    c["count"] += 1
-            
-            # Convert to list and sort
-            sorted_candles = sorted(candles.values(), key=lambda x: x["time"])
-            
-            return sorted_candles
+            return _aggregate_ticks(history_data, period)
 
         except Exception as e:
             self.logger.error(f"Error in get_candles: {e}")
             return []
 
+    async def get_candles_array(self, asset: str, period: int) -> "np.ndarray":
+        """
+        Same as `get_candles`, but returns the candles as a NumPy structured array.
+
+        The array uses `CANDLE_DTYPE` (`time`, `open`, `high`, `low`, `close`, `count` fields),
+        stored as 44 bytes per candle instead of one dictionary per candle.
+        It can be handed to pandas (`pd.DataFrame(candles)`) or numba without conversion,
+        `candles.tolist()` gives `(time, open, high, low, close, count)` tuples.
+
+        Args:
+            asset (str): Trading asset (e.g., "EURUSD_otc")
+            period (int): Candle timeframe in seconds (e.g., 60 for 1-minute candles)
+
+        Returns:
+            np.ndarray: Candles sorted by time, empty if no history was received
+
+        Raises:
+            ImportError: If NumPy isn't installed
+        """
+        _require_numpy("get_candles_array")
+        try:
+            history_data = await self._fetch_history(asset, period, "get_candles_array")
+        except Exception as e:
+            self.logger.error(f"Error in get_candles_array: {e}")
+            history_data = None
+        if not history_data:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        return _aggregate_ticks_array(history_data, period)
+
+    async def _fetch_history(self, asset: str, period: int, caller: str) -> list:
+        """Sends `changeSymbol` and returns the raw `[timestamp, price]` ticks, empty on timeout"""
+        # Send changeSymbol command - this reliably triggers a history push from the server
+        # Serialized as JSON so assets containing quotes produce a valid frame
+        command = "42" + _dumps(["changeSymbol", {"asset": asset, "period": period}])
+        histories = await self._request_histories([command], [asset])
+        if asset not in histories:
+            self.logger.warn(f"Timeout waiting for history data in {caller}")
+            return []
+        return histories[asset] or []
+
+    async def get_candles_many(
+        self, requests: list[tuple[str, int]]
+    ) -> dict[str, list[dict]]:
+        """
+        Retrieves candle data for several assets with a single batch of 'changeSymbol' commands.
+
+        Args:
+            requests (list[tuple[str, int]]): `(asset, period)` pairs to fetch, one per asset
+
+        Returns:
+            dict[str, list[dict]]: Candles for each requested asset, in the same format
+            as `get_candles`. Assets whose history didn't arrive within 10 seconds map to an empty list.
+
+        Raises:
+            ValueError: If an asset is requested more than once, the server's history
+            frames only carry the asset, so two periods of one asset can't be told apart
+
+        Example:
+            ```python
+            candles = await client.get_candles_many([("EURUSD_otc", 60), ("GBPUSD_otc", 60)])
+            ```
+        """
+        pending = dict(requests)
+        if len(pending) != len(requests):
+            raise ValueError("get_candles_many: every asset can only be requested once")
+        results = {asset: [] for asset in pending}
+        if not pending:
+            return results
+
+        commands = [
+            "42" + _dumps(["changeSymbol", {"asset": asset, "period": period}])
+            for asset, period in pending.items()
+        ]
+        try:
+            histories = await self._request_histories(commands, list(pending))
+            missing = [asset for asset in pending if asset not in histories]
+            if missing:
+                self.logger.warn(
+                    f"Timeout waiting for history data in get_candles_many, missing: {missing}"
+                )
+
+            for asset, history in histories.items():
+                if history:
+                    results[asset] = _aggregate_ticks(history, pending[asset])
+        except Exception as e:
+            self.logger.error(f"Error in get_candles_many: {e}")
+        return results
+
+    async def _request_histories(self, commands: list[str], assets: list[str]) -> dict:
+        """
+        Sends the `changeSymbol` commands and returns the `history` field of each asset's answer.
+
+        The handler only lives for this call, so history frames the server pushes on its own
+        (every reconnect sends `changeSymbol` again) never pile up between calls. Frames are
+        matched to their asset on the Rust side, a frame for another asset is skipped.
+        """
+        validator = PocketOptionAsync._HISTORY_VALIDATOR
+        if validator is None:
+            validator = PocketOptionAsync._HISTORY_VALIDATOR = Validator.contains(
+                "history"
+            )
+        handler = await self.create_raw_handler(validator)
+        try:
+            await handler.send_text_batched(commands)
+            # Waits up to 10 seconds, only the extracted histories cross back into Python
+            return _loads(await handler.wait_for_assets("history", assets, 10))
+        finally:
+            await handler.close()
+
     async def get_candles_advanced(
         self, asset: str, period: int, offset: int, time: int
     ) -> list[dict]:
@@ -439,11 +698,32 @@ class PocketOptionAsync:
             Maximum period depends on the timeframe
         """
         candles = await self.client.get_candles_advanced(asset, period, offset, time)
-        return json.loads(candles)
+        return _loads(candles)
         # raise NotImplementedError(
         #     "The get_candles_advanced method is not implemented in the PocketOptionAsync class. "
         # )
 
+    async def get_candles_advanced_numpy(
+        self, asset: str, period: int, offset: int, time: int
+    ) -> dict[str, "np.ndarray"]:
+        """
+        Same as `get_candles_advanced`, but returns the candles as NumPy columns.
+
+        The columns are built on the Rust side and wrapped without copying, no
+        dictionary is created per candle. `pd.DataFrame(columns)` turns them into a DataFrame.
+
+        Returns:
+            dict[str, np.ndarray]: Read-only `float64` arrays for the keys
+            "timestamp", "open", "high", "low" and "close"
+
+        Raises:
+            ImportError: If NumPy isn't installed
+        """
+        _require_numpy("get_candles_advanced_numpy")
+        return _columns_to_numpy(
+            await self.client.get_candles_advanced_columns(asset, period, offset, time)
+        )
+
     async def balance(self) -> float:
         """
         Retrieves current account balance.
@@ -458,18 +738,27 @@ class PocketOptionAsync:
 
     async def opened_deals(self) -> list[dict]:
         "Returns a list of all the opened deals as dictionaries"
-        return json.loads(await self.client.opened_deals())
+        return _loads(await self.client.opened_deals())
         # raise NotImplementedError(
         #     "The opened_deals method is not implemented in the PocketOptionAsync class. "
         # )
 
     async def closed_deals(self) -> list[dict]:
         "Returns a list of all the closed deals as dictionaries"
-        return json.loads(await self.client.closed_deals())
+        return _loads(await self.client.closed_deals())
         # raise NotImplementedError(
         #     "The closed_deals method is not implemented in the PocketOptionAsync class. "
         # )
 
+    async def deals_snapshot(self) -> dict:
+        """
+        Returns the opened and closed deals together, as `{"open": ..., "closed": ...}`.
+
+        Both are read at the same time, so a deal that is closing shows up in exactly one of
+        them, unlike calling `opened_deals` and `closed_deals` one after the other.
+        """
+        return _loads(await self.client.deals_snapshot())
+
     async def clear_closed_deals(self) -> None:
         "Removes all the closed deals from memory, this function doesn't return anything"
         await self.client.clear_closed_deals()
@@ -490,21 +779,32 @@ class PocketOptionAsync:
             list: If asset is a list, returns a list of payouts for each asset in the same order
             int: If asset is a string, returns the payout for that specific asset
             none: If asset didn't match and valid asset none will be returned
+
+        Note:
+            A single asset is looked up on the Rust side without building the full payout map.
         """
-        payout = json.loads(await self.client.payout())
         if isinstance(asset, str):
-            return payout.get(asset)
-        elif isinstance(asset, list):
+            return await self.client.payout_for(asset)
+        payout = _loads(await self.client.payout())
+        if isinstance(asset, list):
             return [payout.get(ast) for ast in asset]
         return payout
 
     async def history(self, asset: str, period: int) -> list[dict]:
         "Returns a list of dictionaries containing the latest data available for the specified asset starting from 'period', the data is in the same format as the returned data of the 'get_candles' function."
-        return json.loads(await self.client.history(asset, period))
+        return await self.client.history(asset, period)
+
+    async def history_numpy(self, asset: str, period: int) -> dict[str, "np.ndarray"]:
+        "Same as `history` but returns NumPy columns, in the same format as `get_candles_advanced_numpy`."
+        _require_numpy("history_numpy")
+        return _columns_to_numpy(await self.client.history_columns(asset, period))
 
     async def _subscribe_symbol_inner(self, asset: str):
         return await self.client.subscribe_symbol(asset)
 
+    async def _subscribe_many_inner(self, assets: list[str]) -> dict:
+        return await self.client.subscribe_many(assets)
+
     async def _subscribe_symbol_chuncked_inner(self, asset: str, chunck_size: int):
         return await self.client.subscribe_symbol_chuncked(asset, chunck_size)
 
@@ -533,6 +833,35 @@ class PocketOptionAsync:
         """
         return AsyncSubscription(await self._subscribe_symbol_inner(asset))
 
+    async def subscribe_many(self, assets: list[str]) -> dict[str, AsyncSubscription]:
+        """
+        Creates real-time data subscriptions for several assets at once.
+
+        All the subscription requests are sent back to back and acknowledged together,
+        instead of one round trip per `subscribe_symbol` call.
+
+        Args:
+            assets (list[str]): Trading assets to subscribe to
+
+        Returns:
+            dict[str, AsyncSubscription]: Async iterator for every asset
+
+        Raises:
+            If any asset is invalid or any subscription fails no subscription is kept
+
+        Example:
+            ```python
+            subscriptions = await api.subscribe_many(["EURUSD_otc", "GBPUSD_otc"])
+            async for update in subscriptions["EURUSD_otc"]:
+                print(f"Price update: {update}")
+            ```
+        """
+        subscriptions = await self._subscribe_many_inner(assets)
+        return {
+            asset: AsyncSubscription(subscription)
+            for asset, subscription in subscriptions.items()
+        }
+
     async def subscribe_symbol_chuncked(
         self, asset: str, chunck_size: int
     ) -> AsyncSubscription:
@@ -589,6 +918,29 @@ class PocketOptionAsync:
             await self._subscribe_symbol_time_aligned_inner(asset, time)
         )
 
+    async def wait_connected(self, timeout: float = 10.0) -> None:
+        """
+        Waits until the client is connected and has received the assets list,
+        the point from which trades, payouts and subscriptions can be used.
+
+        Use it instead of sleeping a fixed amount of time after creating the client.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait
+
+        Raises:
+            TimeoutError: If the client wasn't ready within `timeout` seconds
+
+        Example:
+            ```python
+            api = PocketOptionAsync(ssid)
+            await api.wait_connected()
+            print(await api.balance())
+            ```
+        """
+        if not await self.client.wait_ready(timeout):
+            raise TimeoutError(f"Client wasn't ready after {timeout} seconds")
+
     async def get_server_time(self) -> int:
         """Returns the current server time as a UNIX timestamp"""
         return await self.client.get_server_time()
@@ -683,6 +1035,47 @@ class PocketOptionAsync:
         """
         await self.client.unsubscribe(asset)
 
+    async def send_raw_message(self, message: str) -> None:
+        """
+        Sends a raw message through the websocket without waiting for a response.
+
+        Args:
+            message (str): Message to send, e.g. `'42["signals/subscribe"]'`
+        """
+        await self.client.send_raw_message(message)
+
+    async def send_raw_messages(
+        self, messages: list[str], pacing: timedelta | None = None
+    ) -> None:
+        """
+        Sends several raw messages without waiting for responses.
+
+        Without `pacing` the messages are queued back to back and flushed to the
+        websocket together, in a single call instead of one await per message.
+
+        Args:
+            messages (list[str]): Messages to send, in order
+            pacing (timedelta | None): Optional minimum interval between consecutive messages,
+                the time spent sending counts towards it
+
+        Example:
+            ```python
+            await api.send_raw_messages(['42["trades/subscribe"]', '42["notifications/subscribe"]'])
+            ```
+        """
+        if pacing is None:
+            await self.client.send_raw_messages(list(messages))
+            return
+        interval = pacing.total_seconds()
+        loop = asyncio.get_running_loop()
+        next_send = loop.time()
+        for message in messages:
+            remaining = next_send - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            next_send = loop.time() + interval
+            await self.client.send_raw_message(message)
+
     async def create_raw_handler(
         self, validator: Validator, keep_alive: str | None = None
     ) -> "RawHandler":
@@ -717,9 +1110,163 @@ class PocketOptionAsync:
         return RawHandler(rust_handler)
 
 
-async def _timeout(future, timeout: int):
-    if sys.version_info[:3] >= (3, 11):
+def _aggregate_ticks_python(ticks: list, period: int) -> list[dict]:
+    """Aggregates `[timestamp, price]` ticks into candles of `period` seconds"""
+    # 1. Sort by timestamp, the server usually sends them in order already
+    if any(a[0] > b[0] for a, b in zip(ticks, ticks[1:])):
+        ticks.sort(key=lambda x: x[0])
+
+    candles = {}
+
+    for tick in ticks:
+        ts, price = tick[0], tick[1]
+        # Bucket timestamp by period
+        candle_ts = int(ts // period) * period
+
+        if candle_ts not in candles:
+            candles[candle_ts] = {
+                "time": candle_ts,
+                "open": price,
+                "high": price,
+                "low": price,
+                "close": price,
+                "count": 1,
+            }
+        else:
+            c = candles[candle_ts]
+            c["high"] = max(c["high"], price)
+            c["low"] = min(c["low"], price)
+            c["close"] = price
+            c["count"] += 1
+
+    # Ticks are sorted, so the buckets were inserted in time order already
+    return list(candles.values())
+
+
+def _aggregate_ticks_array(ticks: list, period: int) -> "np.ndarray":
+    """
+    Vectorized version of `_aggregate_ticks_python` returning a `CANDLE_DTYPE` array.
+    Ticks are sorted once, split into runs of equal buckets and every run is
+    reduced with a single `reduceat` pass instead of per tick dict updates.
+    """
+    arr = np.asarray(ticks, dtype=np.float64)
+    ts = arr[:, 0]
+    px = arr[:, 1]
+    if (ts[1:] < ts[:-1]).any():
+        # Stable sort so equal timestamps keep their arrival order (open / close)
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        px = px[order]
+
+    buckets = (ts // period).astype(np.int64) * period
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    bounds = np.r_[starts, len(buckets)]
+
+    candles = np.empty(len(starts), dtype=CANDLE_DTYPE)
+    candles["time"] = buckets[starts]
+    candles["open"] = px[starts]
+    candles["high"] = np.maximum.reduceat(px, starts)
+    candles["low"] = np.minimum.reduceat(px, starts)
+    candles["close"] = px[bounds[1:] - 1]
+    candles["count"] = np.diff(bounds)
+    return candles
+
+
+def _aggregate_ticks_numpy(ticks: list, period: int) -> list[dict]:
+    """`_aggregate_ticks_array` converted to the `list[dict]` format of `get_candles`"""
+    candles = _aggregate_ticks_array(ticks, period)
+    return [
+        {"time": t, "open": o, "high": h, "low": lo, "close": c, "count": n}
+        for t, o, h, lo, c, n in zip(
+            candles["time"].tolist(),
+            candles["open"].tolist(),
+            candles["high"].tolist(),
+            candles["low"].tolist(),
+            candles["close"].tolist(),
+            candles["count"].tolist(),
+        )
+    ]
+
+
+_aggregate_ticks = _aggregate_ticks_numpy if np is not None else _aggregate_ticks_python
+
+# Order of the columns returned by the `*_columns` methods of the Rust client
+_CANDLE_COLUMNS = ("timestamp", "open", "high", "low", "close")
+
+
+def _require_numpy(method: str) -> None:
+    if np is None:
+        raise ImportError(f"{method} requires numpy to be installed")
+
+
+def _columns_to_numpy(columns: tuple) -> dict[str, "np.ndarray"]:
+    """Wraps the `float64` column buffers returned by Rust as arrays, without copying"""
+    return {
+        name: np.frombuffer(column, dtype=np.float64)
+        for name, column in zip(_CANDLE_COLUMNS, columns)
+    }
+
+
+# Clients handed out by `get_shared_api`, one per ssid
+# Keyed by event loop too, a client's asyncio primitives (e.g. the history lock) bind to
+# the first loop that uses them
+_SHARED_APIS: dict[tuple[asyncio.AbstractEventLoop, str], PocketOptionAsync] = {}
+
+
+async def get_shared_api(ssid: str, timeout: float = 10.0) -> PocketOptionAsync:
+    """
+    Returns a connected client for `ssid`, shared by every caller on the running event loop.
+
+    The first call creates the client and waits until it's ready, later calls reuse its
+    websocket instead of opening a new connection and authenticating again.
+    A client can only be used from one event loop, so each loop gets its own client. Clients
+    of loops that were closed since are disconnected when the next client is created.
+
+    Args:
+        ssid (str): Session ID used to create the client
+        timeout (float): Maximum number of seconds to wait for the connection
+
+    Example:
+        ```python
+        api = await get_shared_api(ssid)
+        print(await api.balance())
+        ```
+    """
+    key = (asyncio.get_running_loop(), ssid)
+    api = _SHARED_APIS.get(key)
+    if api is None:
+        stale = [k for k in _SHARED_APIS if k[0].is_closed()]
+        await asyncio.gather(
+            *(_SHARED_APIS.pop(k).disconnect() for k in stale), return_exceptions=True
+        )
+        api = _SHARED_APIS[key] = PocketOptionAsync(ssid)
+    await api.wait_connected(timeout)
+    return api
+
+
+async def close_shared_apis() -> None:
+    "Disconnects every client created by `get_shared_api`, called automatically at exit"
+    apis = list(_SHARED_APIS.values())
+    _SHARED_APIS.clear()
+    await asyncio.gather(*(api.disconnect() for api in apis), return_exceptions=True)
+
+
+@atexit.register
+def _close_shared_apis_at_exit() -> None:
+    # Their loops are usually closed by now, `disconnect` only awaits the Rust client
+    # so it runs fine on a new loop
+    if _SHARED_APIS:
+        asyncio.run(close_shared_apis())
+
+
+# The implementation is picked once at import instead of checking the version on every call
+if sys.version_info >= (3, 11):
+
+    async def _timeout(future, timeout: int):
         async with asyncio.timeout(timeout):
             return await future
-    else:
+
+else:
+
+    async def _timeout(future, timeout: int):
         return await asyncio.wait_for(future, timeout)
@@ -1,21 +1,62 @@
 from .asyncronous import PocketOptionAsync
 from BinaryOptionsToolsV2.config import Config
 from BinaryOptionsToolsV2.validator import Validator
+from collections import deque
+from contextlib import contextmanager
 from datetime import timedelta
 
 import asyncio
-import json
+import threading
+import weakref
+
+
+def _shutdown(loop, thread, client, timeout: float = 5.0) -> None:
+    """Disconnects `client` and tears down the background event loop of a `PocketOption`"""
+    if loop.is_closed():
+        return
+    if thread.is_alive():
+        try:
+            asyncio.run_coroutine_threadsafe(client.disconnect(), loop).result(timeout)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+    if not loop.is_running():
+        loop.close()
 
 
 class SyncSubscription:
-    def __init__(self, subscription):
-        self.subscription = subscription
+    def __init__(self, subscription, batch: int = 64):
+        # Items are built as dicts on the Rust side, no JSON parsing needed
+        self.subscription = subscription.as_dicts()
+        self._batch = batch
+        self._buffer = deque()
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return json.loads(next(self.subscription))
+        # Candles that are already waiting are pulled in one call and served
+        # from the buffer, waiting only happens when the buffer is empty
+        if not self._buffer:
+            self._buffer.extend(self.subscription.next_batch(self._batch))
+        return self._buffer.popleft()
+
+
+class SyncBatchSubscription:
+    """Sync iterator that yields lists of up to `batch` candles instead of single candles"""
+
+    def __init__(self, subscription, batch: int = 64, timeout: float = 0.0):
+        self.subscription = subscription.as_dicts()
+        self._batch = batch
+        self._timeout_ms = int(timeout * 1000)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.subscription.next_batch(self._batch, self._timeout_ms)
 
 
 class RawHandlerSync:
@@ -26,20 +67,23 @@ class RawHandlerSync:
     based on a validator. Each handler maintains its own message stream.
     """
 
-    def __init__(self, async_handler, loop):
+    def __init__(self, async_handler, submit):
         """
-        Initialize RawHandlerSync with an async handler and event loop.
+        Initialize RawHandlerSync with an async handler and a submit callable.
         
         Args:
             async_handler: The underlying async RawHandler instance
-            loop: Event loop for running async operations
+            submit: Callable that runs a coroutine on the client's event loop and returns its result
         """
         self._handler = async_handler
-        self._loop = loop
+        self._run = submit
+        # Text messages queued by `batch()`, None when not batching
+        self._pending: list[str] | None = None
 
     def send_text(self, message: str) -> None:
         """
         Send a text message through this handler.
+        Inside a `batch()` block the message is queued instead and sent when the block exits.
         
         Args:
             message: Text message to send
@@ -49,21 +93,75 @@ class RawHandlerSync:
             handler.send_text('42["ping"]')
             ```
         """
-        self._loop.run_until_complete(self._handler.send_text(message))
+        if self._pending is not None:
+            self._pending.append(message)
+            return
+        self._run(self._handler.send_text(message))
+
+    def send_text_batched(self, messages: list[str]) -> None:
+        """
+        Send several text messages at once, they reach the websocket in a single flush.
+
+        Args:
+            messages: Text messages to send, in order
+
+        Example:
+            ```python
+            handler.send_text_batched(['42["ping"]', '42["ping"]'])
+            ```
+        """
+        self._run(self._handler.send_text_batched(messages))
 
-    def send_binary(self, data: bytes) -> None:
+    def flush(self) -> None:
+        """
+        Send the text messages queued inside a `batch()` block right away.
+        Does nothing when no messages are queued.
+        """
+        pending = self._pending
+        if pending:
+            self._pending = []
+            self._run(self._handler.send_text_batched(pending))
+
+    @contextmanager
+    def batch(self):
+        """
+        Queue every `send_text` call made inside the block and send them in one
+        sync-over-async trip (and a single websocket flush) when the block exits.
+        `send_binary` and `send_and_wait` flush the queue first so the order is kept.
+
+        Example:
+            ```python
+            with handler.batch():
+                for asset in assets:
+                    handler.send_text(f'42["changeSymbol",{{"asset":"{asset}","period":60}}]')
+            ```
+        """
+        if self._pending is not None:
+            # Nested batch, the outermost block sends everything
+            yield self
+            return
+        self._pending = []
+        try:
+            yield self
+            self.flush()
+        finally:
+            self._pending = None
+
+    def send_binary(self, data: bytes | bytearray | memoryview) -> None:
         """
         Send a binary message through this handler.
         
         Args:
-            data: Binary data to send
+            data: Binary data to send, `bytes` and `bytearray` are copied once straight
+                from their storage (other buffers such as `memoryview` are converted with `bytes()` first)
             
         Example:
             ```python
             handler.send_binary(b'\\x00\\x01\\x02')
             ```
         """
-        self._loop.run_until_complete(self._handler.send_binary(data))
+        self.flush()
+        self._run(self._handler.send_binary(data))
 
     def send_and_wait(self, message: str) -> str:
         """
@@ -81,7 +179,24 @@ class RawHandlerSync:
             data = json.loads(response)
             ```
         """
-        return self._loop.run_until_complete(self._handler.send_and_wait(message))
+        self.flush()
+        return self._run(self._handler.send_and_wait(message))
+
+    def send_and_wait_many(
+        self, requests: list[tuple[str, Validator]]
+    ) -> list[str]:
+        """
+        Send several messages at once and wait for a response to each of them.
+        See `RawHandler.send_and_wait_many`.
+
+        Args:
+            requests: `(message, validator)` pairs, the validator selects the message's response
+
+        Returns:
+            list[str]: Response of every message, in the order of `requests`
+        """
+        self.flush()
+        return self._run(self._handler.send_and_wait_many(requests))
 
     def wait_next(self) -> str:
         """
@@ -96,7 +211,7 @@ class RawHandlerSync:
             print(f"Received: {message}")
             ```
         """
-        return self._loop.run_until_complete(self._handler.wait_next())
+        return self._run(self._handler.wait_next())
 
     def subscribe(self):
         """
@@ -114,7 +229,7 @@ class RawHandlerSync:
             ```
         """
         # Get the async subscription
-        async_subscription = self._loop.run_until_complete(self._handler.subscribe())
+        async_subscription = self._run(self._handler.subscribe())
         return SyncRawSubscription(async_subscription)
 
     def id(self) -> str:
@@ -128,10 +243,9 @@ class RawHandlerSync:
 
     def close(self) -> None:
         """
-        Close this handler and clean up resources.
-        Note: The handler is automatically cleaned up when it goes out of scope.
+        Close this handler and clean up resources, see `RawHandler.close`.
         """
-        self._loop.run_until_complete(self._handler.close())
+        self._run(self._handler.close())
 
 
 class SyncRawSubscription:
@@ -201,20 +315,35 @@ class PocketOption:
             ```
 
         Note:
-            - Creates a new event loop for handling async operations synchronously
+            - Creates a new event loop, running on a background daemon thread, for handling async operations synchronously
+            - Methods can be called from several threads at once, their requests are in flight concurrently
             - The configuration becomes locked once initialized and cannot be modified afterwards
             - Custom URLs provided in the `url` parameter take precedence over URLs in the configuration
             - Invalid configuration values will raise appropriate exceptions
-            - The event loop is automatically closed when the instance is deleted
+            - The WebSocket connection is opened with `TCP_NODELAY` set (Nagle disabled)
+            - When the instance is garbage collected (or at interpreter exit) the client is disconnected and the event loop is stopped and closed
             - All async operations are wrapped to provide a synchronous interface
 
         Warning: This class does not use the `Config` class for configuration management.
         """
-        self.loop = asyncio.new_event_loop()
         self._client = PocketOptionAsync(ssid, config)
+        self.loop = asyncio.new_event_loop()
+        # The loop runs forever on its own thread and calls are submitted to it, so
+        # several caller threads don't serialize on `run_until_complete`
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="PocketOptionLoop", daemon=True
+        )
+        self._thread.start()
+        # Not a `__del__`: the finalizer holds no reference to `self`, runs at most
+        # once and is also called at interpreter exit while the loop thread is alive
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self.loop, self._thread, self._client
+        )
+
+    def _run(self, coro):
+        """Runs `coro` on the background loop and blocks the calling thread until it's done"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
 
-    def __del__(self):
-        self.loop.close()
 
     def buy(
         self, asset: str, amount: float, time: int, check_win: bool = False
@@ -224,9 +353,7 @@ class PocketOption:
         If check_win is True then the function will return a tuple containing the trade id and a dictionary containing the trade data and the result of the trade ("win", "draw", "loss)
         If check_win is False then the function will return a tuple with the id of the trade and the trade as a dict
         """
-        return self.loop.run_until_complete(
-            self._client.buy(asset, amount, time, check_win)
-        )
+        return self._run(self._client.buy(asset, amount, time, check_win))
 
     def sell(
         self, asset: str, amount: float, time: int, check_win: bool = False
@@ -236,13 +363,19 @@ class PocketOption:
         If check_win is True then the function will return a tuple containing the trade id and a dictionary containing the trade data and the result of the trade ("win", "draw", "loss)
         If check_win is False then the function will return a tuple with the id of the trade and the trade as a dict
         """
-        return self.loop.run_until_complete(
-            self._client.sell(asset, amount, time, check_win)
-        )
+        return self._run(self._client.sell(asset, amount, time, check_win))
 
     def check_win(self, id: str) -> dict:
         """Returns a dictionary containing the trade data and the result of the trade ("win", "draw", "loss)"""
-        return self.loop.run_until_complete(self._client.check_win(id))
+        return self._run(self._client.check_win(id))
+
+    def check_win_result(self, id: str) -> str:
+        """Returns only the result of the trade ("win", "draw", "loss"), skipping the trade data"""
+        return self._run(self._client.check_win_result(id))
+
+    def wait_closed(self, id: str, timeout: float | None = None) -> None:
+        """Blocks until the trade is closed, see `PocketOptionAsync.wait_closed`"""
+        self._run(self._client.wait_closed(id, timeout))
 
     def get_candles(self, asset: str, period: int, offset: int) -> list[dict]:
         """
@@ -254,9 +387,14 @@ class PocketOption:
             * high: highest price
             * low: lowest price
         """
-        return self.loop.run_until_complete(
-            self._client.get_candles(asset, period, offset)
-        )
+        return self._run(self._client.get_candles(asset, period, offset))
+
+    def get_candles_array(self, asset: str, period: int):
+        """
+        Same as `get_candles` but returns a NumPy structured array (see `CANDLE_DTYPE` in the
+        asyncronous module) instead of a list of dictionaries, requires NumPy to be installed.
+        """
+        return self._run(self._client.get_candles_array(asset, period))
 
     def get_candles_advanced(
         self, asset: str, period: int, offset: int, time: int
@@ -283,38 +421,83 @@ class PocketOption:
             Maximum period depends on the timeframe
         """
 
-        return self.loop.run_until_complete(
-            self._client.get_candles_advanced(asset, period, offset, time)
+        return self._run(self._client.get_candles_advanced(asset, period, offset, time))
+
+    def get_candles_advanced_numpy(
+        self, asset: str, period: int, offset: int, time: int
+    ) -> dict:
+        """Same as `get_candles_advanced` but returns a dict of NumPy columns, requires NumPy to be installed"""
+        return self._run(
+            self._client.get_candles_advanced_numpy(asset, period, offset, time)
         )
 
     def balance(self) -> float:
         "Returns the balance of the account"
-        return self.loop.run_until_complete(self._client.balance())
+        return self._run(self._client.balance())
 
     def opened_deals(self) -> list[dict]:
         "Returns a list of all the opened deals as dictionaries"
-        return self.loop.run_until_complete(self._client.opened_deals())
+        return self._run(self._client.opened_deals())
 
     def closed_deals(self) -> list[dict]:
         "Returns a list of all the closed deals as dictionaries"
-        return self.loop.run_until_complete(self._client.closed_deals())
+        return self._run(self._client.closed_deals())
+
+    def deals_snapshot(self) -> dict:
+        "Returns the opened and closed deals together, see `PocketOptionAsync.deals_snapshot`"
+        return self._run(self._client.deals_snapshot())
 
     def clear_closed_deals(self) -> None:
         "Removes all the closed deals from memory, this function doesn't return anything"
-        self.loop.run_until_complete(self._client.clear_closed_deals())
+        self._run(self._client.clear_closed_deals())
 
     def payout(self, asset: None | str | list[str] = None) -> dict | list[str] | int:
         "Returns a dict of asset | payout for each asset, if 'asset' is not None then it will return the payout of the asset or a list of the payouts for each asset it was passed"
-        return self.loop.run_until_complete(self._client.payout(asset))
+        return self._run(self._client.payout(asset))
 
     def history(self, asset: str, period: int) -> list[dict]:
         "Returns a list of dictionaries containing the latest data available for the specified asset starting from 'period', the data is in the same format as the returned data of the 'get_candles' function."
-        return self.loop.run_until_complete(self._client.history(asset, period))
+        return self._run(self._client.history(asset, period))
+
+    def history_numpy(self, asset: str, period: int) -> dict:
+        """Same as `history` but returns a dict of NumPy columns, requires NumPy to be installed"""
+        return self._run(self._client.history_numpy(asset, period))
 
     def subscribe_symbol(self, asset: str) -> SyncSubscription:
         """Returns a sync iterator over the associated asset, it will return real time raw candles and will return new candles while the 'PocketOption' class is loaded if the class is droped then the iterator will fail"""
         return SyncSubscription(
-            self.loop.run_until_complete(self._client._subscribe_symbol_inner(asset))
+            self._run(self._client._subscribe_symbol_inner(asset))
+        )
+
+    def subscribe_many(self, assets: list[str]) -> dict[str, SyncSubscription]:
+        """
+        Creates real-time data subscriptions for several assets at once, the requests
+        are sent back to back and acknowledged together. See `PocketOptionAsync.subscribe_many`.
+
+        Returns:
+            dict[str, SyncSubscription]: Sync iterator for every asset
+        """
+        subscriptions = self._run(self._client._subscribe_many_inner(assets))
+        return {
+            asset: SyncSubscription(subscription)
+            for asset, subscription in subscriptions.items()
+        }
+
+    def subscribe_symbol_batched(
+        self, asset: str, batch: int = 64, timeout: float = 0.0
+    ) -> SyncBatchSubscription:
+        """
+        Returns a sync iterator over the associated asset that yields lists of candles.
+        Each step waits for the next candle and then also returns every candle that
+        arrives within `timeout` seconds (up to `batch` candles in total).
+
+        Args:
+            asset (str): Trading asset to subscribe to
+            batch (int): Maximum number of candles returned per step
+            timeout (float): How long to keep waiting for more candles after the first one
+        """
+        return SyncBatchSubscription(
+            self._run(self._client._subscribe_symbol_inner(asset)), batch, timeout
         )
 
     def subscribe_symbol_chuncked(
@@ -322,9 +505,7 @@ class PocketOption:
     ) -> SyncSubscription:
         """Returns a sync iterator over the associated asset, it will return real time candles formed with the specified amount of raw candles and will return new candles while the 'PocketOption' class is loaded if the class is droped then the iterator will fail"""
         return SyncSubscription(
-            self.loop.run_until_complete(
-                self._client._subscribe_symbol_chuncked_inner(asset, chunck_size)
-            )
+            self._run(self._client._subscribe_symbol_chuncked_inner(asset, chunck_size))
         )
 
     def subscribe_symbol_timed(self, asset: str, time: timedelta) -> SyncSubscription:
@@ -333,9 +514,7 @@ class PocketOption:
         Please keep in mind the iterator won't return a new candle exactly each `time` duration, there could be a small delay and imperfect timestamps
         """
         return SyncSubscription(
-            self.loop.run_until_complete(
-                self._client._subscribe_symbol_timed_inner(asset, time)
-            )
+            self._run(self._client._subscribe_symbol_timed_inner(asset, time))
         )
 
     def subscribe_symbol_time_aligned(
@@ -346,14 +525,22 @@ class PocketOption:
         Please keep in mind the iterator won't return a new candle exactly each `time` duration, there could be a small delay and imperfect timestamps
         """
         return SyncSubscription(
-            self.loop.run_until_complete(
-                self._client._subscribe_symbol_time_aligned_inner(asset, time)
-            )
+            self._run(self._client._subscribe_symbol_time_aligned_inner(asset, time))
         )
 
+    def wait_connected(self, timeout: float = 10.0) -> None:
+        """
+        Blocks until the client is connected and has received the assets list.
+        See `PocketOptionAsync.wait_connected`.
+
+        Raises:
+            TimeoutError: If the client wasn't ready within `timeout` seconds
+        """
+        self._run(self._client.wait_connected(timeout))
+
     def get_server_time(self) -> int:
         """Returns the current server time as a UNIX timestamp"""
-        return self.loop.run_until_complete(self._client.get_server_time())
+        return self._run(self._client.get_server_time())
 
     def is_demo(self) -> bool:
         """
@@ -399,7 +586,7 @@ class PocketOption:
             client.connect()
             ```
         """
-        self.loop.run_until_complete(self._client.disconnect())
+        self._run(self._client.disconnect())
 
     def connect(self) -> None:
         """
@@ -414,7 +601,7 @@ class PocketOption:
             # Connection is re-established
             ```
         """
-        self.loop.run_until_complete(self._client.connect())
+        self._run(self._client.connect())
 
     def reconnect(self) -> None:
         """
@@ -425,7 +612,7 @@ class PocketOption:
             client.reconnect()
             ```
         """
-        self.loop.run_until_complete(self._client.reconnect())
+        self._run(self._client.reconnect())
 
     def unsubscribe(self, asset: str) -> None:
         """
@@ -443,7 +630,20 @@ class PocketOption:
             client.unsubscribe("EURUSD_otc")
             ```
         """
-        self.loop.run_until_complete(self._client.unsubscribe(asset))
+        self._run(self._client.unsubscribe(asset))
+
+    def send_raw_message(self, message: str) -> None:
+        """Sends a raw message through the websocket without waiting for a response"""
+        self._run(self._client.send_raw_message(message))
+
+    def send_raw_messages(
+        self, messages: list[str], pacing: timedelta | None = None
+    ) -> None:
+        """
+        Sends several raw messages without waiting for responses, see
+        `PocketOptionAsync.send_raw_messages`.
+        """
+        self._run(self._client.send_raw_messages(messages, pacing))
 
     def create_raw_handler(
         self, validator: Validator, keep_alive: str | None = None
@@ -473,7 +673,7 @@ class PocketOption:
                 print(message)
             ```
         """
-        async_handler = self.loop.run_until_complete(
+        async_handler = self._run(
             self._client.create_raw_handler(validator, keep_alive)
         )
-        return RawHandlerSync(async_handler, self.loop)
+        return RawHandlerSync(async_handler, self._run)
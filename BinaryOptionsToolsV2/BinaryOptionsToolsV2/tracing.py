@@ -1,10 +1,19 @@
-import json
-from BinaryOptionsToolsV2 import start_tracing
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+from BinaryOptionsToolsV2 import start_tracing, flush_logs
 from BinaryOptionsToolsV2 import Logger as RustLogger
 from BinaryOptionsToolsV2 import LogBuilder as RustLogBuilder
 
 from datetime import timedelta
 
+import atexit
+
+# Log files are written by background threads, make sure the queued lines reach the disk
+atexit.register(flush_logs)
+
 
 class LogSubscription:
     def __init__(self, subscription):
@@ -14,13 +23,36 @@ class LogSubscription:
         return self
 
     async def __anext__(self):
-        return json.loads(await anext(self.subscription))
+        return _loads(await anext(self.subscription))
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return json.loads(next(self.subscription))
+        return _loads(next(self.subscription))
+
+    async def recv_batch(self, max_n: int = 64, max_wait: timedelta | None = None) -> list:
+        """
+        Waits for the next log, then keeps taking logs (up to `max_n` in total) while new ones
+        arrive within `max_wait`, logs already buffered are always taken.
+        Raises `StopAsyncIteration` once the iterator is exhausted.
+        """
+        return [
+            _loads(log)
+            for log in await self.subscription.anext_batch(max_n, _millis(max_wait))
+        ]
+
+    def next_batch(self, max_n: int = 64, max_wait: timedelta | None = None) -> list:
+        """
+        Syncronous version of `recv_batch`, raises `StopIteration` once the iterator is exhausted.
+        """
+        return [
+            _loads(log) for log in self.subscription.next_batch(max_n, _millis(max_wait))
+        ]
+
+
+def _millis(duration: timedelta | None) -> int:
+    return 0 if duration is None else int(duration.total_seconds() * 1000)
 
 
 def start_logs(
@@ -59,41 +91,68 @@ class Logger:
     def __init__(self):
         self.logger = RustLogger()
 
-    def debug(self, message):
+    def enabled_for(self, level: str) -> bool:
+        """
+        Check if a message at `level` ("DEBUG", "INFO", "WARN" or "ERROR") would be logged,
+        useful to skip building expensive log messages.
+        """
+        return self.logger.enabled_for(level)
+
+    def debug(self, message, *args):
         """
         Log a debug message.
 
         Args:
             message (str): The message to log.
+            *args: Values for `%` formatting of `message`, only formatted when the message isn't filtered out.
         """
-        self.logger.debug(str(message))
+        if args:
+            if not self.logger.enabled_for("DEBUG"):
+                return
+            message = message % args
+        self.logger.debug(message if type(message) is str else str(message))
 
-    def info(self, message):
+    def info(self, message, *args):
         """
         Log an informational message.
 
         Args:
             message (str): The message to log.
+            *args: Values for `%` formatting of `message`, only formatted when the message isn't filtered out.
         """
-        self.logger.info(str(message))
+        if args:
+            if not self.logger.enabled_for("INFO"):
+                return
+            message = message % args
+        self.logger.info(message if type(message) is str else str(message))
 
-    def warn(self, message):
+    def warn(self, message, *args):
         """
         Log a warning message.
 
         Args:
             message (str): The message to log.
+            *args: Values for `%` formatting of `message`, only formatted when the message isn't filtered out.
         """
-        self.logger.warn(str(message))
+        if args:
+            if not self.logger.enabled_for("WARN"):
+                return
+            message = message % args
+        self.logger.warn(message if type(message) is str else str(message))
 
-    def error(self, message):
+    def error(self, message, *args):
         """
         Log an error message.
 
         Args:
             message (str): The message to log.
+            *args: Values for `%` formatting of `message`, only formatted when the message isn't filtered out.
         """
-        self.logger.error(str(message))
+        if args:
+            if not self.logger.enabled_for("ERROR"):
+                return
+            message = message % args
+        self.logger.error(message if type(message) is str else str(message))
 
 
 class LogBuilder:
@@ -122,15 +181,19 @@ class LogBuilder:
         """
         return LogSubscription(self.builder.create_logs_iterator(level, timeout))
 
-    def log_file(self, path: str = "logs.log", level: str = "DEBUG"):
+    def log_file(
+        self, path: str = "logs.log", level: str = "DEBUG", queue_depth: int = 1024
+    ):
         """
         Configure logging to a file.
+        The file is written by a background thread, logging only queues the formatted line.
 
         Args:
             path (str): The path where logs will be stored (default is "logs.log").
             level (str): The minimum log level for this file handler.
+            queue_depth (int): Lines that can be queued before logging waits for the writer (default is 1024).
         """
-        self.builder.log_file(path, level)
+        self.builder.log_file(path, level, queue_depth)
 
     def terminal(self, level: str = "DEBUG"):
         """
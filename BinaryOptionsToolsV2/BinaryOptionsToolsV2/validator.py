@@ -1,5 +1,9 @@
+from functools import lru_cache
 from typing import List
 
+# Validators are immutable, building one with the same arguments again returns the same instance
+_VALIDATOR_CACHE_SIZE = 256
+
 
 class Validator:
     """
@@ -29,12 +33,20 @@ class Validator:
         self._validator = RawValidator()
 
     @staticmethod
-    def regex(pattern: str) -> "Validator":
+    @lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+    def regex(pattern: str, *, dfa: bool = False) -> "Validator":
         """
         Creates a validator that uses regex pattern matching.
 
+        The pattern is compiled by Rust's `regex` crate and matched in Rust, in linear time
+        (no backtracking). Its syntax is close to python's `re` but stricter, literal braces
+        must be escaped (`r'\\{"price":\\d+\\}'`).
+
         Args:
             pattern: Regular expression pattern
+            dfa: Precompile the pattern into a dense DFA up front. Worth it for patterns checked
+                against many messages, costs more memory and build time. Patterns the DFA can't
+                handle (e.g. Unicode `\\b`) silently fall back to the default engine.
 
         Returns:
             Validator that matches messages against the pattern
@@ -50,10 +62,11 @@ class Validator:
         from BinaryOptionsToolsV2 import RawValidator
 
         v = Validator()
-        v._validator = RawValidator.regex(pattern)
+        v._validator = RawValidator.regex(pattern, dfa)
         return v
 
     @staticmethod
+    @lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
     def starts_with(prefix: str) -> "Validator":
         """
         Creates a validator that checks if messages start with a specific prefix.
@@ -71,6 +84,7 @@ class Validator:
         return v
 
     @staticmethod
+    @lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
     def ends_with(suffix: str) -> "Validator":
         """
         Creates a validator that checks if messages end with a specific suffix.
@@ -88,6 +102,7 @@ class Validator:
         return v
 
     @staticmethod
+    @lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
     def contains(substring: str) -> "Validator":
         """
         Creates a validator that checks if messages contain a specific substring.
@@ -134,6 +149,9 @@ class Validator:
         """
         Creates a validator that requires all input validators to match.
 
+        Validators are checked cheapest first (prefix / suffix, substring, regex, custom) so a cheap
+        reject skips the expensive checks, custom functions keep their relative order.
+
         Args:
             validators: List of validators that all must match
 
@@ -162,6 +180,8 @@ class Validator:
         """
         Creates a validator that requires at least one input validator to match.
 
+        Like `all`, validators are checked cheapest first and the first match returns.
+
         Args:
             validators: List of validators where at least one must match
 
@@ -9,7 +9,7 @@ mod stream;
 mod validator;
 
 // use config::PyConfig;
-use logs::{LogBuilder, Logger, StreamLogsIterator, StreamLogsLayer, start_tracing};
+use logs::{LogBuilder, Logger, StreamLogsIterator, StreamLogsLayer, flush_logs, start_tracing};
 use pocketoption::{RawPocketOption, RawStreamIterator, StreamIterator};
 use pyo3::prelude::*;
 use validator::RawValidator;
@@ -31,5 +31,6 @@ fn BinaryOptionsTools(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // m.add_class::<PyConfig>()?;
 
     m.add_function(wrap_pyfunction!(start_tracing, m)?)?;
+    m.add_function(wrap_pyfunction!(flush_logs, m)?)?;
     Ok(())
 }
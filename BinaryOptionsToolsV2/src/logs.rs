@@ -1,4 +1,13 @@
-use std::{fs::OpenOptions, io::Write, sync::Arc};
+use std::{
+    fs::{File, OpenOptions},
+    io::{self, BufWriter, Write},
+    path::PathBuf,
+    sync::{
+        Arc, Mutex as StdMutex, PoisonError, Weak,
+        mpsc::{self, Receiver, SyncSender},
+    },
+    thread,
+};
 
 use binary_options_tools::stream::{Message, RecieverStream, stream_logs_layer};
 use chrono::Duration;
@@ -6,21 +15,136 @@ use futures_util::{
     StreamExt,
     stream::{BoxStream, Fuse},
 };
-use pyo3::{Bound, Py, PyAny, PyResult, Python, pyclass, pyfunction, pymethods};
+use pyo3::types::PyBytes;
+use pyo3::{Bound, IntoPyObjectExt, Py, PyAny, PyResult, Python, pyclass, pyfunction, pymethods};
 use pyo3_async_runtimes::tokio::future_into_py;
 use tokio::sync::Mutex;
 use tracing::{Level, debug, instrument, level_filters::LevelFilter, warn};
 use tracing_subscriber::{
     Layer, Registry,
     fmt::{self, MakeWriter},
-    layer::SubscriberExt,
+    layer::{Identity, SubscriberExt},
     util::SubscriberInitExt,
 };
 
-use crate::{error::BinaryErrorPy, runtime::get_runtime, stream::next_stream};
+use crate::{
+    error::BinaryErrorPy,
+    runtime::block_on_detached,
+    stream::{next_stream, next_stream_batch},
+};
 
 const TARGET: &str = "Python";
 
+/// Lines a file sink can queue before logging callers wait for the writer thread
+const DEFAULT_QUEUE_DEPTH: usize = 1024;
+
+/// File sinks that are still in use, keyed by path, so `flush_logs` can reach them and a path
+/// configured again reuses its writer thread. Entries are weak: once every layer writing to a
+/// sink is dropped, its writer thread ends and the file is closed.
+static FILE_SINKS: StdMutex<Vec<(PathBuf, Weak<SyncSender<SinkMessage>>)>> =
+    StdMutex::new(Vec::new());
+
+enum SinkMessage {
+    Line(Vec<u8>),
+    Flush(mpsc::Sender<()>),
+}
+
+/// Log file writer that never touches the disk on the logging thread.
+/// Formatted lines are queued to a dedicated writer thread, which drains everything queued
+/// into a buffered writer and only flushes once the queue is empty, so a burst of lines
+/// costs a few large writes instead of one syscall per line.
+#[derive(Clone)]
+struct FileSink {
+    sender: Arc<SyncSender<SinkMessage>>,
+}
+
+impl FileSink {
+    /// Opens a sink for `path`, or shares the running one if that path is already open.
+    /// `queue_depth` only applies when a new writer thread is started.
+    fn open(path: &str, queue_depth: usize) -> io::Result<Self> {
+        let key = std::path::absolute(path).unwrap_or_else(|_| PathBuf::from(path));
+        let mut sinks = FILE_SINKS.lock().unwrap_or_else(PoisonError::into_inner);
+        sinks.retain(|(_, sender)| sender.strong_count() > 0);
+        if let Some(sender) = sinks
+            .iter()
+            .find(|(open, _)| *open == key)
+            .and_then(|(_, sender)| sender.upgrade())
+        {
+            return Ok(Self { sender });
+        }
+
+        let file = OpenOptions::new().append(true).create(true).open(path)?;
+        let (sender, receiver) = mpsc::sync_channel(queue_depth.max(1));
+        thread::Builder::new()
+            .name("log-file-sink".to_string())
+            .spawn(move || write_lines(receiver, BufWriter::new(file)))?;
+        let sender = Arc::new(sender);
+        sinks.push((key, Arc::downgrade(&sender)));
+        Ok(Self { sender })
+    }
+
+    /// Wait until every line queued so far was written to the file
+    fn flush_queue(&self) {
+        let (done, wait) = mpsc::channel();
+        if self.sender.send(SinkMessage::Flush(done)).is_ok() {
+            let _ = wait.recv();
+        }
+    }
+}
+
+fn write_lines(receiver: Receiver<SinkMessage>, mut writer: BufWriter<File>) {
+    while let Ok(message) = receiver.recv() {
+        let mut next = Some(message);
+        while let Some(message) = next {
+            match message {
+                SinkMessage::Line(line) => {
+                    let _ = writer.write_all(&line);
+                }
+                SinkMessage::Flush(done) => {
+                    let _ = writer.flush();
+                    let _ = done.send(());
+                }
+            }
+            next = receiver.try_recv().ok();
+        }
+        let _ = writer.flush();
+    }
+}
+
+impl Write for FileSink {
+    fn write(&mut self, buf: &[u8]) -> io::Result<usize> {
+        self.sender
+            .send(SinkMessage::Line(buf.to_vec()))
+            .map_err(|_| io::Error::new(io::ErrorKind::BrokenPipe, "log file writer stopped"))?;
+        Ok(buf.len())
+    }
+
+    fn flush(&mut self) -> io::Result<()> {
+        Ok(())
+    }
+}
+
+impl<'a> MakeWriter<'a> for FileSink {
+    type Writer = FileSink;
+
+    fn make_writer(&'a self) -> Self::Writer {
+        self.clone()
+    }
+}
+
+/// Block until every log line queued so far was written to its log file
+#[pyfunction]
+pub fn flush_logs(py: Python<'_>) {
+    let sinks = FILE_SINKS
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .iter()
+        .filter_map(|(_, sender)| sender.upgrade())
+        .map(|sender| FileSink { sender })
+        .collect::<Vec<_>>();
+    py.detach(|| sinks.iter().for_each(FileSink::flush_queue));
+}
+
 #[pyfunction]
 pub fn start_tracing(
     path: String,
@@ -29,15 +153,11 @@ pub fn start_tracing(
     layers: Vec<StreamLogsLayer>,
 ) -> PyResult<()> {
     let level: LevelFilter = level.parse().unwrap_or(Level::DEBUG.into());
-    let error_logs = OpenOptions::new()
-        .append(true)
-        .create(true)
-        .open(format!("{}/error.log", &path))?;
-    let logs = OpenOptions::new()
-        .append(true)
-        .create(true)
-        .open(format!("{}/logs.log", &path))?;
-    let default = fmt::Layer::default().with_writer(NoneWriter).boxed();
+    let error_logs = FileSink::open(&format!("{}/error.log", &path), DEFAULT_QUEUE_DEPTH)?;
+    let logs = FileSink::open(&format!("{}/logs.log", &path), DEFAULT_QUEUE_DEPTH)?;
+    // Unfiltered no-op layer, it only keeps the layer list from ever being empty.
+    // Unlike a `fmt` layer with a discarding writer it doesn't format every event.
+    let default = Identity::new().boxed();
     let mut layers = layers
         .into_iter()
         .flat_map(|l| Arc::try_unwrap(l.layer))
@@ -79,23 +199,24 @@ pub struct StreamLogsLayer {
     layer: Arc<Box<dyn Layer<Registry> + Send + Sync>>,
 }
 
-struct NoneWriter;
-
-impl Write for NoneWriter {
-    fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
-        Ok(buf.len())
-    }
-
-    fn flush(&mut self) -> std::io::Result<()> {
-        Ok(())
-    }
+/// Hand a log record (a JSON line) to python as `bytes`, `orjson.loads` / `json.loads`
+/// parse them directly without building an intermediate `str`.
+fn log_to_bytes(py: Python<'_>, message: &Message) -> PyResult<Py<PyAny>> {
+    let data: &[u8] = match message {
+        Message::Text(text) => text.as_bytes(),
+        Message::Binary(data) => data,
+        _ => &[],
+    };
+    PyBytes::new(py, data).into_py_any(py)
 }
 
-impl<'a> MakeWriter<'a> for NoneWriter {
-    type Writer = NoneWriter;
-    fn make_writer(&'a self) -> Self::Writer {
-        NoneWriter
-    }
+/// Convert a batch of log messages into a python list of bytes, see `log_to_bytes`
+fn logs_to_list(py: Python<'_>, messages: &[Message]) -> PyResult<Py<PyAny>> {
+    let items = messages
+        .iter()
+        .map(|message| log_to_bytes(py, message))
+        .collect::<PyResult<Vec<_>>>()?;
+    items.into_py_any(py)
 }
 
 type LogStream = Fuse<BoxStream<'static, Result<Message, BinaryErrorPy>>>;
@@ -119,23 +240,35 @@ impl StreamLogsIterator {
         let stream = self.stream.clone();
         future_into_py(py, async move {
             let result = next_stream(stream, false).await?;
-            match result {
-                Message::Text(text) => Ok(text.to_string()),
-                Message::Binary(data) => Ok(String::from_utf8_lossy(&data).to_string()),
-                _ => Ok("".to_string()),
-            }
+            Python::attach(|py| log_to_bytes(py, &result))
         })
     }
 
-    fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<String> {
-        let runtime = get_runtime(py)?;
+    fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<Py<PyAny>> {
         let stream = self.stream.clone();
-        let result = runtime.block_on(next_stream(stream, true))?;
-        match result {
-            Message::Text(text) => Ok(text.to_string()),
-            Message::Binary(data) => Ok(String::from_utf8_lossy(&data).to_string()),
-            _ => Ok("".to_string()),
-        }
+        let result = block_on_detached(py, next_stream(stream, true))??;
+        log_to_bytes(py, &result)
+    }
+
+    /// Async version of `next_batch`
+    #[pyo3(signature = (max = 64, timeout_ms = 0))]
+    fn anext_batch<'py>(&self, py: Python<'py>, max: usize, timeout_ms: u64) -> PyResult<Bound<'py, PyAny>> {
+        let stream = self.stream.clone();
+        let timeout = std::time::Duration::from_millis(timeout_ms);
+        future_into_py(py, async move {
+            let messages = next_stream_batch(stream, max, timeout, false).await?;
+            Python::attach(|py| logs_to_list(py, &messages))
+        })
+    }
+
+    /// Wait for the next log, then keep taking logs (up to `max` in total) while new ones
+    /// arrive within `timeout_ms`, and return all of them as one list of bytes.
+    #[pyo3(signature = (max = 64, timeout_ms = 0))]
+    fn next_batch<'py>(&self, py: Python<'py>, max: usize, timeout_ms: u64) -> PyResult<Py<PyAny>> {
+        let stream = self.stream.clone();
+        let timeout = std::time::Duration::from_millis(timeout_ms);
+        let messages = block_on_detached(py, next_stream_batch(stream, max, timeout, true))??;
+        logs_to_list(py, &messages)
     }
 }
 
@@ -182,9 +315,9 @@ impl LogBuilder {
         iter
     }
 
-    #[pyo3(signature = (path = "logs.log".to_string(), level = "DEBUG".to_string()))]
-    pub fn log_file(&mut self, path: String, level: String) -> PyResult<()> {
-        let logs = OpenOptions::new().append(true).create(true).open(path)?;
+    #[pyo3(signature = (path = "logs.log".to_string(), level = "DEBUG".to_string(), queue_depth = DEFAULT_QUEUE_DEPTH))]
+    pub fn log_file(&mut self, path: String, level: String, queue_depth: usize) -> PyResult<()> {
+        let logs = FileSink::open(&path, queue_depth)?;
         let layer = fmt::layer()
             .with_ansi(false)
             .with_writer(logs)
@@ -210,7 +343,7 @@ impl LogBuilder {
             .into());
         }
         self.build = true;
-        let default = fmt::Layer::default().with_writer(NoneWriter).boxed();
+        let default = Identity::new().boxed();
         self.layers.push(default);
         let layers = self
             .layers
@@ -251,6 +384,18 @@ impl Logger {
     pub fn error(&self, message: String) {
         tracing::error!(message);
     }
+
+    /// Whether a message at `level` would reach any layer, lets callers skip formatting
+    /// messages that are filtered out anyway
+    pub fn enabled_for(&self, level: String) -> bool {
+        match level.parse().unwrap_or(Level::DEBUG) {
+            Level::TRACE => tracing::enabled!(Level::TRACE),
+            Level::DEBUG => tracing::enabled!(Level::DEBUG),
+            Level::INFO => tracing::enabled!(Level::INFO),
+            Level::WARN => tracing::enabled!(Level::WARN),
+            Level::ERROR => tracing::enabled!(Level::ERROR),
+        }
+    }
 }
 
 #[cfg(test)]
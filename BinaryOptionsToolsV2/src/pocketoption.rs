@@ -1,4 +1,4 @@
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::str;
 use std::sync::Arc;
 use std::time::Duration;
@@ -12,17 +12,21 @@ use binary_options_tools::pocketoption::pocket_client::PocketOption;
 // use binary_options_tools::reimports::FilteredRecieverStream;
 use async_stream;
 use binary_options_tools::validator::Validator as CrateValidator;
-use binary_options_tools::validator::Validator;
 use futures_util::StreamExt;
 use futures_util::stream::{BoxStream, Fuse};
-use pyo3::{Bound, IntoPyObjectExt, Py, PyAny, PyResult, Python, pyclass, pymethods};
+use pyo3::types::{
+    PyAnyMethods, PyByteArray, PyByteArrayMethods, PyBytes, PyBytesMethods, PyDict, PyDictMethods,
+};
+use pyo3::{Bound, IntoPyObjectExt, Py, PyAny, PyRefMut, PyResult, Python, pyclass, pymethods};
 use pyo3_async_runtimes::tokio::future_into_py;
+use serde::Serialize;
+use serde_json::{Map, Value};
 use tungstenite;
 use uuid::Uuid;
 
 use crate::error::BinaryErrorPy;
-use crate::runtime::get_runtime;
-use crate::stream::next_stream;
+use crate::runtime::block_on_detached;
+use crate::stream::{next_stream, next_stream_batch};
 use crate::validator::RawValidator;
 use tokio::sync::Mutex;
 
@@ -40,6 +44,141 @@ fn arc_message_to_string(msg: &std::sync::Arc<tungstenite::Message>) -> String {
     message_to_string(msg.as_ref())
 }
 
+/// Serialize a value to JSON and return it as Python `bytes`.
+/// The python side parses it directly with `json.loads` / `orjson.loads`, this skips
+/// building an intermediate `str` (allocation + UTF-8 validation) for every payload.
+fn to_json_bytes<T: Serialize>(py: Python<'_>, value: &T) -> PyResult<Py<PyAny>> {
+    let buf = serde_json::to_vec(value).map_err(BinaryErrorPy::from)?;
+    PyBytes::new(py, &buf).into_py_any(py)
+}
+
+/// Serialize a value to JSON bytes and pass them through `decoder` when one is set
+fn decode_json<T: Serialize>(
+    py: Python<'_>,
+    value: &T,
+    decoder: Option<&Py<PyAny>>,
+) -> PyResult<Py<PyAny>> {
+    let bytes = to_json_bytes(py, value)?;
+    match decoder {
+        Some(decoder) => decoder.call1(py, (bytes,)),
+        None => Ok(bytes),
+    }
+}
+
+/// Copy a bytes-like object into an owned buffer with a single memcpy.
+/// `bytes` and `bytearray` are read straight from their storage, any other buffer
+/// (e.g. `memoryview`) goes through `bytes()` first, the buffer API isn't part of abi3-py38
+fn bytes_like_to_vec(data: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    if let Ok(bytes) = data.cast::<PyBytes>() {
+        return Ok(bytes.as_bytes().to_vec());
+    }
+    if let Ok(array) = data.cast::<PyByteArray>() {
+        return Ok(array.to_vec());
+    }
+    let bytes = data.py().get_type::<PyBytes>().call1((data,))?;
+    Ok(bytes.cast_into::<PyBytes>()?.as_bytes().to_vec())
+}
+
+/// Convert a candle price (`Decimal`) to `f64`
+fn to_f64<T: TryInto<f64>>(value: T) -> f64 {
+    value.try_into().unwrap_or(f64::NAN)
+}
+
+/// Split candles into native endian `f64` columns `(timestamp, open, high, low, close)`,
+/// each one returned as python `bytes` so numpy can view it with `np.frombuffer` without copying.
+fn candles_to_columns(py: Python<'_>, candles: &[Candle]) -> PyResult<Py<PyAny>> {
+    let mut columns: [Vec<u8>; 5] = std::array::from_fn(|_| Vec::with_capacity(candles.len() * 8));
+    for candle in candles {
+        let values = [
+            candle.timestamp,
+            to_f64(candle.open),
+            to_f64(candle.high),
+            to_f64(candle.low),
+            to_f64(candle.close),
+        ];
+        for (column, value) in columns.iter_mut().zip(values) {
+            column.extend_from_slice(&value.to_ne_bytes());
+        }
+    }
+    let [timestamp, open, high, low, close] = columns;
+    (
+        PyBytes::new(py, &timestamp),
+        PyBytes::new(py, &open),
+        PyBytes::new(py, &high),
+        PyBytes::new(py, &low),
+        PyBytes::new(py, &close),
+    )
+        .into_py_any(py)
+}
+
+/// Build the python dict of a candle directly, with the same keys and values `json.loads`
+/// would give for its JSON form, skipping the serialize / parse round trip.
+fn candle_to_dict(py: Python<'_>, candle: &Candle) -> PyResult<Py<PyAny>> {
+    let dict = PyDict::new(py);
+    dict.set_item("symbol", &candle.symbol)?;
+    dict.set_item("timestamp", candle.timestamp)?;
+    dict.set_item("open", to_f64(candle.open))?;
+    dict.set_item("high", to_f64(candle.high))?;
+    dict.set_item("low", to_f64(candle.low))?;
+    dict.set_item("close", to_f64(candle.close))?;
+    dict.set_item("volume", candle.volume.map(to_f64))?;
+    dict.into_py_any(py)
+}
+
+/// Convert a streamed candle into the python object the iterator was configured for
+fn candle_to_py(
+    py: Python<'_>,
+    candle: &Candle,
+    dicts: bool,
+    decoder: Option<&Py<PyAny>>,
+) -> PyResult<Py<PyAny>> {
+    if dicts {
+        candle_to_dict(py, candle)
+    } else {
+        decode_json(py, candle, decoder)
+    }
+}
+
+/// Convert a batch of streamed candles into a python list, see `candle_to_py`
+fn candles_to_list(
+    py: Python<'_>,
+    candles: &[Candle],
+    dicts: bool,
+    decoder: Option<&Py<PyAny>>,
+) -> PyResult<Py<PyAny>> {
+    let items = candles
+        .iter()
+        .map(|candle| candle_to_py(py, candle, dicts, decoder))
+        .collect::<PyResult<Vec<_>>>()?;
+    items.into_py_any(py)
+}
+
+/// Extract `key` from a socket.io frame, either from the payload of an event
+/// (`42["event", {"key": ...}]`) or from a bare JSON object (`{"key": ...}`).
+/// `quoted_key` is `key` wrapped in double quotes, frames that don't contain it are
+/// rejected with a substring search before paying for a JSON parse.
+fn extract_event_field(msg: &tungstenite::Message, key: &str, quoted_key: &str) -> Option<Value> {
+    extract_event_payload(msg, quoted_key)?.remove(key)
+}
+
+/// Parse the data object of a socket.io frame (`42["event", {...}]` or `{...}`),
+/// frames that don't contain `quoted_key` are skipped without parsing.
+fn extract_event_payload(msg: &tungstenite::Message, quoted_key: &str) -> Option<Map<String, Value>> {
+    let text = msg.to_text().ok()?;
+    if !text.contains(quoted_key) {
+        return None;
+    }
+    let raw = text.strip_prefix("42").unwrap_or(text);
+    match serde_json::from_str::<Value>(raw).ok()? {
+        Value::Array(mut items) if items.len() > 1 => match items.swap_remove(1) {
+            Value::Object(map) => Some(map),
+            _ => None,
+        },
+        Value::Object(map) => Some(map),
+        _ => None,
+    }
+}
+
 /// Send a raw message and wait for the response
 async fn send_raw_message_and_wait(
     client: &PocketOption,
@@ -74,6 +213,10 @@ pub struct RawPocketOption {
 #[pyclass]
 pub struct StreamIterator {
     stream: Arc<Mutex<Fuse<BoxStream<'static, PocketResult<Candle>>>>>,
+    // Optional python callable applied to the JSON bytes of every item
+    decoder: Option<Arc<Py<PyAny>>>,
+    // Yield python dicts built directly from the candles instead of JSON
+    dicts: bool,
 }
 
 #[pyclass]
@@ -102,8 +245,32 @@ impl RawHandlerRust {
         })
     }
 
-    /// Send a binary message through this handler
-    pub fn send_binary<'py>(&self, py: Python<'py>, data: Vec<u8>) -> PyResult<Bound<'py, PyAny>> {
+    /// Send several text messages through this handler, flushed to the socket together
+    pub fn send_text_batched<'py>(
+        &self,
+        py: Python<'py>,
+        messages: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let handler = self.handler.clone();
+        future_into_py(py, async move {
+            handler
+                .lock()
+                .await
+                .send_text_batch(messages)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Ok(())
+        })
+    }
+
+    /// Send a binary message through this handler, `data` can be any bytes-like object
+    pub fn send_binary<'py>(
+        &self,
+        py: Python<'py>,
+        data: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        // Extracting `Vec<u8>` walks the object as a sequence of ints, copy the storage instead
+        let data = bytes_like_to_vec(data)?;
         let handler = self.handler.clone();
         future_into_py(py, async move {
             handler
@@ -132,6 +299,48 @@ impl RawHandlerRust {
         })
     }
 
+    /// Send several messages in one flush and wait for one response per `(message, validator)`
+    /// pair, returns the responses in the order of the requests
+    pub fn send_and_wait_many<'py>(
+        &self,
+        py: Python<'py>,
+        requests: Vec<(String, RawValidator)>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let handler = self.handler.clone();
+        future_into_py(py, async move {
+            let requests: Vec<_> = requests
+                .into_iter()
+                .map(|(message, validator)| {
+                    let outgoing =
+                        binary_options_tools::pocketoption::modules::raw::Outgoing::Text(message);
+                    (outgoing, CrateValidator::from(validator))
+                })
+                .collect();
+            let responses = handler
+                .lock()
+                .await
+                .send_and_wait_many(requests)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            let responses: Vec<String> = responses.iter().map(arc_message_to_string).collect();
+            Python::attach(|py| responses.into_py_any(py))
+        })
+    }
+
+    /// Unregister this handler so it stops receiving messages
+    pub fn close<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let handler = self.handler.clone();
+        future_into_py(py, async move {
+            handler
+                .lock()
+                .await
+                .close()
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Ok(())
+        })
+    }
+
     /// Wait for the next matching message
     pub fn wait_next<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let handler = self.handler.clone();
@@ -147,6 +356,67 @@ impl RawHandlerRust {
         })
     }
 
+    /// Wait for the first matching message that carries `key` and return its value as JSON bytes.
+    /// Frames are parsed and filtered on the Rust side, only the extracted value crosses into Python.
+    /// Returns `None` if the handler stream closes before such a message arrives.
+    pub fn wait_for_key<'py>(&self, py: Python<'py>, key: String) -> PyResult<Bound<'py, PyAny>> {
+        let handler = self.handler.clone();
+        let quoted_key = format!("\"{key}\"");
+        future_into_py(py, async move {
+            let receiver = {
+                let handler_guard = handler.lock().await;
+                handler_guard.subscribe()
+            };
+            while let Ok(msg) = receiver.recv().await {
+                if let Some(value) = extract_event_field(&msg, &key, &quoted_key) {
+                    return Python::attach(|py| to_json_bytes(py, &value));
+                }
+            }
+            Python::attach(|py| py.None().into_py_any(py))
+        })
+    }
+
+    /// Wait for one message carrying `key` per asset in `assets`, matched on the payload's
+    /// `asset` field. Returns JSON bytes of `{asset: value}` with every asset that answered
+    /// within `timeout_secs`.
+    pub fn wait_for_assets<'py>(
+        &self,
+        py: Python<'py>,
+        key: String,
+        assets: Vec<String>,
+        timeout_secs: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let handler = self.handler.clone();
+        let quoted_key = format!("\"{key}\"");
+        future_into_py(py, async move {
+            let receiver = {
+                let handler_guard = handler.lock().await;
+                handler_guard.subscribe()
+            };
+            let mut pending: HashSet<String> = assets.into_iter().collect();
+            let mut found: HashMap<String, Value> = HashMap::with_capacity(pending.len());
+            let deadline = tokio::time::Instant::now() + Duration::from_secs(timeout_secs);
+            while !pending.is_empty() {
+                let msg = match tokio::time::timeout_at(deadline, receiver.recv()).await {
+                    Ok(Ok(msg)) => msg,
+                    _ => break,
+                };
+                let Some(mut payload) = extract_event_payload(&msg, &quoted_key) else {
+                    continue;
+                };
+                let Some(asset) = payload.get("asset").and_then(Value::as_str).map(str::to_owned) else {
+                    continue;
+                };
+                if pending.remove(&asset) {
+                    if let Some(value) = payload.remove(&key) {
+                        found.insert(asset, value);
+                    }
+                }
+            }
+            Python::attach(|py| to_json_bytes(py, &found))
+        })
+    }
+
     /// Subscribe to messages matching this handler's validator
     pub fn subscribe<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let handler = self.handler.clone();
@@ -173,12 +443,9 @@ impl RawHandlerRust {
 
     /// Get the handler's unique ID
     pub fn id(&self, py: Python<'_>) -> PyResult<String> {
-        let runtime = get_runtime(py)?;
         let handler = self.handler.clone();
-        runtime.block_on(async move {
-            let handler_guard = handler.lock().await;
-            Ok(handler_guard.id().to_string())
-        })
+        // Waits for the handler lock, which an in flight `send_and_wait` may hold
+        block_on_detached(py, async move { handler.lock().await.id().to_string() })
     }
 }
 
@@ -187,29 +454,38 @@ impl RawPocketOption {
     #[new]
     #[pyo3(signature = (ssid))]
     pub fn new(ssid: String, py: Python<'_>) -> PyResult<Self> {
-        let runtime = get_runtime(py)?;
-        runtime.block_on(async move {
+        // Connecting can take seconds, other python threads keep running meanwhile
+        block_on_detached(py, async move {
             let client = PocketOption::new(ssid).await.map_err(BinaryErrorPy::from)?;
             Ok(Self { client })
-        })
+        })?
     }
 
     #[staticmethod]
     #[pyo3(signature = (ssid, url))]
     pub fn new_with_url(py: Python<'_>, ssid: String, url: String) -> PyResult<Self> {
-        let runtime = get_runtime(py)?;
-        runtime.block_on(async move {
+        block_on_detached(py, async move {
             let client = PocketOption::new_with_url(ssid, url)
                 .await
                 .map_err(BinaryErrorPy::from)?;
             Ok(Self { client })
-        })
+        })?
     }
 
     pub fn is_demo(&self) -> bool {
         self.client.is_demo()
     }
 
+    /// Wait until the client is connected and the assets were received,
+    /// resolves to `false` if that didn't happen within `timeout_secs`
+    pub fn wait_ready<'py>(&self, py: Python<'py>, timeout_secs: f64) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let timeout = Duration::try_from_secs_f64(timeout_secs).unwrap_or(Duration::MAX);
+            Ok(tokio::time::timeout(timeout, client.wait_ready()).await.is_ok())
+        })
+    }
+
     pub fn buy<'py>(
         &self,
         py: Python<'py>,
@@ -223,9 +499,10 @@ impl RawPocketOption {
                 .buy(asset, time, amount)
                 .await
                 .map_err(BinaryErrorPy::from)?;
-            let deal = serde_json::to_string(&res.1).map_err(BinaryErrorPy::from)?;
-            let result = vec![res.0.to_string(), deal];
-            Python::attach(|py| result.into_py_any(py))
+            Python::attach(|py| {
+                let deal = to_json_bytes(py, &res.1)?;
+                (res.0.to_string(), deal).into_py_any(py)
+            })
         })
     }
 
@@ -242,9 +519,10 @@ impl RawPocketOption {
                 .sell(asset, time, amount)
                 .await
                 .map_err(BinaryErrorPy::from)?;
-            let deal = serde_json::to_string(&res.1).map_err(BinaryErrorPy::from)?;
-            let result = vec![res.0.to_string(), deal];
-            Python::attach(|py| result.into_py_any(py))
+            Python::attach(|py| {
+                let deal = to_json_bytes(py, &res.1)?;
+                (res.0.to_string(), deal).into_py_any(py)
+            })
         })
     }
 
@@ -255,11 +533,19 @@ impl RawPocketOption {
                 .result(Uuid::parse_str(&trade_id).map_err(BinaryErrorPy::from)?)
                 .await
                 .map_err(BinaryErrorPy::from)?;
-            Python::attach(|py| {
-                serde_json::to_string(&res)
-                    .map_err(BinaryErrorPy::from)?
-                    .into_py_any(py)
-            })
+            Python::attach(|py| to_json_bytes(py, &res))
+        })
+    }
+
+    /// Like `check_win` but only returns the trade's profit, without serializing the deal
+    pub fn check_win_profit<'py>(&self, py: Python<'py>, trade_id: String) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .result(Uuid::parse_str(&trade_id).map_err(BinaryErrorPy::from)?)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Ok(res.profit)
         })
     }
 
@@ -302,11 +588,7 @@ impl RawPocketOption {
                 .get_candles(asset, period, offset)
                 .await
                 .map_err(BinaryErrorPy::from)?;
-            Python::attach(|py| {
-                serde_json::to_string(&res)
-                    .map_err(BinaryErrorPy::from)?
-                    .into_py_any(py)
-            })
+            Python::attach(|py| to_json_bytes(py, &res))
         })
     }
 
@@ -324,27 +606,49 @@ impl RawPocketOption {
                 .get_candles_advanced(asset, period, time, offset)
                 .await
                 .map_err(BinaryErrorPy::from)?;
-            Python::attach(|py| {
-                serde_json::to_string(&res)
-                    .map_err(BinaryErrorPy::from)?
-                    .into_py_any(py)
-            })
+            Python::attach(|py| to_json_bytes(py, &res))
+        })
+    }
+
+    /// Same as `get_candles_advanced` but returns the candles as columns, see `candles_to_columns`
+    pub fn get_candles_advanced_columns<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        period: i64,
+        offset: i64,
+        time: i64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .get_candles_advanced(asset, period, time, offset)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Python::attach(|py| candles_to_columns(py, &res))
         })
     }
 
-    pub async fn balance(&self) -> f64 {
-        self.client.balance().await
+    pub fn balance<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move { Ok(client.balance().await) })
     }
 
     pub fn closed_deals<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
         future_into_py(py, async move {
             let deals = client.get_closed_deals().await;
-            Python::attach(|py| {
-                serde_json::to_string(&deals)
-                    .map_err(BinaryErrorPy::from)?
-                    .into_py_any(py)
-            })
+            Python::attach(|py| to_json_bytes(py, &deals))
+        })
+    }
+
+    /// Opened and closed deals read together, as `{"open": {...}, "closed": {...}}`
+    pub fn deals_snapshot<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let (open, closed) = client.get_deals_snapshot().await;
+            let snapshot = HashMap::from([("open", open), ("closed", closed)]);
+            Python::attach(|py| to_json_bytes(py, &snapshot))
         })
     }
 
@@ -356,24 +660,36 @@ impl RawPocketOption {
         })
     }
 
-    pub async fn opened_deals(&self) -> PyResult<String> {
-        let deals = self.client.get_opened_deals().await;
-        Ok(serde_json::to_string(&deals).map_err(BinaryErrorPy::from)?)
+    pub fn opened_deals<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let deals = client.get_opened_deals().await;
+            Python::attach(|py| to_json_bytes(py, &deals))
+        })
     }
 
-    pub async fn payout(&self) -> PyResult<String> {
+    pub fn payout<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         // Work in progress - this feature is not yet implemented in the new API
-        match self.client.assets().await {
-            Some(assets) => {
-                let payouts: HashMap<&String, i32> = assets
-                    .0
-                    .iter()
-                    .filter_map(|(asset, symbol)| if symbol.is_active { Some((asset, symbol.payout)) } else { None })
-                    .collect();
-                Ok(serde_json::to_string(&payouts).map_err(BinaryErrorPy::from)?)
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            match client.assets().await {
+                Some(assets) => {
+                    let payouts: HashMap<&String, i32> = assets
+                        .0
+                        .iter()
+                        .filter_map(|(asset, symbol)| if symbol.is_active { Some((asset, symbol.payout)) } else { None })
+                        .collect();
+                    Python::attach(|py| to_json_bytes(py, &payouts))
+                }
+                None => Err(BinaryErrorPy::Uninitialized("Assets not initialized yet.".into()).into()),
             }
-            None => Err(BinaryErrorPy::Uninitialized("Assets not initialized yet.".into()).into()),
-        }
+        })
+    }
+
+    /// Payout of a single active asset, `None` if it's unknown or inactive
+    pub fn payout_for<'py>(&self, py: Python<'py>, asset: String) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move { Ok(client.payout_for(&asset).await) })
     }
 
     pub fn history<'py>(
@@ -382,18 +698,32 @@ impl RawPocketOption {
         asset: String,
         period: u32,
     ) -> PyResult<Bound<'py, PyAny>> {
-        // Work in progress - this feature is not yet implemented in the new API
+        // The server response is parsed on the runtime, without the GIL, and the candles
+        // become dicts directly instead of being serialized again for `json.loads`
         let client = self.client.clone();
         future_into_py(py, async move {
             let res = client
                 .history(asset, period)
                 .await
                 .map_err(BinaryErrorPy::from)?;
-            Python::attach(|py| {
-                serde_json::to_string(&res)
-                    .map_err(BinaryErrorPy::from)?
-                    .into_py_any(py)
-            })
+            Python::attach(|py| candles_to_list(py, &res, true, None))
+        })
+    }
+
+    /// Same as `history` but returns the candles as columns, see `candles_to_columns`
+    pub fn history_columns<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        period: u32,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .history(asset, period)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Python::attach(|py| candles_to_columns(py, &res))
         })
     }
 
@@ -412,7 +742,43 @@ impl RawPocketOption {
             let boxed_stream = subscription.to_stream().boxed().fuse();
             let stream = Arc::new(Mutex::new(boxed_stream));
 
-            Python::attach(|py| StreamIterator { stream }.into_py_any(py))
+            Python::attach(|py| {
+                StreamIterator {
+                    stream,
+                    decoder: None,
+                    dicts: false,
+                }
+                .into_py_any(py)
+            })
+        })
+    }
+
+    /// Subscribe to several symbols at once, returns a dict of `symbol -> StreamIterator`
+    pub fn subscribe_many<'py>(
+        &self,
+        py: Python<'py>,
+        symbols: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let subscriptions = client
+                .subscribe_many(symbols.clone(), SubscriptionType::none())
+                .await
+                .map_err(BinaryErrorPy::from)?;
+
+            Python::attach(|py| {
+                let dict = PyDict::new(py);
+                for (symbol, subscription) in symbols.into_iter().zip(subscriptions) {
+                    let stream = Arc::new(Mutex::new(subscription.to_stream().boxed().fuse()));
+                    let iterator = StreamIterator {
+                        stream,
+                        decoder: None,
+                        dicts: false,
+                    };
+                    dict.set_item(symbol, iterator.into_py_any(py)?)?;
+                }
+                dict.into_py_any(py)
+            })
         })
     }
 
@@ -432,7 +798,14 @@ impl RawPocketOption {
             let boxed_stream = subscription.to_stream().boxed().fuse();
             let stream = Arc::new(Mutex::new(boxed_stream));
 
-            Python::attach(|py| StreamIterator { stream }.into_py_any(py))
+            Python::attach(|py| {
+                StreamIterator {
+                    stream,
+                    decoder: None,
+                    dicts: false,
+                }
+                .into_py_any(py)
+            })
         })
     }
 
@@ -452,7 +825,14 @@ impl RawPocketOption {
             let boxed_stream = subscription.to_stream().boxed().fuse();
             let stream = Arc::new(Mutex::new(boxed_stream));
 
-            Python::attach(|py| StreamIterator { stream }.into_py_any(py))
+            Python::attach(|py| {
+                StreamIterator {
+                    stream,
+                    decoder: None,
+                    dicts: false,
+                }
+                .into_py_any(py)
+            })
         })
     }
 
@@ -475,7 +855,14 @@ impl RawPocketOption {
             let boxed_stream = subscription.to_stream().boxed().fuse();
             let stream = Arc::new(Mutex::new(boxed_stream));
 
-            Python::attach(|py| StreamIterator { stream }.into_py_any(py))
+            Python::attach(|py| {
+                StreamIterator {
+                    stream,
+                    decoder: None,
+                    dicts: false,
+                }
+                .into_py_any(py)
+            })
         })
     }
 
@@ -486,14 +873,32 @@ impl RawPocketOption {
     ) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
         future_into_py(py, async move {
-            // Create a raw handler with a simple validator that matches everything
-            let handler = client
-                .create_raw_handler(Validator::None, None)
+            // Send the raw message without waiting for a response (or registering a handler)
+            client
+                .raw_handle()
+                .await
+                .map_err(BinaryErrorPy::from)?
+                .send_text_batch([message])
                 .await
                 .map_err(BinaryErrorPy::from)?;
-            // Send the raw message without waiting for a response
-            handler
-                .send_text(message)
+            Ok(())
+        })
+    }
+
+    /// Send several raw messages, the frames are queued back to back and flushed to the
+    /// websocket together. They go through the raw module's sender, no handler is registered
+    pub fn send_raw_messages<'py>(
+        &self,
+        py: Python<'py>,
+        messages: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client
+                .raw_handle()
+                .await
+                .map_err(BinaryErrorPy::from)?
+                .send_text_batch(messages)
                 .await
                 .map_err(BinaryErrorPy::from)?;
             Ok(())
@@ -735,22 +1140,57 @@ impl StreamIterator {
         slf
     }
 
+    /// Set a callable (like `json.loads`) that every item's JSON bytes are passed through
+    /// before being returned, so python wrappers don't need their own `__anext__`
+    fn with_decoder(mut slf: PyRefMut<'_, Self>, decoder: Py<PyAny>) -> PyRefMut<'_, Self> {
+        slf.decoder = Some(Arc::new(decoder));
+        slf
+    }
+
+    /// Yield every candle as a python dict built on the Rust side, no JSON involved
+    fn as_dicts(mut slf: PyRefMut<'_, Self>) -> PyRefMut<'_, Self> {
+        slf.dicts = true;
+        slf
+    }
+
     fn __anext__<'py>(&'py mut self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let stream = self.stream.clone();
+        let decoder = self.decoder.clone();
+        let dicts = self.dicts;
         future_into_py(py, async move {
-            let res = next_stream(stream, false).await;
-            res.map(|res| serde_json::to_string(&res).unwrap_or_default())
+            let candle = next_stream(stream, false).await?;
+            Python::attach(|py| candle_to_py(py, &candle, dicts, decoder.as_deref()))
         })
     }
 
-    fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<String> {
-        let runtime = get_runtime(py)?;
+    fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<Py<PyAny>> {
+        let stream = self.stream.clone();
+        let candle = block_on_detached(py, next_stream(stream, true))??;
+        candle_to_py(py, &candle, self.dicts, self.decoder.as_deref())
+    }
+
+    /// Async version of `next_batch`
+    #[pyo3(signature = (max = 64, timeout_ms = 0))]
+    fn anext_batch<'py>(&self, py: Python<'py>, max: usize, timeout_ms: u64) -> PyResult<Bound<'py, PyAny>> {
         let stream = self.stream.clone();
-        runtime.block_on(async move {
-            let res = next_stream(stream, true).await;
-            res.map(|res| serde_json::to_string(&res).unwrap_or_default())
+        let decoder = self.decoder.clone();
+        let dicts = self.dicts;
+        future_into_py(py, async move {
+            let candles = next_stream_batch(stream, max, Duration::from_millis(timeout_ms), false).await?;
+            Python::attach(|py| candles_to_list(py, &candles, dicts, decoder.as_deref()))
         })
     }
+
+    /// Wait for the next candle, then keep taking candles (up to `max` in total) while new
+    /// ones arrive within `timeout_ms`, and return all of them as one list.
+    /// Streams with many buffered candles cross into python once per batch instead of once per candle.
+    #[pyo3(signature = (max = 64, timeout_ms = 0))]
+    fn next_batch<'py>(&self, py: Python<'py>, max: usize, timeout_ms: u64) -> PyResult<Py<PyAny>> {
+        let stream = self.stream.clone();
+        let timeout = Duration::from_millis(timeout_ms);
+        let candles = block_on_detached(py, next_stream_batch(stream, max, timeout, true))??;
+        candles_to_list(py, &candles, self.dicts, self.decoder.as_deref())
+    }
 }
 
 #[pymethods]
@@ -772,11 +1212,7 @@ impl RawStreamIterator {
     }
 
     fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<String> {
-        let runtime = get_runtime(py)?;
         let stream = self.stream.clone();
-        runtime.block_on(async move {
-            let res = next_stream(stream, true).await;
-            res.map(|s| s)
-        })
+        block_on_detached(py, next_stream(stream, true))?
     }
 }
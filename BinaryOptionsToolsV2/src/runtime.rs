@@ -1,3 +1,4 @@
+use std::future::Future;
 use std::sync::Arc;
 
 use pyo3::exceptions::PyValueError;
@@ -16,3 +17,14 @@ pub(crate) fn get_runtime(py: Python<'_>) -> PyResult<Arc<Runtime>> {
     })?;
     Ok(runtime.clone())
 }
+
+/// Block on `future` with the GIL released, so other python threads keep running while the
+/// calling thread waits on the runtime (no python event loop is involved)
+pub(crate) fn block_on_detached<F>(py: Python<'_>, future: F) -> PyResult<F::Output>
+where
+    F: Future + Send,
+    F::Output: Send,
+{
+    let runtime = get_runtime(py)?;
+    Ok(py.detach(|| runtime.block_on(future)))
+}
@@ -1,4 +1,5 @@
 use std::sync::Arc;
+use std::time::Duration;
 
 use futures_util::{
     StreamExt,
@@ -34,3 +35,28 @@ where
         },
     }
 }
+
+/// Like `next_stream`, but once the first item arrived keeps collecting items until `max`
+/// items were gathered or no new item arrived within `timeout` (items already buffered are
+/// always taken, even with a zero timeout). An error after the first item ends the batch early.
+pub async fn next_stream_batch<T, E>(
+    stream: Arc<Mutex<PyStream<T, E>>>,
+    max: usize,
+    timeout: Duration,
+    sync: bool,
+) -> PyResult<Vec<T>>
+where
+    E: std::error::Error,
+{
+    let first = next_stream(stream.clone(), sync).await?;
+    let mut items = Vec::with_capacity(max.max(1));
+    items.push(first);
+    let mut stream = stream.lock().await;
+    while items.len() < max {
+        match tokio::time::timeout(timeout, stream.next()).await {
+            Ok(Some(Ok(item))) => items.push(item),
+            _ => break,
+        }
+    }
+    Ok(items)
+}
@@ -1,6 +1,7 @@
 #![allow(dead_code)]
 
-use std::sync::Arc;
+use std::collections::HashMap;
+use std::sync::{Arc, LazyLock, Mutex};
 
 use pyo3::{
     Bound, PyResult, pyclass, pymethods, Py, PyAny,
@@ -13,6 +14,51 @@ use binary_options_tools::traits::ValidatorTrait;
 use binary_options_tools::validator::Validator as CrateValidator;
 use pyo3::Python;
 
+/// Compiled regexes keyed by pattern, `Regex` clones share the compiled program
+/// so validators built from the same pattern only compile it once
+static REGEX_CACHE: LazyLock<Mutex<HashMap<String, Regex>>> = LazyLock::new(Default::default);
+const REGEX_CACHE_SIZE: usize = 256;
+
+/// Key of an entry in `COMPILED_CACHE`
+#[derive(PartialEq, Eq, Hash)]
+enum CompiledKey {
+    Contains(String),
+    Dfa(String),
+}
+
+/// Crate validators that are costly to build (the `memmem` searcher of `contains`, the dense
+/// DFA of `regex(dfa=True)`), a `RawValidator` is converted on every `check` and every handler
+/// creation so equal validators reuse the compiled one instead of building it again
+static COMPILED_CACHE: LazyLock<Mutex<HashMap<CompiledKey, CrateValidator>>> =
+    LazyLock::new(Default::default);
+const COMPILED_CACHE_SIZE: usize = 256;
+
+fn cached_compiled(key: CompiledKey, build: impl FnOnce() -> CrateValidator) -> CrateValidator {
+    let mut cache = COMPILED_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(validator) = cache.get(&key) {
+        return validator.clone();
+    }
+    let validator = build();
+    if cache.len() >= COMPILED_CACHE_SIZE {
+        cache.clear();
+    }
+    cache.insert(key, validator.clone());
+    validator
+}
+
+fn cached_regex(pattern: String) -> Result<Regex, regex::Error> {
+    let mut cache = REGEX_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(regex) = cache.get(&pattern) {
+        return Ok(regex.clone());
+    }
+    let regex = Regex::new(&pattern)?;
+    if cache.len() >= REGEX_CACHE_SIZE {
+        cache.clear();
+    }
+    cache.insert(pattern, regex.clone());
+    Ok(regex)
+}
+
 #[pyclass]
 #[derive(Clone)]
 pub struct ArrayValidator(Vec<RawValidator>);
@@ -25,6 +71,7 @@ pub struct BoxedValidator(Box<RawValidator>);
 #[derive(Clone)]
 pub struct RegexValidator {
     regex: Regex,
+    dfa: bool,
 }
 
 #[pyclass]
@@ -48,9 +95,9 @@ pub enum RawValidator {
 }
 
 impl RawValidator {
-    pub fn new_regex(regex: String) -> BinaryResultPy<Self> {
-        let regex = Regex::new(&regex)?;
-        Ok(Self::Regex(RegexValidator { regex }))
+    pub fn new_regex(regex: String, dfa: bool) -> BinaryResultPy<Self> {
+        let regex = cached_regex(regex)?;
+        Ok(Self::Regex(RegexValidator { regex, dfa }))
     }
 
     pub fn new_all(validators: Vec<RawValidator>) -> Self {
@@ -117,8 +164,9 @@ impl RawValidator {
     }
 
     #[staticmethod]
-    pub fn regex(pattern: String) -> PyResult<Self> {
-        Ok(Self::new_regex(pattern)?)
+    #[pyo3(signature = (pattern, dfa = false))]
+    pub fn regex(pattern: String, dfa: bool) -> PyResult<Self> {
+        Ok(Self::new_regex(pattern, dfa)?)
     }
 
     #[staticmethod]
@@ -161,12 +209,8 @@ impl RawValidator {
         })
     }
 
-    pub fn check(&self, _msg: String) -> bool {
-        // TODO: Restore validation logic when the new API supports it
-        // For now, return true as a placeholder
-        true
-        // let raw = RawWebsocketMessage::from(msg);
-        // self.validate(&raw)
+    pub fn check(&self, msg: String) -> bool {
+        CrateValidator::from(self.clone()).call(&msg)
     }
 }
 
@@ -174,23 +218,33 @@ impl From<RawValidator> for CrateValidator {
     fn from(validator: RawValidator) -> Self {
         match validator {
             RawValidator::None() => CrateValidator::None,
-            RawValidator::Regex(regex_validator) => CrateValidator::Regex(regex_validator.regex),
+            RawValidator::Regex(regex_validator) => match regex_validator.dfa {
+                true => cached_compiled(
+                    CompiledKey::Dfa(regex_validator.regex.as_str().to_owned()),
+                    || CrateValidator::regex_dfa(regex_validator.regex),
+                ),
+                false => CrateValidator::Regex(regex_validator.regex),
+            },
             RawValidator::StartsWith(prefix) => CrateValidator::StartsWith(prefix),
             RawValidator::EndsWith(suffix) => CrateValidator::EndsWith(suffix),
-            RawValidator::Contains(substring) => CrateValidator::Contains(substring),
+            RawValidator::Contains(substring) => {
+                cached_compiled(CompiledKey::Contains(substring.clone()), || {
+                    CrateValidator::contains(substring)
+                })
+            }
             RawValidator::All(array_validator) => {
                 let validators: Vec<CrateValidator> =
                     array_validator.0.into_iter().map(|v| v.into()).collect();
-                CrateValidator::All(Box::new(validators))
+                CrateValidator::all(validators)
             }
             RawValidator::Any(array_validator) => {
                 let validators: Vec<CrateValidator> =
                     array_validator.0.into_iter().map(|v| v.into()).collect();
-                CrateValidator::Any(Box::new(validators))
+                CrateValidator::any(validators)
             }
             RawValidator::Not(boxed_validator) => {
                 let validator: CrateValidator = (*boxed_validator.0).into();
-                CrateValidator::Not(Box::new(validator))
+                CrateValidator::negate(validator)
             }
             RawValidator::Custom(py_custom) => {
                 // Create a custom validator that calls the Python function
@@ -364,15 +364,16 @@ impl SubscriptionType {
                 candle.low = candle.low.min(new_candle.low);
                 candle.close = new_candle.close;
 
-                let elapsed = (new_candle.timestamp()
-                    - DateTime::from_timestamp(start_time.unwrap() as i64, 0)
-                        .unwrap_or_else(Utc::now))
-                .to_std()
-                .map_err(|_| {
-                    PocketError::General("Time calculation error in conditional update".to_string())
-                })?;
-
-                if elapsed >= *duration {
+                // Plain float math instead of going through chrono for every tick, with the
+                // start truncated to whole seconds like before
+                let elapsed = new_candle.timestamp - start_time.unwrap().trunc();
+                if elapsed < 0.0 {
+                    return Err(PocketError::General(
+                        "Time calculation error in conditional update".to_string(),
+                    ));
+                }
+
+                if elapsed >= duration.as_secs_f64() {
                     *start_time = None; // Reset for next period
                     Ok(Some(candle.clone()))
                 } else {
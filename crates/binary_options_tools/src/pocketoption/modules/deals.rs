@@ -13,6 +13,7 @@ use binary_options_tools_core_pre::{
     traits::{ApiModule, Rule},
 };
 use serde::Deserialize;
+use tokio::select;
 use tracing::info;
 use uuid::Uuid;
 
@@ -20,6 +21,7 @@ use crate::pocketoption::{
     error::{PocketError, PocketResult},
     state::State,
     types::Deal,
+    utils::ResponseStash,
 };
 
 const UPDATE_OPENED_DEALS: &str = r#"451-["updateOpenedDeals","#;
@@ -55,6 +57,8 @@ struct CloseOrder {
 pub struct DealsHandle {
     sender: AsyncSender<Command>,
     receiver: AsyncReceiver<CommandResponse>,
+    /// Results received by a clone that was waiting for another trade
+    stash: Arc<ResponseStash<Uuid, CommandResponse>>,
 }
 
 impl DealsHandle {
@@ -63,20 +67,7 @@ impl DealsHandle {
             .send(Command::CheckResult(trade_id))
             .await
             .map_err(CoreError::from)?;
-        loop {
-            match self.receiver.recv().await {
-                Ok(CommandResponse::CheckResult(deal)) => {
-                    if trade_id == deal.id {
-                        return Ok(*deal);
-                    } else {
-                        // If the request ID does not match, continue waiting for the correct response
-                        continue;
-                    }
-                }
-                Ok(CommandResponse::DealNotFound(id)) => return Err(PocketError::DealNotFound(id)),
-                Err(e) => return Err(CoreError::from(e).into()),
-            }
-        }
+        self.wait_result(trade_id).await
     }
 
     pub async fn check_result_with_timeout(
@@ -89,31 +80,39 @@ impl DealsHandle {
             .await
             .map_err(CoreError::from)?;
 
-        let timeout_future = tokio::time::sleep(timeout);
-        tokio::pin!(timeout_future);
+        tokio::time::timeout(timeout, self.wait_result(trade_id))
+            .await
+            .map_err(|_| PocketError::Timeout {
+                task: "check_result".to_string(),
+                context: format!("Waiting for trade '{trade_id}' result"),
+                duration: timeout,
+            })?
+    }
 
+    /// Waits for the response to a `CheckResult(trade_id)` command. Responses for other
+    /// trades are parked in the stash for their own waiters instead of being dropped.
+    async fn wait_result(&self, trade_id: Uuid) -> PocketResult<Deal> {
         loop {
-            tokio::select! {
-                result = self.receiver.recv() => {
-                    match result {
-                        Ok(CommandResponse::CheckResult(deal)) => {
-                            if trade_id == deal.id {
-                                return Ok(*deal);
-                            } else {
-                                // If the request ID does not match, continue waiting for the correct response
-                                continue;
-                            }
-                        },
-                        Ok(CommandResponse::DealNotFound(id)) => return Err(PocketError::DealNotFound(id)),
-                        Err(e) => return Err(CoreError::from(e).into()),
-                    }
+            let notified = self.stash.notified();
+            tokio::pin!(notified);
+            notified.as_mut().enable();
+            let response = match self.stash.take(&trade_id) {
+                Some(response) => response,
+                None => select! {
+                    result = self.receiver.recv() => result.map_err(CoreError::from)?,
+                    _ = &mut notified => continue,
+                },
+            };
+            match response {
+                CommandResponse::CheckResult(deal) if deal.id == trade_id => return Ok(*deal),
+                CommandResponse::DealNotFound(id) if id == trade_id => {
+                    return Err(PocketError::DealNotFound(id));
+                }
+                CommandResponse::CheckResult(deal) => {
+                    self.stash.put(deal.id, CommandResponse::CheckResult(deal))
                 }
-                _ = &mut timeout_future => {
-                    return Err(PocketError::Timeout {
-                        task: "check_result".to_string(),
-                        context: format!("Waiting for trade '{trade_id}' result"),
-                        duration: timeout,
-                    });
+                CommandResponse::DealNotFound(id) => {
+                    self.stash.put(id, CommandResponse::DealNotFound(id))
                 }
             }
         }
@@ -156,7 +155,11 @@ impl ApiModule<State> for DealsApiModule {
         sender: AsyncSender<Self::Command>,
         receiver: AsyncReceiver<Self::CommandResponse>,
     ) -> Self::Handle {
-        DealsHandle { sender, receiver }
+        DealsHandle {
+            sender,
+            receiver,
+            stash: Arc::default(),
+        }
     }
 
     async fn run(&mut self) -> binary_options_tools_core_pre::error::CoreResult<()> {
@@ -1,3 +1,4 @@
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::sync::Arc;
 
@@ -23,6 +24,15 @@ pub enum Outgoing {
     Binary(Vec<u8>),
 }
 
+/// Text view of a message for validators, binary frames are decoded lossily
+fn message_text(msg: &Message) -> Cow<'_, str> {
+    match msg {
+        Message::Binary(bin) => String::from_utf8_lossy(bin.as_ref()),
+        Message::Text(text) => Cow::Borrowed(text.as_str()),
+        _ => Cow::Borrowed(""),
+    }
+}
+
 /// Commands for RawApiModule
 #[derive(Debug)]
 pub enum Command {
@@ -95,6 +105,22 @@ impl RawHandle {
         }
     }
 
+    /// Queue text messages straight to the websocket without registering a handler, for
+    /// callers that only send and never wait for a response
+    pub async fn send_text_batch<I, S>(&self, texts: I) -> PocketResult<()>
+    where
+        I: IntoIterator<Item = S>,
+        S: Into<String>,
+    {
+        for text in texts {
+            self.sender
+                .send(Command::Send(Outgoing::Text(text.into())))
+                .await
+                .map_err(CoreError::from)?;
+        }
+        Ok(())
+    }
+
     /// Remove an existing handler by ID
     pub async fn remove(&self, id: Uuid) -> PocketResult<bool> {
         let command_id = Uuid::new_v4();
@@ -136,6 +162,21 @@ impl RawHandler {
         Ok(())
     }
 
+    /// Queue several text messages back to back, the connection writer flushes them together
+    pub async fn send_text_batch<I, S>(&self, texts: I) -> PocketResult<()>
+    where
+        I: IntoIterator<Item = S>,
+        S: Into<String>,
+    {
+        for text in texts {
+            self.sender
+                .send(Command::Send(Outgoing::Text(text.into())))
+                .await
+                .map_err(CoreError::from)?;
+        }
+        Ok(())
+    }
+
     pub async fn send_binary(&self, data: impl Into<Vec<u8>>) -> PocketResult<()> {
         self.sender
             .send(Command::Send(Outgoing::Binary(data.into())))
@@ -153,6 +194,39 @@ impl RawHandler {
         self.wait_next().await
     }
 
+    /// Send every message back to back (flushed to the socket together) and wait for one
+    /// response per message. Each message matching this handler's validator is given to the
+    /// first unanswered request whose validator accepts it, messages no request accepts are
+    /// skipped. Responses are returned in request order.
+    pub async fn send_and_wait_many(
+        &self,
+        requests: Vec<(Outgoing, Validator)>,
+    ) -> PocketResult<Vec<Arc<Message>>> {
+        let mut validators = Vec::with_capacity(requests.len());
+        for (msg, validator) in requests {
+            self.sender
+                .send(Command::Send(msg))
+                .await
+                .map_err(CoreError::from)?;
+            validators.push(validator);
+        }
+        let mut responses: Vec<Option<Arc<Message>>> = vec![None; validators.len()];
+        let mut pending = validators.len();
+        while pending > 0 {
+            let msg = self.wait_next().await?;
+            let text = message_text(&msg);
+            let unanswered = responses
+                .iter()
+                .zip(&validators)
+                .position(|(response, validator)| response.is_none() && validator.call(&text));
+            if let Some(index) = unanswered {
+                responses[index] = Some(msg.clone());
+                pending -= 1;
+            }
+        }
+        Ok(responses.into_iter().flatten().collect())
+    }
+
     /// Wait for next message that matches this handler's validator
     pub async fn wait_next(&self) -> PocketResult<Arc<Message>> {
         self.receiver
@@ -166,14 +240,27 @@ impl RawHandler {
     pub fn subscribe(&self) -> AsyncReceiver<Arc<Message>> {
         self.receiver.clone()
     }
+
+    /// Unregister this handler, the module stops matching and buffering messages for it
+    /// right away instead of when the handler is dropped
+    pub async fn close(&self) -> PocketResult<()> {
+        self.sender
+            .send(Command::Remove {
+                id: self.id,
+                command_id: Uuid::nil(),
+            })
+            .await
+            .map_err(CoreError::from)?;
+        Ok(())
+    }
 }
 
 impl Drop for RawHandler {
     fn drop(&mut self) {
-        // best-effort removal
+        // best-effort removal, a nil command id means nobody waits for the response
         let _ = self.sender.as_sync().send(Command::Remove {
             id: self.id,
-            command_id: Uuid::new_v4(),
+            command_id: Uuid::nil(),
         });
     }
 }
@@ -269,7 +356,10 @@ impl ApiModule<State> for RawApiModule {
                             let existed_state = self.state.remove_raw_validator(&id);
                             let existed_sink = self.sinks.write().await.remove(&id).is_some();
                             self.keep_alive_msgs.write().await.remove(&id);
-                            self.command_responder.send(CommandResponse::Removed { command_id, id, existed: existed_state || existed_sink }).await?;
+                            // Removals by `RawHandler::close` / `drop` (nil id) have no waiter
+                            if !command_id.is_nil() {
+                                self.command_responder.send(CommandResponse::Removed { command_id, id, existed: existed_state || existed_sink }).await?;
+                            }
                         }
                         Command::Send(Outgoing::Text(text)) => {
                             self.to_ws_sender.send(Message::text(text)).await.map_err(CoreError::from)?;
@@ -211,6 +211,81 @@ impl SubscriptionsHandle {
         }
     }
 
+    /// Subscribe to several assets' real-time data streams at once.
+    ///
+    /// Every `Subscribe` command is queued before waiting for any response, so the
+    /// subscription frames go out back to back and are acknowledged in a single round
+    /// trip instead of one round trip per asset.
+    ///
+    /// # Arguments
+    /// * `assets` - The asset symbols to subscribe to
+    /// * `sub_type` - Subscription type used for every stream
+    ///
+    /// # Returns
+    /// * `PocketResult<Vec<SubscriptionStream>>` - One stream per asset, in the same order
+    ///
+    /// # Errors
+    /// * Returns the first error if any of the subscriptions fails, the subscriptions that
+    ///   succeeded are dropped (and so unsubscribed) in that case
+    pub async fn subscribe_many(
+        &self,
+        assets: Vec<String>,
+        sub_type: SubscriptionType,
+    ) -> PocketResult<Vec<SubscriptionStream>> {
+        let mut pending = HashMap::with_capacity(assets.len());
+        for (index, asset) in assets.iter().enumerate() {
+            let id = Uuid::new_v4();
+            pending.insert(id, index);
+            self.sender
+                .send(Command::Subscribe {
+                    asset: asset.clone(),
+                    command_id: id,
+                })
+                .await
+                .map_err(CoreError::from)?;
+        }
+
+        let mut receivers: Vec<Option<AsyncReceiver<StreamData>>> =
+            assets.iter().map(|_| None).collect();
+        let mut error = None;
+        while !pending.is_empty() {
+            match self.receiver.recv().await {
+                Ok(CommandResponse::SubscriptionSuccess {
+                    command_id,
+                    stream_receiver,
+                }) => {
+                    if let Some(index) = pending.remove(&command_id) {
+                        receivers[index] = Some(stream_receiver);
+                    }
+                }
+                Ok(CommandResponse::SubscriptionFailed { command_id, error: e }) => {
+                    if pending.remove(&command_id).is_some() && error.is_none() {
+                        error = Some(*e);
+                    }
+                }
+                Ok(_) => continue,
+                Err(e) => return Err(CoreError::from(e).into()),
+            }
+        }
+
+        let streams = assets
+            .into_iter()
+            .zip(receivers)
+            .filter_map(|(asset, receiver)| {
+                receiver.map(|receiver| SubscriptionStream {
+                    receiver,
+                    sender: self.sender.clone(),
+                    asset,
+                    sub_type: sub_type.clone(),
+                })
+            })
+            .collect();
+        match error {
+            Some(e) => Err(e),
+            None => Ok(streams),
+        }
+    }
+
     /// Unsubscribe from an asset's stream.
     ///
     /// # Arguments
@@ -1,4 +1,4 @@
-use std::{fmt::Debug, sync::Arc};
+use std::{fmt::Debug, sync::Arc, time::Duration};
 
 use async_trait::async_trait;
 use binary_options_tools_core_pre::{
@@ -15,6 +15,7 @@ use crate::pocketoption::{
     error::{PocketError, PocketResult},
     state::State,
     types::{Action, Deal, FailOpenOrder, MultiPatternRule, OpenOrder},
+    utils::ResponseStash,
 };
 
 /// Command enum for the `TradesApiModule`.
@@ -48,15 +49,47 @@ enum ServerResponse {
     Fail(Box<FailOpenOrder>),
 }
 
+/// How long `TradesHandle::trade` waits for the server to accept or reject an order
+const TRADE_TIMEOUT: Duration = Duration::from_secs(30);
+
+/// Key an order response is parked under. Successes echo the request id, failures only
+/// carry the asset and amount of the rejected order (the amount is compared in cents so
+/// the JSON round trip of the float doesn't matter)
+#[derive(Debug, PartialEq, Eq, Hash)]
+enum OrderKey {
+    Request(Uuid),
+    Order(String, i64),
+}
+
+impl OrderKey {
+    fn order(asset: &str, amount: f64) -> Self {
+        OrderKey::Order(asset.to_owned(), (amount * 100.0).round() as i64)
+    }
+
+    fn of(response: &CommandResponse) -> Self {
+        match response {
+            CommandResponse::Success { req_id, .. } => OrderKey::Request(*req_id),
+            CommandResponse::Error(fail) => OrderKey::order(&fail.asset, fail.amount),
+        }
+    }
+}
+
 /// Handle for interacting with the `TradesApiModule`.
 #[derive(Clone)]
 pub struct TradesHandle {
     sender: AsyncSender<Command>,
     receiver: AsyncReceiver<CommandResponse>,
+    /// Order responses received by a clone that was waiting for another order
+    stash: Arc<ResponseStash<OrderKey, CommandResponse>>,
 }
 
 impl TradesHandle {
-    /// Places a new trade.
+    /// Places a new trade, failing with `PocketError::Timeout` if the server doesn't
+    /// answer within `TRADE_TIMEOUT`.
+    ///
+    /// A rejection only carries the asset and amount of the order, so concurrent orders
+    /// with the same asset and amount should not be placed: one rejection could resolve
+    /// the wrong caller and leave the other waiting until the timeout.
     pub async fn trade(
         &self,
         asset: String,
@@ -64,11 +97,9 @@ impl TradesHandle {
         amount: f64,
         time: u32,
     ) -> PocketResult<Deal> {
-        // let order = OpenOrder::new(amount, asset, action, time, demo)
-        // Implement logic to create an OpenOrder and send the command.
-        // 1. Send `Command::OpenOrder`.
-        // 2. Await and return `CommandResponse::OpenOrder`.
         let id = Uuid::new_v4(); // Generate a unique request ID for this order
+        let order = OrderKey::order(&asset, amount);
+        let context = format!("Waiting for order '{id}' on '{asset}'");
         self.sender
             .send(Command::OpenOrder {
                 asset,
@@ -79,25 +110,47 @@ impl TradesHandle {
             })
             .await
             .map_err(CoreError::from)?;
+        tokio::time::timeout(TRADE_TIMEOUT, self.wait_order(OrderKey::Request(id), order))
+            .await
+            .map_err(|_| PocketError::Timeout {
+                task: "trade".to_string(),
+                context,
+                duration: TRADE_TIMEOUT,
+            })?
+    }
+
+    /// Waits for the response to one order: the success carrying its request id, or a
+    /// failure for its asset and amount. Responses of other in flight orders are parked in
+    /// the stash for their own waiters instead of being taken.
+    async fn wait_order(&self, request: OrderKey, order: OrderKey) -> PocketResult<Deal> {
         loop {
-            match self.receiver.recv().await {
-                Ok(CommandResponse::Success { req_id, deal }) => {
-                    if req_id == id {
-                        return Ok(*deal);
-                    } else {
-                        // If the request ID does not match, continue waiting for the correct response
-                        continue;
-                    }
-                }
-                Ok(CommandResponse::Error(fail)) => {
-                    return Err(PocketError::FailOpenOrder {
-                        error: fail.error,
-                        amount: fail.amount,
-                        asset: fail.asset,
-                    });
+            let notified = self.stash.notified();
+            tokio::pin!(notified);
+            notified.as_mut().enable();
+            let parked = self.stash.take(&request).or_else(|| self.stash.take(&order));
+            let response = match parked {
+                Some(response) => response,
+                None => select! {
+                    result = self.receiver.recv() => result.map_err(CoreError::from)?,
+                    _ = &mut notified => continue,
+                },
+            };
+            let key = OrderKey::of(&response);
+            if key != request && key != order {
+                // Deals without a request id (nil) have no waiter
+                if key != OrderKey::Request(Uuid::nil()) {
+                    self.stash.put(key, response);
                 }
-                Err(e) => return Err(CoreError::from(e).into()),
+                continue;
             }
+            return match response {
+                CommandResponse::Success { deal, .. } => Ok(*deal),
+                CommandResponse::Error(fail) => Err(PocketError::FailOpenOrder {
+                    error: fail.error,
+                    amount: fail.amount,
+                    asset: fail.asset,
+                }),
+            };
         }
     }
 
@@ -147,7 +200,11 @@ impl ApiModule<State> for TradesApiModule {
         sender: AsyncSender<Self::Command>,
         receiver: AsyncReceiver<Self::CommandResponse>,
     ) -> Self::Handle {
-        TradesHandle { sender, receiver }
+        TradesHandle {
+            sender,
+            receiver,
+            stash: Arc::default(),
+        }
     }
 
     async fn run(&mut self) -> CoreResult<()> {
@@ -238,12 +238,30 @@ impl PocketOption {
         self.trade(asset, Action::Put, time, amount).await
     }
 
+    /// Waits until the client is connected and the assets have been received,
+    /// which is the point where trading and subscription calls can be made.
+    pub async fn wait_ready(&self) {
+        self.client.wait_connected().await;
+        self.client.state.wait_assets().await;
+    }
+
     /// Gets the current server time.
     /// If the server time is not set, it returns None.
     pub async fn server_time(&self) -> DateTime<Utc> {
         self.client.state.get_server_datetime().await
     }
 
+    /// Gets the payout of a single active asset without cloning the whole assets map.
+    /// Returns `None` if the assets aren't loaded yet or the asset is unknown or inactive.
+    pub async fn payout_for(&self, asset: &str) -> Option<i32> {
+        let assets = self.client.state.assets.read().await;
+        assets
+            .as_ref()?
+            .get(asset)
+            .filter(|symbol| symbol.is_active)
+            .map(|symbol| symbol.payout)
+    }
+
     /// Gets the current assets.
     pub async fn assets(&self) -> Option<Assets> {
         let state = &self.client.state;
@@ -290,6 +308,11 @@ impl PocketOption {
     pub async fn get_closed_deals(&self) -> HashMap<Uuid, Deal> {
         self.client.state.trade_state.get_closed_deals().await
     }
+    /// Gets the currently opened and closed deals at once, see `TradeState::get_deals_snapshot`.
+    pub async fn get_deals_snapshot(&self) -> (HashMap<Uuid, Deal>, HashMap<Uuid, Deal>) {
+        self.client.state.trade_state.get_deals_snapshot().await
+    }
+
     /// Clears the currently closed deals.
     pub async fn clear_closed_deals(&self) {
         self.client.state.trade_state.clear_closed_deals().await
@@ -324,6 +347,25 @@ impl PocketOption {
         }
     }
 
+    /// Subscribes to several assets at once, see `SubscriptionsHandle::subscribe_many`.
+    /// Every asset is validated before any subscription is sent.
+    pub async fn subscribe_many(
+        &self,
+        assets: Vec<String>,
+        sub_type: SubscriptionType,
+    ) -> PocketResult<Vec<SubscriptionStream>> {
+        if let Some(handle) = self.client.get_handle::<SubscriptionsApiModule>().await
+            && let Some(available) = self.assets().await
+        {
+            if let Some(asset) = assets.iter().find(|asset| available.get(*asset).is_none()) {
+                return Err(PocketError::InvalidAsset(asset.clone()));
+            }
+            handle.subscribe_many(assets, sub_type).await
+        } else {
+            Err(BinaryOptionsError::General("SubscriptionsApiModule not found".into()).into())
+        }
+    }
+
     pub async fn unsubscribe(&self, asset: impl ToString) -> PocketResult<()> {
         if let Some(handle) = self.client.get_handle::<SubscriptionsApiModule>().await
             && let Some(assets) = self.assets().await
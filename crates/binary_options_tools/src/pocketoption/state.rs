@@ -4,7 +4,7 @@ use std::{
     collections::HashMap,
     sync::{Arc, RwLock as SyncRwLock},
 };
-use tokio::sync::RwLock;
+use tokio::sync::{Notify, RwLock};
 use uuid::Uuid;
 
 use binary_options_tools_core_pre::traits::AppState;
@@ -41,6 +41,8 @@ pub struct State {
     pub server_time: ServerTimeState,
     /// Assets information
     pub assets: RwLock<Option<Assets>>,
+    /// Notified every time the assets are set, see `wait_assets`
+    pub assets_notify: Notify,
     /// Holds the state for all trading-related data.
     pub trade_state: Arc<TradeState>,
     /// Holds the current validators for the raw module keyed by ID
@@ -102,6 +104,7 @@ impl StateBuilder {
             balance: RwLock::new(None),
             server_time: ServerTimeState::default(),
             assets: RwLock::new(None),
+            assets_notify: Notify::new(),
             trade_state: Arc::new(TradeState::default()),
             raw_validators: SyncRwLock::new(HashMap::new()),
         })
@@ -217,6 +220,24 @@ impl State {
     pub async fn set_assets(&self, assets: Assets) {
         let mut state = self.assets.write().await;
         *state = Some(assets);
+        drop(state);
+        self.assets_notify.notify_waiters();
+    }
+
+    /// Wait until the assets have been received at least once.
+    /// Returns immediately if they are already loaded.
+    pub async fn wait_assets(&self) {
+        loop {
+            // Register as a waiter before checking, so a `set_assets` between the
+            // check and the await isn't missed
+            let notified = self.assets_notify.notified();
+            tokio::pin!(notified);
+            notified.as_mut().enable();
+            if self.assets.read().await.is_some() {
+                return;
+            }
+            notified.await;
+        }
     }
 
     /// Adds or replaces a validator in the list of raw validators.
@@ -273,14 +294,12 @@ impl TradeState {
     pub async fn update_closed_deals(&self, deals: Vec<Deal>) {
         // TODO: Implement the logic to update opened and closed deal maps.
         let ids = deals.iter().map(|deal| deal.id).collect::<Vec<_>>();
-        self.opened_deals
-            .write()
-            .await
-            .retain(|id, _| !ids.contains(id));
-        self.closed_deals
-            .write()
-            .await
-            .extend(deals.into_iter().map(|deal| (deal.id, deal)));
+        // Both locks are held (opened first, like `get_deals_snapshot`) so a snapshot never
+        // sees a deal in the middle of the move
+        let mut opened = self.opened_deals.write().await;
+        let mut closed = self.closed_deals.write().await;
+        opened.retain(|id, _| !ids.contains(id));
+        closed.extend(deals.into_iter().map(|deal| (deal.id, deal)));
     }
 
     /// Removes all deals from the closed_deals map.
@@ -303,6 +322,13 @@ impl TradeState {
         self.closed_deals.read().await.clone()
     }
 
+    /// Retrieves the opened and closed deals together, as one consistent snapshot.
+    pub async fn get_deals_snapshot(&self) -> (HashMap<Uuid, Deal>, HashMap<Uuid, Deal>) {
+        let opened = self.opened_deals.read().await;
+        let closed = self.closed_deals.read().await;
+        (opened.clone(), closed.clone())
+    }
+
     /// Checks if a deal with the given ID exists in opened deals.
     pub async fn contains_opened_deal(&self, deal_id: Uuid) -> bool {
         self.opened_deals.read().await.contains_key(&deal_id)
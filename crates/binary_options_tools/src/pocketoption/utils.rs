@@ -11,7 +11,9 @@ use crate::pocketoption::{
     ssid::Ssid,
 };
 use serde_json::Value;
+use std::{collections::HashMap, hash::Hash, sync::Mutex};
 use tokio::net::TcpStream;
+use tokio::sync::{Notify, futures::Notified};
 use url::Url;
 
 pub fn get_index() -> PocketResult<u64> {
@@ -84,12 +86,69 @@ pub async fn try_connect(
         .body(())
         .map_err(|e| ConnectorError::HttpRequestBuild(e.to_string()))?;
 
-    let (ws, _) = connect_async_tls_with_config(request, None, false, Some(connector))
+    // Disable Nagle: the traffic is small request / response frames (orders, `check_win`,
+    // `send_and_wait`) that would otherwise wait for the previous segment's ACK
+    let (ws, _) = connect_async_tls_with_config(request, None, true, Some(connector))
         .await
         .map_err(|e| ConnectorError::Custom(e.to_string()))?;
     Ok(ws)
 }
 
+/// Maximum number of parked responses, reached only if waiters are dropped before
+/// picking up their response
+const RESPONSE_STASH_SIZE: usize = 256;
+
+/// Responses a module handle received on behalf of another request.
+///
+/// Every clone of a module handle reads from the same response channel, so with several
+/// requests in flight a waiter may receive the response of another request. Instead of
+/// dropping it the waiter parks it here and wakes the other waiters, which check the
+/// stash before reading the channel again.
+pub struct ResponseStash<K, V> {
+    responses: Mutex<HashMap<K, Vec<V>>>,
+    notify: Notify,
+}
+
+impl<K: Eq + Hash, V> Default for ResponseStash<K, V> {
+    fn default() -> Self {
+        Self {
+            responses: Mutex::new(HashMap::new()),
+            notify: Notify::new(),
+        }
+    }
+}
+
+impl<K: Eq + Hash, V> ResponseStash<K, V> {
+    /// Future resolving on the next `put`. Enable it (or poll it) before calling `take`
+    /// so a response parked in between isn't missed.
+    pub fn notified(&self) -> Notified<'_> {
+        self.notify.notified()
+    }
+
+    /// Takes a parked response for `key`
+    pub fn take(&self, key: &K) -> Option<V> {
+        let mut responses = self.responses.lock().unwrap_or_else(|e| e.into_inner());
+        let parked = responses.get_mut(key)?;
+        let value = parked.pop();
+        if parked.is_empty() {
+            responses.remove(key);
+        }
+        value
+    }
+
+    /// Parks a response for `key` and wakes every waiter
+    pub fn put(&self, key: K, value: V) {
+        {
+            let mut responses = self.responses.lock().unwrap_or_else(|e| e.into_inner());
+            if responses.len() >= RESPONSE_STASH_SIZE {
+                responses.clear();
+            }
+            responses.entry(key).or_default().push(value);
+        }
+        self.notify.notify_waiters();
+    }
+}
+
 pub mod float_time {
     use chrono::{DateTime, Utc};
     use serde::{Deserialize, Deserializer, Serializer};
@@ -1,8 +1,14 @@
 use std::fmt;
 use std::sync::Arc;
 
+use memchr::memmem::Finder;
 use regex::Regex;
+use regex_automata::{
+    Input,
+    dfa::{Automaton, dense},
+};
 use serde_json::Value;
+use tracing::warn;
 
 use crate::traits::ValidatorTrait;
 
@@ -12,14 +18,90 @@ pub enum Validator {
     None,
     StartsWith(String),
     EndsWith(String),
-    Contains(String),
+    Contains(Substring),
     Regex(Regex),
+    Dfa(DfaRegex),
     Not(Box<Validator>),
     All(Box<Vec<Validator>>),
     Any(Box<Vec<Validator>>),
     Custom(Arc<dyn ValidatorTrait + Send + Sync>),
 }
 
+/// Needle of a `Validator::Contains`, the SIMD `memmem` searcher is built once
+/// when the validator is created instead of on every message.
+#[derive(Clone)]
+pub struct Substring {
+    needle: String,
+    finder: Finder<'static>,
+}
+
+impl Substring {
+    pub fn new(needle: String) -> Self {
+        let finder = Finder::new(needle.as_bytes()).into_owned();
+        Self { needle, finder }
+    }
+
+    pub fn as_str(&self) -> &str {
+        &self.needle
+    }
+
+    pub fn is_in(&self, data: &str) -> bool {
+        self.finder.find(data.as_bytes()).is_some()
+    }
+}
+
+impl fmt::Debug for Substring {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        fmt::Debug::fmt(&self.needle, f)
+    }
+}
+
+/// Upper bound (in bytes) for the dense DFA of a `Validator::Dfa` and for the
+/// memory used while determinizing it.
+const DFA_SIZE_LIMIT: usize = 1 << 20;
+
+/// Regex compiled ahead of time into a dense DFA, so matching never has to build
+/// states lazily on the hot path. The original `Regex` is kept for the cases the
+/// DFA gives up on (e.g. it quits on a Unicode word boundary over non ASCII data).
+#[derive(Clone)]
+pub struct DfaRegex {
+    regex: Regex,
+    dfa: Arc<dense::DFA<Vec<u32>>>,
+}
+
+impl DfaRegex {
+    pub fn new(regex: Regex) -> Result<Self, dense::BuildError> {
+        let dfa = dense::Builder::new()
+            .configure(
+                dense::Config::new()
+                    .dfa_size_limit(Some(DFA_SIZE_LIMIT))
+                    .determinize_size_limit(Some(DFA_SIZE_LIMIT)),
+            )
+            .build(regex.as_str())?;
+        Ok(Self {
+            regex,
+            dfa: Arc::new(dfa),
+        })
+    }
+
+    pub fn as_str(&self) -> &str {
+        self.regex.as_str()
+    }
+
+    pub fn is_match(&self, data: &str) -> bool {
+        match self.dfa.try_search_fwd(&Input::new(data).earliest(true)) {
+            Ok(found) => found.is_some(),
+            Err(_) => self.regex.is_match(data),
+        }
+    }
+}
+
+impl fmt::Debug for DfaRegex {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        fmt::Debug::fmt(&self.regex, f)
+    }
+}
+
 impl fmt::Debug for Validator {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
         match self {
@@ -28,6 +110,7 @@ impl fmt::Debug for Validator {
             Validator::EndsWith(s) => f.debug_tuple("Validator::EndsWith").field(s).finish(),
             Validator::Contains(s) => f.debug_tuple("Validator::Contains").field(s).finish(),
             Validator::Regex(r) => f.debug_tuple("Validator::Regex").field(r).finish(),
+            Validator::Dfa(r) => f.debug_tuple("Validator::Dfa").field(r).finish(),
             Validator::Not(v) => f.debug_tuple("Validator::Not").field(v).finish(),
             Validator::All(v) => f.debug_tuple("Validator::All").field(v).finish(),
             Validator::Any(v) => f.debug_tuple("Validator::Any").field(v).finish(),
@@ -46,22 +129,45 @@ impl Validator {
     }
 
     pub fn contains(substring: String) -> Self {
-        Validator::Contains(substring)
+        Validator::Contains(Substring::new(substring))
     }
 
     pub fn regex(regex: Regex) -> Self {
         Validator::Regex(regex)
     }
 
+    /// Like `regex` but precompiles the pattern into a dense DFA. Patterns the DFA
+    /// can't handle (Unicode word boundaries, or a DFA bigger than the size limit)
+    /// fall back to a plain `Validator::Regex`.
+    pub fn regex_dfa(regex: Regex) -> Self {
+        match DfaRegex::new(regex.clone()) {
+            Ok(dfa) => Validator::Dfa(dfa),
+            Err(e) => {
+                warn!(target: "Validator", "Falling back to regex for '{}': {e}", regex.as_str());
+                Validator::Regex(regex)
+            }
+        }
+    }
+
+    /// Negating a `Not` unwraps it instead of stacking a second negation.
     pub fn negate(validator: Validator) -> Self {
-        Validator::Not(Box::new(validator))
+        match validator {
+            Validator::Not(inner) => *inner,
+            validator => Validator::Not(Box::new(validator)),
+        }
     }
 
-    pub fn all(validators: Vec<Validator>) -> Self {
+    /// Children are reordered cheapest first (see `cost_hint`) so a cheap reject
+    /// short-circuits before any regex or custom check runs. Validators are pure
+    /// predicates, so this doesn't change the result.
+    pub fn all(mut validators: Vec<Validator>) -> Self {
+        validators.sort_by_key(Validator::cost_hint);
         Validator::All(Box::new(validators))
     }
 
-    pub fn any(validators: Vec<Validator>) -> Self {
+    /// Same ordering as `all`, so a cheap accept returns before the expensive checks.
+    pub fn any(mut validators: Vec<Validator>) -> Self {
+        validators.sort_by_key(Validator::cost_hint);
         Validator::Any(Box::new(validators))
     }
 
@@ -69,15 +175,36 @@ impl Validator {
         Validator::Custom(validator)
     }
 
+    /// Rough relative cost of one `call`, used to order the children of `All` / `Any`.
+    /// The sort is stable, so validators with the same cost (e.g. several custom
+    /// python callbacks) keep the order they were given in.
+    pub fn cost_hint(&self) -> u8 {
+        match self {
+            Validator::None => 0,
+            Validator::StartsWith(_) | Validator::EndsWith(_) => 1,
+            Validator::Contains(_) => 2,
+            Validator::Dfa(_) => 4,
+            Validator::Regex(_) => 5,
+            Validator::Not(validator) => validator.cost_hint(),
+            Validator::All(validators) | Validator::Any(validators) => {
+                validators.iter().map(Validator::cost_hint).max().unwrap_or(0)
+            }
+            Validator::Custom(_) => 10,
+        }
+    }
+
     /// Adds a new validator to the current validator.
     /// If the current validator is `All` or `Any`, it appends to the existing list.
     /// If the current validator is a single validator, it wraps it in an `All` validator with the new one.
     pub fn add(&mut self, validator: Validator) {
         match self {
-            Validator::All(validators) => validators.push(validator),
-            Validator::Any(validators) => validators.push(validator),
+            Validator::All(validators) | Validator::Any(validators) => {
+                let cost = validator.cost_hint();
+                let index = validators.partition_point(|v| v.cost_hint() <= cost);
+                validators.insert(index, validator);
+            }
             _ => {
-                *self = Validator::All(Box::new(vec![self.clone(), validator]));
+                *self = Validator::all(vec![self.clone(), validator]);
             }
         }
     }
@@ -89,8 +216,9 @@ impl ValidatorTrait for Validator {
             Validator::None => true,
             Validator::StartsWith(prefix) => data.starts_with(prefix),
             Validator::EndsWith(suffix) => data.ends_with(suffix),
-            Validator::Contains(substring) => data.contains(substring),
+            Validator::Contains(substring) => substring.is_in(data),
             Validator::Regex(regex) => regex.is_match(data),
+            Validator::Dfa(dfa) => dfa.is_match(data),
             Validator::Not(validator) => !validator.call(data),
             Validator::All(validators) => validators.iter().all(|v| v.call(data)),
             Validator::Any(validators) => validators.iter().any(|v| v.call(data)),
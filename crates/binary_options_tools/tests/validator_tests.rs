@@ -1,8 +1,10 @@
 //! Unit tests for the Validator implementation
 
+use binary_options_tools::traits::ValidatorTrait;
 use binary_options_tools::validator::{RawValidator, Validator};
 use regex::Regex;
 use std::sync::Arc;
+use std::sync::atomic::{AtomicUsize, Ordering};
 
 #[cfg(test)]
 mod tests {
@@ -139,4 +141,154 @@ mod tests {
         assert!(!validator.call("12345"));
         assert!(!validator.call(""));
     }
+
+    /// Custom validator that counts how often it runs
+    fn counting(calls: &Arc<AtomicUsize>, result: bool) -> Validator {
+        let calls = calls.clone();
+        Validator::custom(Arc::new(move |_: &str| {
+            calls.fetch_add(1, Ordering::SeqCst);
+            result
+        }))
+    }
+
+    fn children(validator: &Validator) -> &[Validator] {
+        match validator {
+            Validator::All(validators) | Validator::Any(validators) => validators,
+            other => panic!("expected All or Any, got {other:?}"),
+        }
+    }
+
+    fn costs(validator: &Validator) -> Vec<u8> {
+        children(validator).iter().map(Validator::cost_hint).collect()
+    }
+
+    #[test]
+    fn test_validator_all_any_reorder_keeps_semantics() {
+        let inputs = ["", "Hello", "Hello World", "Hi World", "Hello 123", "42[\"x\"]"];
+        let make = || {
+            vec![
+                Validator::regex(Regex::new(r"\d").unwrap()),
+                Validator::custom(Arc::new(|data: &str| data.len() > 5)),
+                Validator::contains("World".to_string()),
+                Validator::starts_with("Hello".to_string()),
+            ]
+        };
+        let all = Validator::all(make());
+        let any = Validator::any(make());
+        assert!(costs(&all).is_sorted());
+        assert!(costs(&any).is_sorted());
+        for input in inputs {
+            // Same result as evaluating the children in the order they were given
+            assert_eq!(all.call(input), make().iter().all(|v| v.call(input)), "{input:?}");
+            assert_eq!(any.call(input), make().iter().any(|v| v.call(input)), "{input:?}");
+        }
+    }
+
+    #[test]
+    fn test_validator_all_any_short_circuit_on_cheap_child() {
+        let calls = Arc::new(AtomicUsize::new(0));
+        let all = Validator::all(vec![
+            counting(&calls, true),
+            Validator::starts_with("Hello".to_string()),
+        ]);
+        // The prefix check runs first and rejects, the custom check never runs
+        assert!(!all.call("Hi there"));
+        assert_eq!(calls.load(Ordering::SeqCst), 0);
+        assert!(all.call("Hello there"));
+        assert_eq!(calls.load(Ordering::SeqCst), 1);
+
+        let calls = Arc::new(AtomicUsize::new(0));
+        let any = Validator::any(vec![
+            counting(&calls, false),
+            Validator::contains("World".to_string()),
+        ]);
+        assert!(any.call("Hello World"));
+        assert_eq!(calls.load(Ordering::SeqCst), 0);
+        assert!(!any.call("Hello there"));
+        assert_eq!(calls.load(Ordering::SeqCst), 1);
+    }
+
+    #[test]
+    fn test_validator_add_keeps_cost_order() {
+        let first = Arc::new(AtomicUsize::new(0));
+        let second = Arc::new(AtomicUsize::new(0));
+        let mut validator = Validator::any(vec![counting(&first, true)]);
+        validator.add(Validator::regex(Regex::new("^x").unwrap()));
+        validator.add(counting(&second, true));
+        validator.add(Validator::starts_with("Hello".to_string()));
+        assert_eq!(costs(&validator), vec![1, 5, 10, 10]);
+
+        // Validators with the same cost keep the order they were added in
+        assert!(validator.call("nothing cheap matches"));
+        assert_eq!(first.load(Ordering::SeqCst), 1);
+        assert_eq!(second.load(Ordering::SeqCst), 0);
+
+        let mut validator = Validator::all(vec![Validator::regex(Regex::new("o").unwrap())]);
+        validator.add(Validator::ends_with("World".to_string()));
+        assert_eq!(costs(&validator), vec![1, 5]);
+        assert!(validator.call("Hello World"));
+        assert!(!validator.call("Hello"));
+    }
+
+    #[test]
+    fn test_validator_double_negation_folds() {
+        let validator = Validator::negate(Validator::negate(Validator::contains("error".to_string())));
+        assert!(matches!(&validator, Validator::Contains(s) if s.as_str() == "error"));
+        assert_eq!(
+            format!("{validator:?}"),
+            format!("{:?}", Validator::contains("error".to_string()))
+        );
+        assert!(validator.call("An error occurred"));
+        assert!(!validator.call("Success message"));
+
+        let validator = Validator::negate(validator);
+        assert!(matches!(validator, Validator::Not(_)));
+        assert!(!validator.call("An error occurred"));
+        assert!(validator.call("Success message"));
+    }
+
+    #[test]
+    fn test_validator_dfa_matches_regex() {
+        let patterns = [
+            r"^[A-Z][a-z]+$",
+            r#"^42\["successopenOrder""#,
+            r"World$",
+            r#""balance""#,
+            r"[0-9]{3}",
+            r"foo|bar",
+            r"(?i)hello",
+            r"^$",
+        ];
+        let inputs = [
+            "",
+            "Hello",
+            "hello world",
+            "Hello World",
+            "HELLO123",
+            "42[\"successopenOrder\",{}]",
+            "451-[\"successopenOrder\"",
+            "{\"balance\":100}",
+            "xbarx",
+            "Ünïcödé 123",
+        ];
+        for pattern in patterns {
+            let regex = Regex::new(pattern).unwrap();
+            let validator = Validator::regex_dfa(regex.clone());
+            assert!(matches!(validator, Validator::Dfa(_)), "{pattern:?}");
+            for input in inputs {
+                assert_eq!(validator.call(input), regex.is_match(input), "{pattern:?} on {input:?}");
+            }
+        }
+    }
+
+    #[test]
+    fn test_validator_dfa_fallback_matches_regex() {
+        // Unicode word boundaries aren't supported by the dense DFA, whichever engine the
+        // validator ends up with must still agree with the regex
+        let regex = Regex::new(r"\bWorld\b").unwrap();
+        let validator = Validator::regex_dfa(regex.clone());
+        for input in ["Hello World", "HelloWorld", "Ünï World", "Wörld World!", ""] {
+            assert_eq!(validator.call(input), regex.is_match(input), "{input:?}");
+        }
+    }
 }
@@ -9,11 +9,29 @@ use kanal::{AsyncReceiver, AsyncSender};
 use std::any::{Any, TypeId};
 use std::collections::HashMap;
 use std::sync::Arc;
+use std::time::Duration;
 use tokio::sync::RwLock;
 use tokio::task::JoinSet;
 use tokio_tungstenite::tungstenite::Message;
 use tracing::{debug, error, info, warn};
 
+/// Stop coalescing queued messages into one flush once this many bytes were fed,
+/// so a long burst doesn't hold back the frames queued at its start
+const MAX_WRITE_BATCH_BYTES: usize = 32 * 1024;
+
+/// Base and cap of the exponential backoff between failed connection attempts.
+const RECONNECT_BASE_DELAY: Duration = Duration::from_secs(5);
+const RECONNECT_MAX_DELAY: Duration = Duration::from_secs(60);
+
+/// "Full jitter" backoff: a random delay in `[0, min(base * 2^attempt, max))`, so clients
+/// dropped by the same outage don't all retry in lockstep.
+fn reconnect_delay(attempt: u32) -> Duration {
+    let ceiling = RECONNECT_BASE_DELAY
+        .saturating_mul(2u32.saturating_pow(attempt))
+        .min(RECONNECT_MAX_DELAY);
+    ceiling.mul_f64(rand::random::<f64>())
+}
+
 /// A lightweight handler is a function that can process messages without being tied to a specific module.
 /// It can be used for quick, non-blocking operations that don't require a full module lifecycle
 /// or state management.
@@ -329,6 +347,8 @@ impl<S: AppState> ClientRunner<S> {
     /// - **Disconnection**: Middleware `on_disconnect` called before cleanup
     pub async fn run(&mut self) {
         // TODO: Add a way to disconnect and keep the connection closed intill specified otherwhise
+        // Consecutive failed connection attempts, drives the backoff delay.
+        let mut failed_attempts: u32 = 0;
         // The outermost loop runs until a shutdown is commanded.
         while !self.shutdown_requested {
             // Execute middleware on_connect hook
@@ -352,8 +372,10 @@ impl<S: AppState> ClientRunner<S> {
             let ws_stream = match stream_result {
                 Ok(stream) => stream,
                 Err(e) => {
-                    warn!(target: "Runner", "Connection failed: {e}. Retrying in 5s...");
-                    tokio::time::sleep(std::time::Duration::from_secs(5)).await;
+                    let delay = reconnect_delay(failed_attempts);
+                    failed_attempts = failed_attempts.saturating_add(1);
+                    warn!(target: "Runner", "Connection failed: {e}. Retrying in {delay:.1?}...");
+                    tokio::time::sleep(delay).await;
                     // On failure, the next attempt is a reconnect, not a hard connect.
                     self.is_hard_disconnect = false;
                     continue; // Restart the connection cycle.
@@ -363,6 +385,7 @@ impl<S: AppState> ClientRunner<S> {
             // 🎯 MIDDLEWARE HOOK: on_connect - called after successful connection
             // Location: After WebSocket connection is established
             info!(target: "Runner", "Connection successful.");
+            failed_attempts = 0;
             self.signal.set_connected();
             self.router
                 .middleware_stack
@@ -410,12 +433,28 @@ impl<S: AppState> ClientRunner<S> {
                 async move {
                     let middleware_context = MiddlewareContext::new(state, to_ws_sender);
                     while let Ok(msg) = to_ws_rx.recv().await {
-                        // Execute middleware on_send hook
-                        router
-                            .middleware_stack
-                            .on_send(&msg, &middleware_context)
-                            .await;
-                        if ws_writer.send(msg).await.is_err() {
+                        // Queue this message and every message already waiting behind it
+                        // (up to `MAX_WRITE_BATCH_BYTES`), then flush once so a burst of
+                        // sends goes out in a single write.
+                        let mut next = Some(msg);
+                        let mut sent = true;
+                        let mut batch_bytes = 0;
+                        while let Some(msg) = next.take() {
+                            // Execute middleware on_send hook
+                            router
+                                .middleware_stack
+                                .on_send(&msg, &middleware_context)
+                                .await;
+                            batch_bytes += msg.len();
+                            if ws_writer.feed(msg).await.is_err() {
+                                sent = false;
+                                break;
+                            }
+                            if batch_bytes < MAX_WRITE_BATCH_BYTES {
+                                next = to_ws_rx.try_recv().ok().flatten();
+                            }
+                        }
+                        if !sent || ws_writer.flush().await.is_err() {
                             error!(target: "Runner", "WebSocket writer task failed to send message.");
                             break;
                         }
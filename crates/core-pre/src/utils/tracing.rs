@@ -1,7 +1,6 @@
 use std::{fs::OpenOptions, io::Write, time::Duration};
 
 use kanal::{Sender, bounded_async};
-use serde_json::Value;
 use tokio_tungstenite::tungstenite::Message;
 use tracing::level_filters::LevelFilter;
 use tracing_subscriber::{
@@ -77,10 +76,15 @@ pub struct StreamWriter {
 
 impl Write for StreamWriter {
     fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
-        if let Ok(item) = serde_json::from_slice::<Value>(buf) {
-            self.sender
-                .send(Message::text(item.to_string()))
-                .map_err(std::io::Error::other)?;
+        // The json formatter writes one complete record per call, it's forwarded as is
+        // instead of being parsed into a `Value` and serialized again
+        if let Ok(line) = std::str::from_utf8(buf) {
+            let line = line.trim_end();
+            if !line.is_empty() {
+                self.sender
+                    .send(Message::text(line.to_owned()))
+                    .map_err(std::io::Error::other)?;
+            }
         }
         Ok(buf.len())
     }
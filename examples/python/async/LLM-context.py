@@ -13,17 +13,16 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    (buy_id, _) = await api.buy(
-        asset="EURUSD_otc", amount=1.0, time=15, check_win=False
-    )
-    (sell_id, _) = await api.sell(
-        asset="EURUSD_otc", amount=1.0, time=300, check_win=False
-    )
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, _) = await api.buy(asset="EURUSD_otc", amount=1.0, time=15, check_win=False)
+    (sell_id, _) = await api.sell(asset="EURUSD_otc", amount=1.0, time=300, check_win=False)
     print(buy_id, sell_id)
     # This is the same as setting checkw_win to true on the api.buy and api.sell functions
-    buy_data = await api.check_win(buy_id)
+    buy_data, sell_data = await asyncio.gather(
+        api.check_win(buy_id), api.check_win(sell_id)
+    )
     print(f"Buy trade result: {buy_data['result']}\nBuy trade data: {buy_data}")
-    sell_data = await api.check_win(sell_id)
     print(f"Sell trade result: {sell_data['result']}\nSell trade data: {sell_data}")
 
 
@@ -45,10 +44,10 @@ import asyncio
 async def main(ssid: str):
     # Initialize the API client
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)  # Wait for connection to establish
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Create a validator for price updates
-    validator = Validator.regex(r'{"price":\d+\.\d+}')
+    validator = Validator.regex(r'\{"price":\d+\.\d+\}')
 
     # Create an iterator with 5 minute timeout
     stream = await api.create_raw_iterator(
@@ -86,7 +85,7 @@ import asyncio
 async def main(ssid: str):
     # Initialize the API client
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)  # Wait for connection to establish
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Basic raw order example
     try:
@@ -98,7 +97,7 @@ async def main(ssid: str):
 
     # Raw order with timeout example
     try:
-        validator = Validator.regex(r'{"type":"signal","data":.*}')
+        validator = Validator.regex(r'\{"type":"signal","data":.*\}')
         response = await api.create_raw_order_with_timout(
             '42["signals/load"]', validator, timeout=timedelta(seconds=5)
         )
@@ -143,7 +142,7 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     balance = await api.balance()
     print(f"Balance: {balance}")
@@ -169,7 +168,7 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Candñes are returned in the format of a list of dictionaries
     times = [3600 * i for i in range(1, 11)]
@@ -199,18 +198,26 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    _ = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
-    _ = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, _) = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    (sell_id, _) = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
     # This is the same as setting checkw_win to true on the api.buy and api.sell functions
     opened_deals = await api.opened_deals()
     print(
         f"Opened deals: {opened_deals}\nNumber of opened deals: {len(opened_deals)} (should be at least 2)"
     )
-    await asyncio.sleep(62)  # Wait for the trades to complete
-    closed_deals = await api.closed_deals()
+    # Wait for the trades to complete, returns as soon as both are closed
+    await asyncio.gather(
+        api.wait_closed(buy_id, timeout=65), api.wait_closed(sell_id, timeout=65)
+    )
+    # Both lists read at once, a deal that is closing right now is in exactly one of them
+    snapshot = await api.deals_snapshot()
+    opened_deals, closed_deals = snapshot["open"], snapshot["closed"]
     print(
         f"Closed deals: {closed_deals}\nNumber of closed deals: {len(closed_deals)} (should be at least 2)"
     )
+    print(f"Deals still opened: {len(opened_deals)}")
 
 
 if __name__ == "__main__":
@@ -231,18 +238,26 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    _ = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
-    _ = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, _) = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    (sell_id, _) = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
     # This is the same as setting checkw_win to true on the api.buy and api.sell functions
     opened_deals = await api.opened_deals()
     print(
         f"Opened deals: {opened_deals}\nNumber of opened deals: {len(opened_deals)} (should be at least 2)"
     )
-    await asyncio.sleep(62)  # Wait for the trades to complete
-    closed_deals = await api.closed_deals()
+    # Wait for the trades to complete, returns as soon as both are closed
+    await asyncio.gather(
+        api.wait_closed(buy_id, timeout=65), api.wait_closed(sell_id, timeout=65)
+    )
+    # Both lists read at once, a deal that is closing right now is in exactly one of them
+    snapshot = await api.deals_snapshot()
+    opened_deals, closed_deals = snapshot["open"], snapshot["closed"]
     print(
         f"Closed deals: {closed_deals}\nNumber of closed deals: {len(closed_deals)} (should be at least 2)"
     )
+    print(f"Deals still opened: {len(opened_deals)}")
 
 
 if __name__ == "__main__":
@@ -297,7 +312,8 @@ async def main():
     # Example of logging with variables
     asset = "EURUSD"
     amount = 100
-    logger.info(f"Bought {amount} units of {asset}")
+    # The message is only formatted if INFO logs are enabled
+    logger.info("Bought %s units of %s", amount, asset)
 
     # Demonstrate async usage
     async def log_async():
@@ -353,16 +369,15 @@ async def main(ssid: str):
     )  # If false then the logs will only be written to the log files
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    (buy_id, _) = await api.buy(
-        asset="EURUSD_otc", amount=1.0, time=300, check_win=False
-    )
-    (sell_id, _) = await api.sell(
-        asset="EURUSD_otc", amount=1.0, time=300, check_win=False
-    )
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, _) = await api.buy(asset="EURUSD_otc", amount=1.0, time=300, check_win=False)
+    (sell_id, _) = await api.sell(asset="EURUSD_otc", amount=1.0, time=300, check_win=False)
     print(buy_id, sell_id)
     # This is the same as setting checkw_win to true on the api.buy and api.sell functions
-    buy_data = await api.check_win(buy_id)
-    sell_data = await api.check_win(sell_id)
+    buy_data, sell_data = await asyncio.gather(
+        api.check_win(buy_id), api.check_win(sell_id)
+    )
     print(f"Buy trade result: {buy_data['result']}\nBuy trade data: {buy_data}")
     print(f"Sell trade result: {sell_data['result']}\nSell trade data: {sell_data}")
 
@@ -384,7 +399,7 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Candñes are returned in the format of a list of dictionaries
     full_payout = await api.payout()  # Returns a dictionary asset: payout
@@ -415,22 +430,18 @@ import asyncio
 async def main(ssid: str):
     # Initialize the API client
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)  # Wait for connection to establish
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Example of sending a raw message
     try:
-        # Subscribe to signals
-        await api.send_raw_message('42["signals/subscribe"]')
-        print("Sent signals subscription message")
-
-        # Subscribe to price updates
-        await api.send_raw_message('42["price/subscribe"]')
-        print("Sent price subscription message")
-
-        # Custom message example
+        # Subscribe to signals and price updates and send a custom message in one batch,
+        # the frames are flushed to the websocket together instead of one write each
+        # (use `api.send_raw_message(message)` for a single message)
         custom_message = '42["custom/event",{"param":"value"}]'
-        await api.send_raw_message(custom_message)
-        print(f"Sent custom message: {custom_message}")
+        await api.send_raw_messages(
+            ['42["signals/subscribe"]', '42["price/subscribe"]', custom_message]
+        )
+        print(f"Sent signals and price subscriptions and custom message: {custom_message}")
 
         # Multiple messages in sequence
         messages = [
@@ -439,10 +450,10 @@ async def main(ssid: str):
             '42["notifications/subscribe"]',
         ]
 
-        for msg in messages:
-            await api.send_raw_message(msg)
-            print(f"Sent message: {msg}")
-            await asyncio.sleep(1)  # Small delay between messages
+        # Queued back to back and flushed together, pass `pacing=timedelta(...)`
+        # to space them out instead
+        await api.send_raw_messages(messages)
+        print(f"Sent messages: {messages}")
 
     except Exception as e:
         print(f"Error sending message: {e}")
@@ -457,6 +468,8 @@ if __name__ == "__main__":
 # start of the subscribe symbol - this is the function that subscribes to a symbol and gets the candles in real time
 from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
 
+from datetime import timedelta
+
 import asyncio
 
 
@@ -467,8 +480,11 @@ async def main(ssid: str):
     stream = await api.subscribe_symbol("EURUSD_otc")
 
     # This should run forever so you will need to force close the program
-    async for candle in stream:
-        print(f"Candle: {candle}")  # Each candle is in format of a dictionary
+    # Candles are read in batches of up to 64, so high frequency symbols don't need one await per candle
+    while True:
+        batch = await stream.recv_batch(64, timedelta(milliseconds=50))
+        for candle in batch:
+            print(f"Candle: {candle}")  # Each candle is in format of a dictionary
 
 
 if __name__ == "__main__":
@@ -542,13 +558,11 @@ async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
 
-    (buy_id, buy) = await api.buy(
-        asset="EURUSD_otc", amount=1.0, time=60, check_win=False
-    )
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, buy) = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    (sell_id, sell) = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
     print(f"Buy trade id: {buy_id}\nBuy trade data: {buy}")
-    (sell_id, sell) = await api.sell(
-        asset="EURUSD_otc", amount=1.0, time=60, check_win=False
-    )
     print(f"Sell trade id: {sell_id}\nSell trade data: {sell}")
 
 
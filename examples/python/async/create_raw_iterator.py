@@ -8,10 +8,10 @@ import asyncio
 async def main(ssid: str):
     # Initialize the API client
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)  # Wait for connection to establish
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Create a validator for price updates
-    validator = Validator.regex(r'{"price":\d+\.\d+}')
+    validator = Validator.regex(r'\{"price":\d+\.\d+\}')
 
     # Create an iterator with 5 minute timeout
     stream = await api.create_raw_iterator(
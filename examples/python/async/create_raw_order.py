@@ -8,7 +8,7 @@ import asyncio
 async def main(ssid: str):
     # Initialize the API client
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)  # Wait for connection to establish
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Basic raw order example
     try:
@@ -20,7 +20,7 @@ async def main(ssid: str):
 
     # Raw order with timeout example
     try:
-        validator = Validator.regex(r'{"type":"signal","data":.*}')
+        validator = Validator.regex(r'\{"type":"signal","data":.*\}')
         response = await api.create_raw_order_with_timout(
             '42["signals/load"]', validator, timeout=timedelta(seconds=5)
         )
@@ -7,7 +7,7 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     balance = await api.balance()
     print(f"Balance: {balance}")
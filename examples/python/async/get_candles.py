@@ -8,7 +8,7 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Candles are returned in the format of a list of dictionaries
     times = [3600 * i for i in range(1, 11)]
@@ -7,18 +7,26 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    _ = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
-    _ = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, _) = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    (sell_id, _) = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
     # This is the same as setting checkw_win to true on the api.buy and api.sell functions
     opened_deals = await api.opened_deals()
     print(
         f"Opened deals: {opened_deals}\nNumber of opened deals: {len(opened_deals)} (should be at least 2)"
     )
-    await asyncio.sleep(62)  # Wait for the trades to complete
-    closed_deals = await api.closed_deals()
+    # Wait for the trades to complete, returns as soon as both are closed
+    await asyncio.gather(
+        api.wait_closed(buy_id, timeout=65), api.wait_closed(sell_id, timeout=65)
+    )
+    # Both lists read at once, a deal that is closing right now is in exactly one of them
+    snapshot = await api.deals_snapshot()
+    opened_deals, closed_deals = snapshot["open"], snapshot["closed"]
     print(
         f"Closed deals: {closed_deals}\nNumber of closed deals: {len(closed_deals)} (should be at least 2)"
     )
+    print(f"Deals still opened: {len(opened_deals)}")
 
 
 if __name__ == "__main__":
@@ -8,12 +8,12 @@ import asyncio
 async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
-    # Candles are returned in the format of a list of dictionaries
-    candles = await api.history("EURUSD_otc", 3600)
-    print(f"Raw Candles: {candles}")
-    candles_pd = pd.DataFrame.from_dict(candles)
+    # Candles are returned as one NumPy array per column (timestamp, open, high, low, close),
+    # pandas wraps them directly instead of walking a list of dictionaries
+    candles = await api.history_numpy("EURUSD_otc", 3600)
+    candles_pd = pd.DataFrame(candles, copy=False)
     print(f"Candles: {candles_pd}")
 
 
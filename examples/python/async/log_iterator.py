@@ -42,7 +42,8 @@ async def main():
     # Example of logging with variables
     asset = "EURUSD"
     amount = 100
-    logger.info(f"Bought {amount} units of {asset}")
+    # The message is only formatted if INFO logs are enabled
+    logger.info("Bought %s units of %s", amount, asset)
 
     # Demonstrate async usage
     async def log_async():
@@ -1,11 +1,24 @@
 import asyncio
 import time
-import json  # For the SSID formatting function
 import sys
 import getpass
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from tabulate import tabulate  # Keep if catalogador is re-enabled (currently not used)
 from colorama import init, Fore, Back
+# For the SSID formatting function, orjson is used when installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 # Imports for Selenium Login
 try:
@@ -14,6 +27,7 @@ try:
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions
     from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import SessionNotCreatedException
     from webdriver_manager.chrome import ChromeDriverManager
     import urllib.parse
 
@@ -27,6 +41,46 @@ except ImportError:
     print(Fore.YELLOW + "Please install them: pip install selenium webdriver-manager")
 
 
+# Common session cookie names for PHP sites like PocketOption. PHPSESSID is very common.
+_SESSION_COOKIE_NAMES = frozenset(
+    {"PHPSESSID", "ci_session", "po_session", "SID", "ssid"}
+)
+
+
+# Where the resolved ChromeDriver path is kept between runs
+_DRIVER_PATH_FILE = Path.home() / ".cache" / "binary-options-tools" / "chromedriver-path"
+
+
+def _driver_path(refresh: bool = False) -> str:
+    """
+    Returns the ChromeDriver path saved by a previous run, resolving and saving it if there is none.
+    `ChromeDriverManager().install()` checks the driver version online on every call.
+    """
+    if not refresh:
+        try:
+            cached = _DRIVER_PATH_FILE.read_text().strip()
+        except OSError:
+            cached = ""
+        if cached and Path(cached).is_file():
+            return cached
+    path = ChromeDriverManager().install()
+    try:
+        _DRIVER_PATH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _DRIVER_PATH_FILE.write_text(path)
+    except OSError:
+        pass  # Only a cache, the next run resolves the driver again
+    return path
+
+
+class SeleniumLoginError(Exception):
+    """Raised when a Selenium operation fails during the login, the original error is its `__cause__`"""
+
+    def __init__(self, message: str, url: str | None = None, screenshot: str | None = None):
+        super().__init__(message)
+        self.url = url  # Page the browser was on when it failed
+        self.screenshot = screenshot  # Path of the screenshot taken at the failure
+
+
 ### SSID FORMATTING FUNCTION ###
 def format_session_for_pocketoption_auth(
     input_session_string: str,
@@ -41,7 +95,7 @@ def format_session_for_pocketoption_auth(
     The input_session_string is the PHP_SERIALIZED_STRING_WITH_HASH part.
     """
     # The input_session_string is the raw PHP serialized string.
-    # json.dumps will handle escaping the double quotes within it correctly for JSON.
+    # _dumps will handle escaping the double quotes within it correctly for JSON.
 
     auth_payload = {
         "session": input_session_string,  # Use the original string directly
@@ -52,9 +106,10 @@ def format_session_for_pocketoption_auth(
     }
 
     # Convert the payload dictionary to a JSON string
-    # json.dumps will correctly handle boolean to lowercase true/false
+    # _dumps will correctly handle boolean to lowercase true/false
     # and ensure valid JSON syntax, including escaping quotes in input_session_string to \"
-    auth_payload_json_string = json.dumps(auth_payload, separators=(",", ":"))
+    # (both orjson and the json fallback produce compact output)
+    auth_payload_json_string = _dumps(auth_payload)
 
     # Construct the final target string
     target_string = f'42["auth",{auth_payload_json_string}]'
@@ -65,7 +120,11 @@ def format_session_for_pocketoption_auth(
 
 
 async def login_and_get_ssid(email_str: str, password_str: str) -> str | None:
-    """Handles Selenium login and returns the formatted SSID string or None on failure."""
+    """
+    Handles Selenium login and returns the formatted SSID string.
+    Returns None if the login page has no login button or no session cookie is set,
+    raises `SeleniumLoginError` if a Selenium operation fails.
+    """
     if not SELENIUM_AVAILABLE:
         print(
             red
@@ -91,8 +150,13 @@ async def login_and_get_ssid(email_str: str, password_str: str) -> str | None:
             # chrome_options.add_argument("--headless=new") # For new Selenium headless
             # chrome_options.add_argument("--window-size=1920,1080") # Specify window size
 
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            try:
+                service = Service(_driver_path())
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            except SessionNotCreatedException:
+                # Usually the cached driver no longer matches the installed Chrome, resolve it again
+                service = Service(_driver_path(refresh=True))
+                driver = webdriver.Chrome(service=service, options=chrome_options)
 
             print(yellow + "Navigating to PocketOption login page (po.trade/login)...")
             driver.get("https://po.trade/login")  # Official PocketOption URL for login
@@ -178,16 +242,8 @@ async def login_and_get_ssid(email_str: str, password_str: str) -> str | None:
 
             cookies = driver.get_cookies()
             session_token = None
-            # Common session cookie names for PHP sites like PocketOption. PHPSESSID is very common.
-            possible_session_cookie_names = [
-                "PHPSESSID",
-                "ci_session",
-                "po_session",
-                "SID",
-                "ssid",
-            ]
             for cookie in cookies:
-                if cookie["name"] in possible_session_cookie_names:
+                if cookie["name"] in _SESSION_COOKIE_NAMES:
                     session_token = cookie["value"]
                     print(
                         green
@@ -242,21 +298,18 @@ async def login_and_get_ssid(email_str: str, password_str: str) -> str | None:
             return formatted_ssid
 
         except Exception as e_selenium:
-            print(red + f"Error during Selenium login operations: {e_selenium}")
-            import traceback
-
-            traceback.print_exc()
+            url = screenshot = None
             if driver:
                 try:
+                    url = driver.current_url or None
                     driver.save_screenshot("selenium_login_error.png")
-                    print(yellow + "Screenshot saved as selenium_login_error.png")
-                    print(
-                        yellow
-                        + f"Current URL at error: {driver.current_url if driver.current_url else 'N/A'}"
-                    )
+                    screenshot = "selenium_login_error.png"
                 except Exception as e_screenshot:
                     print(red + f"Could not save screenshot: {e_screenshot}")
-            return None
+            # The caller gets the traceback, URL and screenshot through the raised error
+            raise SeleniumLoginError(
+                f"Selenium login failed: {e_selenium}", url=url, screenshot=screenshot
+            ) from e_selenium
         finally:
             if driver:
                 print(yellow + "Closing WebDriver.")
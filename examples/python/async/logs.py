@@ -12,16 +12,15 @@ async def main(ssid: str):
     )  # If false then the logs will only be written to the log files
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
-    (buy_id, _) = await api.buy(
-        asset="EURUSD_otc", amount=1.0, time=300, check_win=False
-    )
-    (sell_id, _) = await api.sell(
-        asset="EURUSD_otc", amount=1.0, time=300, check_win=False
-    )
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, _) = await api.buy(asset="EURUSD_otc", amount=1.0, time=300, check_win=False)
+    (sell_id, _) = await api.sell(asset="EURUSD_otc", amount=1.0, time=300, check_win=False)
     print(buy_id, sell_id)
     # This is the same as setting checkw_win to true on the api.buy and api.sell functions
-    buy_data = await api.check_win(buy_id)
-    sell_data = await api.check_win(sell_id)
+    buy_data, sell_data = await asyncio.gather(
+        api.check_win(buy_id), api.check_win(sell_id)
+    )
     print(f"Buy trade result: {buy_data['result']}\nBuy trade data: {buy_data}")
     print(f"Sell trade result: {sell_data['result']}\nSell trade data: {sell_data}")
 
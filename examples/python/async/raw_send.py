@@ -5,22 +5,18 @@ import asyncio
 async def main(ssid: str):
     # Initialize the API client
     api = PocketOptionAsync(ssid)
-    await asyncio.sleep(5)  # Wait for connection to establish
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Example of sending a raw message
     try:
-        # Subscribe to signals
-        await api.send_raw_message('42["signals/subscribe"]')
-        print("Sent signals subscription message")
-
-        # Subscribe to price updates
-        await api.send_raw_message('42["price/subscribe"]')
-        print("Sent price subscription message")
-
-        # Custom message example
+        # Subscribe to signals and price updates and send a custom message in one batch,
+        # the frames are flushed to the websocket together instead of one write each
+        # (use `api.send_raw_message(message)` for a single message)
         custom_message = '42["custom/event",{"param":"value"}]'
-        await api.send_raw_message(custom_message)
-        print(f"Sent custom message: {custom_message}")
+        await api.send_raw_messages(
+            ['42["signals/subscribe"]', '42["price/subscribe"]', custom_message]
+        )
+        print(f"Sent signals and price subscriptions and custom message: {custom_message}")
 
         # Multiple messages in sequence
         messages = [
@@ -29,10 +25,10 @@ async def main(ssid: str):
             '42["notifications/subscribe"]',
         ]
 
-        for msg in messages:
-            await api.send_raw_message(msg)
-            print(f"Sent message: {msg}")
-            await asyncio.sleep(1)  # Small delay between messages
+        # Queued back to back and flushed together, pass `pacing=timedelta(...)`
+        # to space them out instead
+        await api.send_raw_messages(messages)
+        print(f"Sent messages: {messages}")
 
     except Exception as e:
         print(f"Error sending message: {e}")
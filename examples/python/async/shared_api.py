@@ -0,0 +1,27 @@
+from BinaryOptionsToolsV2.pocketoption import get_shared_api
+
+import asyncio
+
+
+# Helpers can ask for the api themselves, they all get the same connected client
+async def print_balance(ssid: str):
+    api = await get_shared_api(ssid)
+    print(f"Balance: {await api.balance()}")
+
+
+async def print_payout(ssid: str, asset: str):
+    api = await get_shared_api(ssid)
+    print(f"Payout for {asset}: {await api.payout(asset)}")
+
+
+# Main part of the code
+async def main(ssid: str):
+    # Only the first call connects, the websocket is reused by every later call in this process
+    await print_balance(ssid)
+    await print_payout(ssid, "EURUSD_otc")
+    await print_payout(ssid, "EURJPY_otc")
+
+
+if __name__ == "__main__":
+    ssid = input("Please enter your ssid: ")
+    asyncio.run(main(ssid))
@@ -1,6 +1,17 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
 
+from datetime import timedelta
+
 import asyncio
+import sys
+
+try:
+    from orjson import dumps
+except ImportError:
+    import json
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 
 # Main part of the code
@@ -10,8 +21,13 @@ async def main(ssid: str):
     stream = await api.subscribe_symbol("EURUSD_otc")
 
     # This should run forever so you will need to force close the program
-    async for candle in stream:
-        print(f"Candle: {candle}")  # Each candle is in format of a dictionary
+    # Candles are read in batches of up to 64, so high frequency symbols don't need one await per candle
+    # Each candle is a dictionary, written as JSON with one write per batch instead of a print per candle
+    write = sys.stdout.buffer.write
+    while True:
+        batch = await stream.recv_batch(64, timedelta(milliseconds=50))
+        write(b"".join(b"Candle: %s\n" % dumps(candle) for candle in batch))
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
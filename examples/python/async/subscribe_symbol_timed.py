@@ -1,7 +1,6 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
 from BinaryOptionsToolsV2.tracing import start_logs
 from datetime import timedelta
-import time
 import asyncio
 
 
@@ -10,7 +9,7 @@ async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     start_logs(".", "INFO")
     api = PocketOptionAsync(ssid)
-    time.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
     stream = await api.subscribe_symbol_timed(
         "EURUSD_otc", timedelta(seconds=5)
     )  # Returns a candle obtained from combining candles that are inside a specific time range
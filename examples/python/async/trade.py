@@ -1,5 +1,4 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
-import time
 import asyncio
 
 
@@ -8,15 +7,13 @@ async def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOptionAsync(ssid)
 
-    time.sleep(5)
+    await api.wait_connected()  # Wait until connected and the assets are loaded
 
-    (buy_id, buy) = await api.buy(
-        asset="EURUSD_otc", amount=1.0, time=60, check_win=False
-    )
+    # Orders are placed one after another: a rejected order is only identified by
+    # its asset and amount, so two concurrent orders like these can't be told apart
+    (buy_id, buy) = await api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
+    (sell_id, sell) = await api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
     print(f"Buy trade id: {buy_id}\nBuy trade data: {buy}")
-    (sell_id, sell) = await api.sell(
-        asset="EURUSD_otc", amount=1.0, time=60, check_win=False
-    )
     print(f"Sell trade id: {sell_id}\nSell trade data: {sell}")
 
 
@@ -1,4 +1,3 @@
-import time
 from BinaryOptionsToolsV2.pocketoption import PocketOption
 
 
@@ -6,7 +5,7 @@ from BinaryOptionsToolsV2.pocketoption import PocketOption
 def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOption(ssid)
-    time.sleep(5)
+    api.wait_connected()  # Wait until connected and the assets are loaded
     (buy_id, _) = api.buy(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
     (sell_id, _) = api.sell(asset="EURUSD_otc", amount=1.0, time=60, check_win=False)
     print(buy_id, sell_id)
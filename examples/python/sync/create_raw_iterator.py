@@ -1,16 +1,15 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOption
 from BinaryOptionsToolsV2.validator import Validator
 from datetime import timedelta
-import time
 
 
 def main(ssid: str):
     # Initialize the API client
     api = PocketOption(ssid)
-    time.sleep(5)  # Wait for connection to establish
+    api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Create a validator for price updates
-    validator = Validator.regex(r'{"price":\d+\.\d+}')
+    validator = Validator.regex(r'\{"price":\d+\.\d+\}')
 
     # Create an iterator with 5 minute timeout
     stream = api.create_raw_iterator(
@@ -1,13 +1,12 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOption
 from BinaryOptionsToolsV2.validator import Validator
 from datetime import timedelta
-import time
 
 
 def main(ssid: str):
     # Initialize the API client
     api = PocketOption(ssid)
-    time.sleep(5)  # Wait for connection to establish
+    api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Basic raw order example
     try:
@@ -19,7 +18,7 @@ def main(ssid: str):
 
     # Raw order with timeout example
     try:
-        validator = Validator.regex(r'{"type":"signal","data":.*}')
+        validator = Validator.regex(r'\{"type":"signal","data":.*\}')
         response = api.create_raw_order_with_timout(
             '42["signals/load"]', validator, timeout=timedelta(seconds=5)
         )
@@ -1,13 +1,11 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOption
 
-import time
-
 
 # Main part of the code
 def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOption(ssid)
-    time.sleep(5)
+    api.wait_connected()  # Wait until connected and the assets are loaded
 
     balance = api.balance()
     print(f"Balance: {balance}")
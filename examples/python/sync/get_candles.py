@@ -1,14 +1,13 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOption
 
 import pandas as pd
-import time
 
 
 # Main part of the code
 def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOption(ssid)
-    time.sleep(5)
+    api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Candñes are returned in the format of a list of dictionaries
     candles = api.get_candles("EURUSD_otc", 60, 3600)
@@ -1,19 +1,18 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOption
 
 import pandas as pd
-import time
 
 
 # Main part of the code
 def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOption(ssid)
-    time.sleep(5)
+    api.wait_connected()  # Wait until connected and the assets are loaded
 
-    # Candles are returned in the format of a list of dictionaries
-    candles = api.history("EURUSD_otc", 3600)
-    print(f"Raw Candles: {candles}")
-    candles_pd = pd.DataFrame.from_dict(candles)
+    # Candles are returned as one NumPy array per column (timestamp, open, high, low, close),
+    # pandas wraps them directly instead of walking a list of dictionaries
+    candles = api.history_numpy("EURUSD_otc", 3600)
+    candles_pd = pd.DataFrame(candles, copy=False)
     print(f"Candles: {candles_pd}")
 
 
@@ -2,7 +2,7 @@
 from BinaryOptionsToolsV2.tracing import Logger, LogBuilder
 from datetime import timedelta
 
-from multiprocessing import Process
+from threading import Thread
 
 import time
 
@@ -45,7 +45,8 @@ def main():
     # Example of logging with variables
     asset = "EURUSD"
     amount = 100
-    logger.info(f"Bought {amount} units of {asset}")
+    # The message is only formatted if INFO logs are enabled
+    logger.info("Bought %s units of %s", amount, asset)
 
     # Demonstrate sync usage
     def log_sync():
@@ -57,7 +58,10 @@ def main():
         logger.info("Sync operation completed")
 
     # Run the sync function
-    task1 = Process(target=log_sync())
+    # Pass the function itself as `target`, `target=log_sync()` would run it right here and hand `None` to the thread.
+    # Threads are used instead of processes because the logger and the logs iterator live in this process
+    # (they can't be pickled), and both tasks spend their time waiting, not computing.
+    task1 = Thread(target=log_sync)
     task1.start()
 
     # Example of using LogBuilder for creating iterators
@@ -67,15 +71,19 @@ def main():
         """
 
         try:
-            for log in log_iterator:
-                print(f"Received log: {log}")
-                # Each log is a dict so we can access the message
-                print(f"Log message: {log['message']}")
+            # Logs are read in batches, the loop ends once the iterator times out
+            while True:
+                for log in log_iterator.next_batch(64):
+                    print(f"Received log: {log}")
+                    # Each log is a dict so we can access the message
+                    print(f"Log message: {log['message']}")
+        except StopIteration:
+            pass
         except Exception as e:
             print(f"Error processing logs: {e}")
 
     # Run the logs processing function
-    task2 = Process(target=process_logs(log_iterator))
+    task2 = Thread(target=process_logs, args=(log_iterator,))
     task2.start()
     # Execute both tasks at the same time
     task1.join()
@@ -1,11 +1,10 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOption
-import time
 
 
 def main(ssid: str):
     # Initialize the API client
     api = PocketOption(ssid)
-    time.sleep(5)  # Wait for connection to establish
+    api.wait_connected()  # Wait until connected and the assets are loaded
 
     # Example of sending a raw message
     try:
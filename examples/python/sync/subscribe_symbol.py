@@ -1,15 +1,23 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOption
 
+import sys
+
 
 # Main part of the code
 def main(ssid: str):
     # The api automatically detects if the 'ssid' is for real or demo account
     api = PocketOption(ssid)
-    stream = api.subscribe_symbol("EURUSD_otc")
+    # Yields lists with every candle that was already waiting (up to 64), so a burst of
+    # candles crosses from Rust in one call instead of one call per candle
+    stream = api.subscribe_symbol_batched("EURUSD_otc")
 
     # This should run forever so you will need to force close the program
-    for candle in stream:
-        print(f"Candle: {candle}")  # Each candle is in format of a dictionary
+    # Each candle is in format of a dictionary, a whole batch is written and flushed at once
+    # instead of taking the stdout lock and flushing once per candle
+    write, flush = sys.stdout.write, sys.stdout.flush
+    for batch in stream:
+        write("".join(f"Candle: {candle}\n" for candle in batch))
+        flush()
 
 
 if __name__ == "__main__":
@@ -3,18 +3,29 @@ Example script demonstrating the new connection control and raw handler features
 """
 
 import asyncio
-import json
+from itertools import islice
 from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync, PocketOption, RawHandler
 from BinaryOptionsToolsV2.validator import Validator
 
+try:
+    # orjson parses in Rust and is several times faster than the json module
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-async def test_async_connection_control():
+
+def parse(message: str):
+    """Parses a JSON payload, socket.io framed text (e.g. `42["event"]`) is returned as is."""
+    try:
+        return loads(message)
+    except ValueError:
+        return message
+
+
+async def test_async_connection_control(client: PocketOptionAsync):
     """Test async connection control methods."""
     print("=== Testing Async Connection Control ===")
     
-    ssid = "your_session_id_here"
-    client = PocketOptionAsync(ssid)
-    
     # Test disconnect and connect
     print("Disconnecting...")
     await client.disconnect()
@@ -32,13 +43,10 @@ async def test_async_connection_control():
     print("✓ Reconnected")
 
 
-async def test_async_raw_handler():
+async def test_async_raw_handler(client: PocketOptionAsync):
     """Test async raw handler functionality."""
     print("\n=== Testing Async Raw Handler ===")
     
-    ssid = "your_session_id_here"
-    client = PocketOptionAsync(ssid)
-    
     # Create a validator for balance messages
     validator = Validator.contains('"balance"')
     
@@ -50,41 +58,52 @@ async def test_async_raw_handler():
     # Send a message and wait for response
     print("Sending message and waiting for response...")
     response = await handler.send_and_wait('42["getBalance"]')
+    parsed = parse(response)
     print(f"✓ Received response: {response[:100]}...")
+    if isinstance(parsed, dict):
+        print(f"✓ Balance: {parsed.get('balance')}")
+
+    # Several requests go out in one flush, each response is picked by its own validator
+    print("Sending several messages at once...")
+    balance, payout = Validator.contains('"balance"'), Validator.contains('"payout"')
+    batch_handler = await client.create_raw_handler(Validator.any([balance, payout]))
+    messages = ['42["getBalance"]', '42["getAssets"]']
+    responses = await batch_handler.send_and_wait_many(list(zip(messages, [balance, payout])))
+    for message, response in zip(messages, responses):
+        print(f"✓ {message}: {response[:100]}...")
     
     # Subscribe to messages
     print("Subscribing to stream...")
     stream = await handler.subscribe()
     
-    # Read a few messages
-    count = 0
-    async for message in stream:
-        print(f"✓ Message {count + 1}: {message[:100]}...")
-        count += 1
-        if count >= 3:
+    # Read a few messages, awaiting the stream directly instead of wrapping it in async generators
+    next_message = stream.__anext__
+    for i in range(1, 4):
+        try:
+            message = await next_message()
+        except StopAsyncIteration:
             break
+        print(f"✓ Message {i}: {message[:100]}...")
     
     print("✓ Raw handler test completed")
 
 
-async def test_async_unsubscribe():
+async def test_async_unsubscribe(client: PocketOptionAsync):
     """Test unsubscribing from asset streams."""
     print("\n=== Testing Async Unsubscribe ===")
     
-    ssid = "your_session_id_here"
-    client = PocketOptionAsync(ssid)
-    
     # Subscribe to an asset
     print("Subscribing to EURUSD_otc...")
     subscription = await client.subscribe_symbol("EURUSD_otc")
     
     # Get a few updates
-    count = 0
-    async for candle in subscription:
-        print(f"✓ Candle {count + 1}: {candle}")
-        count += 1
-        if count >= 3:
+    next_candle = subscription.__anext__
+    for i in range(1, 4):
+        try:
+            candle = await next_candle()
+        except StopAsyncIteration:
             break
+        print(f"✓ Candle {i}: {candle}")
     
     # Unsubscribe
     print("Unsubscribing from EURUSD_otc...")
@@ -92,13 +111,10 @@ async def test_async_unsubscribe():
     print("✓ Unsubscribed")
 
 
-def test_sync_connection_control():
+def test_sync_connection_control(client: PocketOption):
     """Test sync connection control methods."""
     print("\n=== Testing Sync Connection Control ===")
     
-    ssid = "your_session_id_here"
-    client = PocketOption(ssid)
-    
     # Test disconnect and connect
     print("Disconnecting...")
     client.disconnect()
@@ -117,13 +133,10 @@ def test_sync_connection_control():
     print("✓ Reconnected")
 
 
-def test_sync_raw_handler():
+def test_sync_raw_handler(client: PocketOption):
     """Test sync raw handler functionality."""
     print("\n=== Testing Sync Raw Handler ===")
     
-    ssid = "your_session_id_here"
-    client = PocketOption(ssid)
-    
     # Create a validator
     validator = Validator.contains('"payout"')
     
@@ -135,41 +148,33 @@ def test_sync_raw_handler():
     # Send a message and wait for response
     print("Sending message and waiting for response...")
     response = handler.send_and_wait('42["getAssets"]')
+    parsed = parse(response)
     print(f"✓ Received response: {response[:100]}...")
+    if isinstance(parsed, list):
+        print(f"✓ Assets: {len(parsed)}")
     
     # Subscribe to messages
     print("Subscribing to stream...")
     stream = handler.subscribe()
     
     # Read a few messages
-    count = 0
-    for message in stream:
-        print(f"✓ Message {count + 1}: {message[:100]}...")
-        count += 1
-        if count >= 3:
-            break
+    for i, message in enumerate(islice(stream, 3), 1):
+        print(f"✓ Message {i}: {message[:100]}...")
     
     print("✓ Raw handler test completed")
 
 
-def test_sync_unsubscribe():
+def test_sync_unsubscribe(client: PocketOption):
     """Test unsubscribing from asset streams (sync)."""
     print("\n=== Testing Sync Unsubscribe ===")
     
-    ssid = "your_session_id_here"
-    client = PocketOption(ssid)
-    
     # Subscribe to an asset
     print("Subscribing to EURUSD_otc...")
     subscription = client.subscribe_symbol("EURUSD_otc")
     
     # Get a few updates
-    count = 0
-    for candle in subscription:
-        print(f"✓ Candle {count + 1}: {candle}")
-        count += 1
-        if count >= 3:
-            break
+    for i, candle in enumerate(islice(subscription, 3), 1):
+        print(f"✓ Candle {i}: {candle}")
     
     # Unsubscribe
     print("Unsubscribing from EURUSD_otc...")
@@ -179,22 +184,47 @@ def test_sync_unsubscribe():
 
 async def main():
     """Run all tests."""
+    # On python 3.12+ new tasks start running right away, ones that finish before their
+    # first real suspension point never go through the event loop queue
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     print("=" * 60)
     print("Testing New Features")
     print("=" * 60)
+
+    # Each client is created when the first test of its kind runs and shared by the
+    # following ones, so the websocket handshake and the initial account sync only happen once
+    ssid = "your_session_id_here"
+    clients = {}
+
+    async def async_client() -> PocketOptionAsync:
+        client = clients.get("async")
+        if client is None:
+            client = clients["async"] = PocketOptionAsync(ssid)
+            await client.wait_connected()
+        return client
+
+    def run_sync(test):
+        """Runs a sync test, called through `asyncio.to_thread` because the sync client blocks"""
+        client = clients.get("sync")
+        if client is None:
+            client = clients["sync"] = PocketOption(ssid)
+            client.wait_connected()
+        test(client)
     
     # Choose which tests to run
     # Comment out the ones you don't want to test
     
     # Async tests
-    # await test_async_connection_control()
-    # await test_async_raw_handler()
-    # await test_async_unsubscribe()
+    # await test_async_connection_control(await async_client())
+    # await test_async_raw_handler(await async_client())
+    # await test_async_unsubscribe(await async_client())
     
     # Sync tests
-    # test_sync_connection_control()
-    # test_sync_raw_handler()
-    # test_sync_unsubscribe()
+    # await asyncio.to_thread(run_sync, test_sync_connection_control)
+    # await asyncio.to_thread(run_sync, test_sync_raw_handler)
+    # await asyncio.to_thread(run_sync, test_sync_unsubscribe)
     
     print("\n" + "=" * 60)
     print("All tests completed!")
@@ -207,4 +237,5 @@ if __name__ == "__main__":
     print()
     
     # Uncomment to run tests
+    # PocketOptionAsync.use_uvloop()  # Runs on uvloop when it's installed
     # asyncio.run(main())
@@ -1,6 +1,39 @@
 from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
+from pathlib import Path
 import asyncio
-import os
+
+# Number of trades waiting for a response at the same time
+MAX_IN_FLIGHT = 16
+# Average number of trades placed per second, short bursts can go above it
+MAX_TRADES_PER_SECOND = 10
+# Seconds a single trade may take before its asset is recorded as not working
+PROBE_TIMEOUT = 30
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, with bursts of up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._updated) * self.rate
+                    )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
 
 
 # Function to read assets from a file
@@ -10,10 +43,9 @@ def read_assets(filename):
     return assets
 
 
-# Function to write assets to a file
-def write_asset(filename, asset):
-    with open(filename, "a") as f:
-        f.write(asset + "\n")
+# Function to write assets to a file, replacing the results of a previous run
+def write_assets(filename, assets):
+    Path(filename).write_text("".join(asset + "\n" for asset in assets))
 
 
 async def main(ssid: str):
@@ -24,37 +56,51 @@ async def main(ssid: str):
     tested_assets_file = "assets.tested.txt"
     not_working_assets_file = "not-working-assets.txt"
 
-    # Clear previous test results if files exist
-    if os.path.exists(tested_assets_file):
-        os.remove(tested_assets_file)
-    if os.path.exists(not_working_assets_file):
-        os.remove(not_working_assets_file)
-
     # Read assets from assets.txt
     assets_to_test = read_assets(assets_file)
 
-    for asset in assets_to_test:
-        print(f"Attempting to trade on asset: {asset}")
-        try:
-            # Attempt a buy trade with a small amount and short time
-            # Setting check_win to False for initial trade attempt to quickly determine if it's a valid asset
-            (trade_id, _) = await api.buy(
-                asset=asset, amount=1.0, time=15, check_win=False
-            )
-            if trade_id:
-                print(f"Trade successful for {asset}. Trade ID: {trade_id}")
-                write_asset(tested_assets_file, asset)
-                # Optionally, you might want to cancel the trade if you only want to test validity
-                # await api.cancel_trade(trade_id)
-            else:
+    # Trades are placed concurrently on the same connection, at most `MAX_IN_FLIGHT` at a time
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+    # Trades are only slowed down once they go above `MAX_TRADES_PER_SECOND`
+    limiter = TokenBucket(MAX_TRADES_PER_SECOND, MAX_TRADES_PER_SECOND)
+
+    async def probe(asset) -> bool:
+        """Returns whether a trade could be placed on `asset`"""
+        async with semaphore:
+            await limiter.acquire()
+            print(f"Attempting to trade on asset: {asset}")
+            try:
+                # Attempt a buy trade with a small amount and short time
+                # Setting check_win to False for initial trade attempt to quickly determine if it's a valid asset
+                # A probe that gets no answer fails on its own instead of holding up every other one
+                (trade_id, _) = await asyncio.wait_for(
+                    api.buy(asset=asset, amount=1.0, time=15, check_win=False),
+                    PROBE_TIMEOUT,
+                )
+                if trade_id:
+                    print(f"Trade successful for {asset}. Trade ID: {trade_id}")
+                    # Optionally, you might want to cancel the trade if you only want to test validity
+                    # await api.cancel_trade(trade_id)
+                    return True
                 print(f"Trade failed for {asset}. No trade ID returned.")
-                write_asset(not_working_assets_file, asset)
-        except Exception as e:
-            print(f"An error occurred while trading {asset}: {e}")
-            write_asset(not_working_assets_file, asset)
-        await asyncio.sleep(1)  # Add a small delay to avoid overwhelming the API
+            except Exception as e:
+                print(f"An error occurred while trading {asset}: {e}")
+            return False
+
+    # Probes finish in any order, but gather returns their results in input order,
+    # so both files keep the order of assets.txt from run to run
+    results = await asyncio.gather(*(probe(asset) for asset in assets_to_test))
+    tested_assets = [asset for asset, ok in zip(assets_to_test, results) if ok]
+    not_working_assets = [asset for asset, ok in zip(assets_to_test, results) if not ok]
+
+    # The files are written once, off the event loop
+    await asyncio.gather(
+        asyncio.to_thread(write_assets, tested_assets_file, tested_assets),
+        asyncio.to_thread(write_assets, not_working_assets_file, not_working_assets),
+    )
 
 
 if __name__ == "__main__":
     ssid = input("Please enter your ssid: ")
+    PocketOptionAsync.use_uvloop()  # Runs on uvloop when it's installed
     asyncio.run(main(ssid))